@@ -5,17 +5,23 @@ PRD v1.3.0 섹션 2 "Merge Batches"에 정의된 알고리즘을 구현합니다
 여러 배치의 언어별 파일을 병합하고 중복 KEY를 제거합니다.
 """
 
+import os
 import re
-from typing import Dict, List, Tuple, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Sequence, Tuple, Optional, Union
 from pathlib import Path
 from datetime import datetime
-from openpyxl import load_workbook, Workbook
 
 from .validator import LANGUAGE_ORDER
 
 VALID_LANGUAGES = ['EN', 'CT', 'CS', 'JA', 'TH', 'PT-BR', 'RU']
 from .error_messages import get_user_friendly_message, format_batch_duplicates
-from .excel_format import apply_split_format
+from .excel_format import write_split_rows, new_streaming_workbook, save_streaming_workbook
+from .reader import LANGUAGE_FILE_HEADERS, read_language_rows
+from .table import LanguageTable, select_all
 
 
 # 배치 폴더명 패턴 (PRD 섹션 2.2.1)
@@ -31,6 +37,10 @@ class BatchMergerError(Exception):
         super().__init__(message)
         self.error_code = error_code
 
+    def __reduce__(self):
+        # 프로세스 풀 작업자에서 발생한 오류도 error_code를 유지한 채 전달
+        return (self.__class__, (str(self), self.error_code))
+
 
 class UserCancelledError(Exception):
     """사용자 취소"""
@@ -132,14 +142,16 @@ def sort_batches(batch_names: List[str]) -> List[str]:
     return regular + [b for _, b in extras]
 
 
-def apply_status_completion(final_data: Dict[str, List[List]]) -> Dict[str, List[List]]:
+def apply_status_completion(
+    final_data: Dict[str, Union[LanguageTable, List[List]]]
+) -> Dict[str, Union[LanguageTable, List[List]]]:
     """
     Status 자동 완료 처리
 
     '번역필요', '수정' 상태를 '완료'로 변경합니다.
 
     Args:
-        final_data: {언어코드: [[헤더], [행1], [행2], ...]}
+        final_data: {언어코드: LanguageTable} 또는 {언어코드: [[헤더], [행1], [행2], ...]}
 
     Returns:
         Status 변경된 데이터
@@ -155,6 +167,11 @@ def apply_status_completion(final_data: Dict[str, List[List]]) -> Dict[str, List
     for lang_code in final_data.keys():
         rows = final_data[lang_code]
 
+        if isinstance(rows, LanguageTable):
+            # 컬럼 배열: Status 컬럼만 치환
+            rows.replace_values("Status", STATUS_MAPPING)
+            continue
+
         # 헤더 제외하고 처리
         for row_idx in range(1, len(rows)):
             row = rows[row_idx]
@@ -390,6 +407,55 @@ def validate_batch_selection(
     return True, ''
 
 
+def read_batch_file(file_path: Path, validate_header: bool = True) -> Tuple[List, List[Tuple]]:
+    """
+    배치 파일 1개 로드
+
+    Args:
+        file_path: 배치 언어 파일 경로
+        validate_header: True면 헤더 구조 검증
+
+    Returns:
+        (헤더, [(Table, KEY, Source, Target, Status, NOTE, Date), ...]) - KEY 없는 빈 행은 제외
+
+    Raises:
+        BatchMergerError: 파일 읽기 실패, 헤더 불일치 시
+
+    Reference:
+        PRD 섹션 2.4.4
+    """
+    try:
+        actual_headers, rows = read_language_rows(file_path)
+    except Exception as e:
+        raise BatchMergerError(
+            get_user_friendly_message("FILE_READ_ERROR", file=file_path.name, error=str(e)),
+            "FILE_READ_ERROR"
+        )
+
+    # 헤더 검증
+    if validate_header:
+        expected_headers = LANGUAGE_FILE_HEADERS
+
+        if actual_headers != expected_headers:
+            raise BatchMergerError(
+                get_user_friendly_message(
+                    "INVALID_HEADERS",
+                    file=file_path.name,
+                    expected=expected_headers,
+                    actual=actual_headers
+                ),
+                "INVALID_HEADERS"
+            )
+
+    # 빈 행 스킵 (KEY가 없으면 빈 행)
+    data_rows = [
+        row for row in rows  # 7개 컬럼
+        if row[1] and str(row[1]).strip()  # B열 KEY 확인
+    ]
+
+    return actual_headers, data_rows
+
+
 def merge_batches_for_language(
     language_code: str,
     selected_batches: List[str],
@@ -427,53 +493,230 @@ def merge_batches_for_language(
         batch = batch_info[batch_name]
         file_path = root_folder / batch['folder'] / batch['files'][language_code]
 
-        # 파일 로드
-        try:
-            wb = load_workbook(file_path)
-        except Exception as e:
-            raise BatchMergerError(
-                get_user_friendly_message("FILE_READ_ERROR", file=file_path.name, error=str(e)),
-                "FILE_READ_ERROR"
-            )
-
-        ws = wb.active
-
         # 헤더 검증 (첫 배치만)
+        headers, data_rows = read_batch_file(file_path, validate_header=(batch_idx == 0))
+
         if batch_idx == 0:
-            expected_headers = ['Table', 'KEY', 'Source', 'Target', 'Status', 'NOTE', 'Date']
-            actual_headers = [cell.value for cell in ws[1]]
+            # 첫 배치: 헤더 추가
+            merged_rows.append(list(headers))
 
-            if actual_headers != expected_headers:
-                raise BatchMergerError(
-                    get_user_friendly_message(
-                        "INVALID_HEADERS",
-                        file=file_path.name,
-                        expected=expected_headers,
-                        actual=actual_headers
-                    ),
-                    "INVALID_HEADERS"
+        # 데이터 추가 (이후 배치는 헤더 제외, 데이터만 추가)
+        merged_rows.extend(list(row) for row in data_rows)
+
+    return merged_rows
+
+
+def plan_batch_loads(
+    sorted_batches: List[str],
+    batch_info: Dict,
+    root_folder: Path
+) -> List[Dict]:
+    """
+    배치 파일 적재 계획 생성
+
+    (배치, 언어) 파일마다 정확히 1개의 항목을 적재 순서(기준 배치 → REGULAR → EXTRA,
+    언어는 VALID_LANGUAGES 순)대로 만듭니다.
+
+    Args:
+        sorted_batches: 정렬된 배치 목록
+        batch_info: 배치 정보
+        root_folder: 루트 폴더 경로
+
+    Returns:
+        [{'batch': 배치명, 'lang': 언어코드, 'path': 파일경로}, ...]
+    """
+    plan = []
+
+    for batch_name in sorted_batches:
+        batch = batch_info[batch_name]
+        for lang in VALID_LANGUAGES:
+            plan.append({
+                'batch': batch_name,
+                'lang': lang,
+                'path': root_folder / batch['folder'] / batch['files'][lang]
+            })
+
+    return plan
+
+
+# ProcessPoolExecutor에서 사용할 함수는 반드시 글로벌로 정의해야 함
+def _read_batch_file_task(file_path: Path) -> Tuple[List, List[Tuple], float]:
+    """
+    배치 파일 1개 로드 + 소요 시간 측정 (작업자 프로세스용)
+
+    Returns:
+        (헤더, 데이터 행, 소요 시간(초))
+    """
+    load_start = time.perf_counter()
+    headers, data_rows = read_batch_file(file_path)
+    return headers, data_rows, time.perf_counter() - load_start
+
+
+def _load_files_sequential(plan: List[Dict], progress_callback=None, cancel_check=None) -> List[Tuple]:
+    """
+    적재 계획의 파일을 현재 프로세스에서 순서대로 로드
+
+    Returns:
+        plan과 같은 순서의 [(헤더, 데이터 행, 소요 시간), ...]
+    """
+    batch_order = list(dict.fromkeys(task['batch'] for task in plan))
+    total_batches = len(batch_order)
+    load_weight = 40.0  # 40%
+
+    results = []
+    current_batch = None
+
+    for task in plan:
+        # 새 배치 시작
+        if task['batch'] != current_batch:
+            current_batch = task['batch']
+            batch_idx = batch_order.index(current_batch)
+            if progress_callback:
+                batch_start_progress = 5 + (batch_idx / total_batches) * load_weight
+                progress_callback(
+                    int(batch_start_progress),
+                    f"{current_batch} 배치 읽기 중... ({batch_idx + 1}/{total_batches})"
                 )
 
-            # 첫 배치: 헤더 추가
-            merged_rows.append(list(actual_headers))
+        # 취소 확인
+        if cancel_check and cancel_check():
+            raise UserCancelledError("사용자가 작업을 취소했습니다.")
 
-            # 데이터 추가 (빈 행 스킵)
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if len(row) >= 7 and row[1] and str(row[1]).strip():  # KEY 있는 행만
-                    merged_rows.append(list(row[:7]))
-        else:
-            # 이후 배치: 헤더 제외, 데이터만 추가 (2행부터)
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if len(row) >= 7:  # 최소 7개 컬럼 있어야 함
-                    # 빈 행 스킵 (KEY가 없으면 빈 행)
-                    if row[1] and str(row[1]).strip():  # B열 KEY 확인
-                        merged_rows.append(list(row[:7]))  # 7개 컬럼만 추출
+        results.append(_read_batch_file_task(task['path']))
 
-    return merged_rows
+    return results
+
+
+def _load_files_parallel(
+    plan: List[Dict],
+    max_workers: int,
+    progress_callback=None,
+    cancel_check=None
+) -> List[Tuple]:
+    """
+    적재 계획의 파일을 프로세스 풀에서 동시에 로드
+
+    완료 순서와 관계없이 결과는 plan 순서대로 반환합니다.
+    취소 요청 시 대기 중인 작업을 모두 취소하고 즉시 반환합니다.
+
+    Returns:
+        plan과 같은 순서의 [(헤더, 데이터 행, 소요 시간), ...]
+    """
+    total_files = len(plan)
+    load_weight = 40.0  # 40%
+    results = [None] * total_files
+    completed = 0
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        future_to_idx = {
+            executor.submit(_read_batch_file_task, task['path']): idx
+            for idx, task in enumerate(plan)
+        }
+        pending = set(future_to_idx)
+
+        while pending:
+            # 취소 확인 (대기 중인 작업 취소)
+            if cancel_check and cancel_check():
+                for future in pending:
+                    future.cancel()
+                raise UserCancelledError("사용자가 작업을 취소했습니다.")
+
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                idx = future_to_idx[future]
+                results[idx] = future.result()  # 작업자 오류는 여기서 전파됨
+                completed += 1
+
+                if progress_callback:
+                    task = plan[idx]
+                    progress_callback(
+                        int(5 + (completed / total_files) * load_weight),
+                        f"{task['batch']} {task['lang']} 파일 읽기 완료 ({completed}/{total_files})"
+                    )
+    finally:
+        # 오류/취소 시 남은 작업은 시작하지 않고 정리
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+def load_planned_batches(
+    plan: List[Dict],
+    progress_callback=None,
+    cancel_check=None,
+    max_workers: Optional[int] = 1
+) -> Tuple[Dict[str, LanguageTable], Dict[str, int], List[Dict]]:
+    """
+    적재 계획대로 배치 파일을 1회씩 로드하여 언어별로 순차 적재
+
+    max_workers가 2 이상이면 파일 로드를 프로세스 풀에서 병렬로 수행합니다.
+    적재(결합)는 항상 plan 순서(기준 배치 → REGULAR → EXTRA)를 따릅니다.
+
+    Args:
+        plan: plan_batch_loads() 결과
+        progress_callback: 진행률 콜백 함수(percent, message)
+        cancel_check: 취소 확인 함수 (returns bool)
+        max_workers: 파일 로드 작업자 수 (1이면 순차 로드, None이면 CPU 코어 수)
+
+    Returns:
+        (언어별 데이터, 배치별 행 수, 배치 처리 로그)
+        - 언어별 데이터: {언어코드: LanguageTable} (헤더는 기준 배치 파일의 헤더)
+        - 배치별 행 수: {배치명: EN 행 수}
+        - 배치 처리 로그: [{'batch': 배치명, 'languages': {언어: 행 수}, 'timings': {언어: 초}}, ...]
+
+    Raises:
+        BatchMergerError: 파일 읽기 실패, 헤더 불일치 시
+        UserCancelledError: 사용자 취소 시
+
+    Reference:
+        PRD 섹션 2.4.4
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(plan))
+
+    # 1. 파일 로드 (파일당 1회)
+    if max_workers > 1:
+        results = _load_files_parallel(plan, max_workers, progress_callback, cancel_check)
+    else:
+        results = _load_files_sequential(plan, progress_callback, cancel_check)
+
+    # 2. 적재 순서대로 결합
+    language_data = {}
+    batch_row_counts = {}
+    batch_processing = []
+    batch_proc = None
+
+    for task, (headers, data_rows, elapsed) in zip(plan, results):
+        batch_name = task['batch']
+        lang = task['lang']
+
+        if batch_proc is None or batch_proc['batch'] != batch_name:
+            batch_proc = {
+                'batch': batch_name,
+                'languages': {},
+                'timings': {}
+            }
+            batch_processing.append(batch_proc)
+
+        if lang not in language_data:
+            # 첫 배치 (기준 배치): 헤더로 초기화
+            language_data[lang] = LanguageTable(headers)
+        language_data[lang].extend_rows(data_rows)
+
+        batch_proc['languages'][lang] = len(data_rows)
+        batch_proc['timings'][lang] = elapsed
+
+        if lang == 'EN':
+            batch_row_counts[batch_name] = len(data_rows)
+
+    return language_data, batch_row_counts, batch_processing
 
 
 def find_duplicates_within_batch(
-    data_rows: List[List],
+    keys: Sequence,
     selected_batches: List[str],
     batch_row_counts: Dict[str, int]
 ) -> Dict[str, List[str]]:
@@ -481,7 +724,7 @@ def find_duplicates_within_batch(
     배치 내 중복 KEY 검출
 
     Args:
-        data_rows: 전체 데이터 행 (헤더 제외)
+        keys: 전체 KEY 컬럼 (적재 순서, 헤더 제외)
         selected_batches: 선택된 배치 목록 (정렬됨)
         batch_row_counts: {배치명: 행 수}
 
@@ -496,15 +739,12 @@ def find_duplicates_within_batch(
 
     for batch_name in selected_batches:
         row_count = batch_row_counts[batch_name]
-        batch_rows = data_rows[current_idx:current_idx + row_count]
 
         # KEY 중복 검출
         key_counts = {}
-        for row in batch_rows:
-            if len(row) >= 2:
-                key = row[1]  # B열 (KEY)
-                if key:
-                    key_counts[key] = key_counts.get(key, 0) + 1
+        for key in islice(keys, current_idx, current_idx + row_count):
+            if key:
+                key_counts[key] = key_counts.get(key, 0) + 1
 
         # 중복 KEY 추출
         duplicates = [k for k, count in key_counts.items() if count > 1]
@@ -517,6 +757,33 @@ def find_duplicates_within_batch(
     return batch_duplicates
 
 
+# Date 형식 (PRD 섹션 2.5)
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+# Date 파싱 캐시 크기 (서로 다른 Date 문자열 수 기준)
+DATE_PARSE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def _parse_date_text(date_text: str) -> Optional[datetime]:
+    """
+    Date 문자열 파싱 (캐시)
+
+    같은 Date 문자열은 한 번만 strptime으로 파싱합니다.
+    배치 단위로 Date가 반복되므로 대부분 캐시에서 처리됩니다.
+
+    Args:
+        date_text: 앞뒤 공백이 제거된 Date 문자열
+
+    Returns:
+        파싱된 datetime 객체, 형식이 잘못되면 None
+    """
+    try:
+        return datetime.strptime(date_text, DATE_FORMAT)
+    except ValueError:
+        return None
+
+
 def parse_and_validate_date(date_str: str, key: str, row_idx: int) -> datetime:
     """
     Date 문자열 파싱 및 검증
@@ -543,9 +810,8 @@ def parse_and_validate_date(date_str: str, key: str, row_idx: int) -> datetime:
         )
 
     # 2. Date 형식 파싱 (YYYY-MM-DD HH:MM)
-    try:
-        parsed_date = datetime.strptime(str(date_str).strip(), "%Y-%m-%d %H:%M")
-    except ValueError:
+    parsed_date = _parse_date_text(str(date_str).strip())
+    if parsed_date is None:
         raise BatchMergerError(
             get_user_friendly_message("DATE_FORMAT_INVALID", key=key, row=row_idx, date=date_str),
             "DATE_FORMAT_INVALID"
@@ -600,17 +866,104 @@ def select_latest_row(key: str, rows: List[Tuple[int, List]]) -> Tuple[int, List
     return (latest[0], latest[1])
 
 
-def remove_duplicate_keys(language_data: Dict[str, List[List]], selected_batches: List[str], batch_row_counts: Dict[str, int]) -> Tuple[Dict[str, List[List]], List[Dict]]:
+class DuplicateLedger:
+    """
+    중복 KEY 제거 내역 (KEY 인덱스)
+
+    KEY별 로그 항목을 dict로 관리하여 중복마다 O(1)로 갱신합니다.
+    순회/len()은 기존 duplicate_log 리스트와 동일하게 동작합니다 (최초 중복 발견 순서).
+
+    로그 항목 형식:
+        {'key': KEY, 'kept_row': 행번호, 'kept_date': Date, 'removed': [(행번호, Date), ...]}
+    """
+
+    def __init__(self):
+        self._entries = {}  # {KEY: 로그 항목}
+
+    def record(self, key, kept_row: int, kept_date, removed_row: int, removed_date) -> None:
+        """
+        중복 처리 결과 기록
+
+        Args:
+            key: KEY 값
+            kept_row: 유지된 행 번호
+            kept_date: 유지된 행의 Date
+            removed_row: 제거된 행 번호
+            removed_date: 제거된 행의 Date
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = {
+                'key': key,
+                'kept_row': kept_row,
+                'kept_date': kept_date,
+                'removed': [(removed_row, removed_date)]
+            }
+        else:
+            entry['removed'].append((removed_row, removed_date))
+            entry['kept_row'] = kept_row
+            entry['kept_date'] = kept_date
+
+    def kept(self, key) -> Optional[Tuple[int, str]]:
+        """KEY의 유지된 (행번호, Date), 중복이 없었으면 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry['kept_row'], entry['kept_date']
+
+    def removed(self, key) -> List[Tuple[int, str]]:
+        """KEY의 제거된 [(행번호, Date), ...], 중복이 없었으면 빈 리스트"""
+        entry = self._entries.get(key)
+        return list(entry['removed']) if entry else []
+
+    def removed_rows(self) -> set:
+        """제거된 모든 행 번호"""
+        return {row_idx for entry in self._entries.values() for row_idx, _ in entry['removed']}
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+
+def _keep_mask(row_count: int, rows_to_remove: set) -> bytearray:
+    """
+    행 유지 마스크 생성
+
+    Args:
+        row_count: 데이터 행 수 (헤더 제외)
+        rows_to_remove: 제거할 행 번호 (엑셀 행 번호, 데이터는 2행부터)
+
+    Returns:
+        길이 row_count의 마스크 (1 = 유지, 0 = 제거)
+    """
+    mask = bytearray(b'\x01') * row_count
+    for row_idx in rows_to_remove:
+        mask[row_idx - 2] = 0
+    return mask
+
+
+def remove_duplicate_keys(
+    language_data: Dict[str, LanguageTable],
+    selected_batches: List[str],
+    batch_row_counts: Dict[str, int]
+) -> Tuple[Dict[str, LanguageTable], DuplicateLedger]:
     """
     중복 KEY 제거 (EN 기준 통합 검증)
 
+    행을 복사하지 않고 유지 마스크로 고른 LanguageTable 뷰를 반환합니다.
+
     Args:
-        language_data: {언어코드: [[헤더], [행1], ...]}
+        language_data: {언어코드: LanguageTable}
         selected_batches: 선택된 배치 목록
         batch_row_counts: {배치명: 행 수}
 
     Returns:
-        (중복 제거된 데이터, 중복 제거 로그)
+        (중복 제거된 데이터 {언어코드: LanguageTable 뷰}, 중복 제거 로그(DuplicateLedger))
 
     Raises:
         BatchMergerError: 중복 검증 실패 시
@@ -618,13 +971,28 @@ def remove_duplicate_keys(language_data: Dict[str, List[List]], selected_batches
     Reference:
         PRD 섹션 2.4.5
     """
-    # 1. EN 파일에서 처리
-    en_rows = language_data['EN']
-    en_header = en_rows[0]
-    en_data_rows = en_rows[1:]  # 헤더 제외
+    # 0. 언어별 행 수 검증 (적재 직후 테이블 길이로 한 번에 확인)
+    en_table = language_data['EN']
+    en_count = len(en_table)
+    for lang in ['CT', 'CS', 'JA', 'TH', 'PT-BR', 'RU']:
+        lang_count = len(language_data[lang])
+        if lang_count != en_count:
+            raise BatchMergerError(
+                get_user_friendly_message(
+                    "LANGUAGE_ROW_COUNT_MISMATCH",
+                    lang=lang,
+                    en_count=en_count,
+                    lang_count=lang_count
+                ),
+                "LANGUAGE_ROW_COUNT_MISMATCH"
+            )
+
+    # 1. EN 파일에서 처리 (KEY/Date 컬럼만 사용)
+    en_keys = en_table.column('KEY')
+    en_dates = en_table.column('Date')
 
     # 2. 배치 내 중복 검출 (오류)
-    batch_duplicates = find_duplicates_within_batch(en_data_rows, selected_batches, batch_row_counts)
+    batch_duplicates = find_duplicates_within_batch(en_keys, selected_batches, batch_row_counts)
     if batch_duplicates:
         raise BatchMergerError(
             get_user_friendly_message(
@@ -636,28 +1004,24 @@ def remove_duplicate_keys(language_data: Dict[str, List[List]], selected_batches
         )
 
     # 3. 순차 스캔하여 중복 검출 및 제거 (순차 적재 순서 유지)
-    seen_keys = {}  # {KEY: (행_인덱스, 행_데이터, Date)}
+    seen_keys = {}  # {KEY: (행_인덱스, Date, 파싱된 Date)}
     rows_to_remove = set()  # 제거할 행 인덱스
-    duplicate_log = []
+    duplicate_log = DuplicateLedger()
 
-    for row_idx, row in enumerate(en_data_rows, start=2):
-        if len(row) < 2:
-            continue
-
-        key = row[1]  # B열 (KEY)
+    for row_idx, (key, curr_date) in enumerate(zip(en_keys, en_dates), start=2):
         if not key:
             continue
 
         if key not in seen_keys:
-            # 첫 등장: 기록
-            seen_keys[key] = (row_idx, row, row[6])
+            # 첫 등장: 기록 (Date는 중복 발견 시에만 파싱)
+            seen_keys[key] = (row_idx, curr_date, None)
         else:
             # 중복 발견: Date 비교
-            prev_row_idx, prev_row, prev_date = seen_keys[key]
-            curr_date = row[6]
+            prev_row_idx, prev_date, prev_parsed = seen_keys[key]
 
-            # Date 파싱 및 비교
-            prev_parsed = parse_and_validate_date(prev_date, key, prev_row_idx)
+            # Date 파싱 및 비교 (이전 행은 이미 파싱했으면 재사용)
+            if prev_parsed is None:
+                prev_parsed = parse_and_validate_date(prev_date, key, prev_row_idx)
             curr_parsed = parse_and_validate_date(curr_date, key, row_idx)
 
             if prev_parsed == curr_parsed:
@@ -673,88 +1037,73 @@ def remove_duplicate_keys(language_data: Dict[str, List[List]], selected_batches
                 rows_to_remove.add(prev_row_idx)
 
                 # 로그 갱신
-                existing_log = next((l for l in duplicate_log if l['key'] == key), None)
-                if existing_log:
-                    existing_log['removed'].append((prev_row_idx, prev_date))
-                    existing_log['kept_row'] = row_idx
-                    existing_log['kept_date'] = curr_date
-                else:
-                    duplicate_log.append({
-                        'key': key,
-                        'kept_row': row_idx,
-                        'kept_date': curr_date,
-                        'removed': [(prev_row_idx, prev_date)]
-                    })
-
-                seen_keys[key] = (row_idx, row, curr_date)
+                duplicate_log.record(key, row_idx, curr_date, prev_row_idx, prev_date)
+
+                seen_keys[key] = (row_idx, curr_date, curr_parsed)
             else:
                 # 이전 행이 더 최신: 현재 행 제거, 이전 행 유지
                 rows_to_remove.add(row_idx)
+                seen_keys[key] = (prev_row_idx, prev_date, prev_parsed)
 
                 # 로그 갱신
-                existing_log = next((l for l in duplicate_log if l['key'] == key), None)
-                if existing_log:
-                    existing_log['removed'].append((row_idx, curr_date))
-                else:
-                    duplicate_log.append({
-                        'key': key,
-                        'kept_row': prev_row_idx,
-                        'kept_date': prev_date,
-                        'removed': [(row_idx, curr_date)]
-                    })
-
-    # 4. 제거할 행 제외하고 최종 행 생성 (순차 적재 순서 그대로 유지)
-    final_en_rows = [en_header]
-    for row_idx, row in enumerate(en_data_rows, start=2):
-        if row_idx not in rows_to_remove:
-            final_en_rows.append(row)
-
-    # 5. 다른 언어도 동일하게 중복 제거 (EN과 동일한 행만 제거)
-    final_data = {'EN': final_en_rows}
+                duplicate_log.record(key, prev_row_idx, prev_date, row_idx, curr_date)
 
-    for lang in ['CT', 'CS', 'JA', 'TH', 'PT-BR', 'RU']:
-        lang_header = language_data[lang][0]
-        lang_data_rows = language_data[lang][1:]
+    # 4. EN 기준 keep 마스크를 7개 언어에 한 번에 적용 (순차 적재 순서 유지, 행 복사 없음)
+    keep_mask = _keep_mask(en_count, rows_to_remove)
+    final_data = select_all({lang: language_data[lang] for lang in VALID_LANGUAGES}, keep_mask)
 
-        # EN에서 제거된 행 인덱스와 동일한 인덱스의 행 제거
-        lang_final_rows = [lang_header]
-        for row_idx, row in enumerate(lang_data_rows, start=2):
-            if row_idx not in rows_to_remove:
-                lang_final_rows.append(row)
+    return final_data, duplicate_log
 
-        final_data[lang] = lang_final_rows
 
-        # 언어별 행 수 검증
-        lang_count = len(lang_final_rows) - 1
-        en_count = len(final_en_rows) - 1
-        if lang_count != en_count:
-            raise BatchMergerError(
-                get_user_friendly_message(
-                    "LANGUAGE_ROW_COUNT_MISMATCH",
-                    lang=lang,
-                    en_count=en_count,
-                    lang_count=lang_count
-                ),
-                "LANGUAGE_ROW_COUNT_MISMATCH"
-            )
+# ProcessPoolExecutor에서 사용할 함수는 반드시 글로벌로 정의해야 함
+def _save_language_file_task(table: LanguageTable, output_path: Path) -> str:
+    """
+    언어별 최종 파일 1개 생성 + 저장 (작업자 프로세스용)
+
+    Returns:
+        저장된 파일 경로
+    """
+    wb, ws = new_streaming_workbook("Sheet1")
+
+    # 헤더 + 데이터 행 작성 (서식은 Split과 동일)
+    write_split_rows(ws, table.headers, table.iter_rows())
+
+    save_streaming_workbook(wb, output_path)
+    return str(output_path)
 
-    return final_data, duplicate_log
+
+def _save_failed_error(lang: str, output_path: Path, error: Exception, saved_files: Dict[str, str]) -> BatchMergerError:
+    """저장 실패 오류 생성 (성공 파일은 유지하고 목록만 안내)"""
+    saved_list = ', '.join(saved_files.keys()) if saved_files else '없음'
+    return BatchMergerError(
+        f"{lang} 파일 저장에 실패했습니다.\n\n"
+        f"경로: {output_path}\n"
+        f"오류: {error}\n\n"
+        f"디스크 공간이나 권한을 확인해주세요.\n"
+        f"이미 저장된 파일: {saved_list}",
+        "FILE_WRITE_ERROR"
+    )
 
 
 def save_merged_batches(
-    final_data: Dict[str, List[List]],
+    final_data: Dict[str, LanguageTable],
     output_folder: Path,
     date_prefix: str,
-    overwrite_callback=None
+    overwrite_callback=None,
+    max_workers: Optional[int] = None
 ) -> Dict[str, str]:
     """
     최종 병합 데이터 저장
 
+    max_workers가 2 이상이면 언어별 파일을 프로세스 풀에서 병렬로 저장합니다
+    (작업자 1개당 워크북 1개). 덮어쓰기 확인은 작업자 시작 전에 끝납니다.
+
     Args:
-        final_data: 언어별 최종 데이터
+        final_data: 언어별 최종 데이터 {언어코드: LanguageTable}
         output_folder: 출력 폴더 경로
         date_prefix: 파일명 날짜 (YYMMDD)
         overwrite_callback: 덮어쓰기 확인 콜백
+        max_workers: 저장 작업자 수 (1이면 순차 저장, None이면 CPU 코어 수)
 
     Returns:
         {언어코드: 파일경로}
@@ -788,37 +1137,41 @@ def save_merged_batches(
             raise UserCancelledError("사용자가 작업을 취소했습니다.")
 
     # 3. 파일 저장
-    saved_files = {}
+    output_paths = {lang: output_folder / f"{date_prefix}_{lang}.xlsx" for lang in VALID_LANGUAGES}
 
-    for lang in VALID_LANGUAGES:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Sheet1"
-
-        # 데이터 작성
-        for row in final_data[lang]:
-            ws.append(row)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(VALID_LANGUAGES))
 
-        # 서식 적용 (Split과 동일)
-        apply_split_format(ws)
+    saved_files = {}
 
-        # 저장
-        output_path = output_folder / f"{date_prefix}_{lang}.xlsx"
+    if max_workers <= 1:
+        for lang in VALID_LANGUAGES:
+            try:
+                saved_files[lang] = _save_language_file_task(final_data[lang], output_paths[lang])
+            except Exception as e:
+                # 저장 실패 시: 성공 파일 유지, 실패 메시지만
+                raise _save_failed_error(lang, output_paths[lang], e, saved_files)
+
+        return saved_files
+
+    # 병렬 저장: 뷰는 선택된 행만 담아 전달
+    errors = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            lang: executor.submit(_save_language_file_task, final_data[lang].compact(), output_paths[lang])
+            for lang in VALID_LANGUAGES
+        }
+        for lang, future in futures.items():
+            try:
+                saved_files[lang] = future.result()
+            except Exception as e:
+                errors[lang] = e
 
-        try:
-            wb.save(output_path)
-            saved_files[lang] = str(output_path)
-        except Exception as e:
-            # 저장 실패 시: 성공 파일 유지, 실패 메시지만
-            saved_list = ', '.join(saved_files.keys()) if saved_files else '없음'
-            raise BatchMergerError(
-                f"{lang} 파일 저장에 실패했습니다.\n\n"
-                f"경로: {output_path}\n"
-                f"오류: {e}\n\n"
-                f"디스크 공간이나 권한을 확인해주세요.\n"
-                f"이미 저장된 파일: {saved_list}",
-                "FILE_WRITE_ERROR"
-            )
+    if errors:
+        # 저장 실패 시: 성공 파일 유지, 첫 번째 실패 언어 기준으로 메시지
+        lang = next(lang for lang in VALID_LANGUAGES if lang in errors)
+        raise _save_failed_error(lang, output_paths[lang], errors[lang], saved_files)
 
     return saved_files
 
@@ -859,8 +1212,20 @@ def generate_merge_batches_log(log_info: Dict, output_folder: Path) -> Path:
     # 배치별 처리 내역
     for idx, batch_proc in enumerate(log_info['batch_processing'], start=1):
         lines.append(f"[{idx}/{len(log_info['selected_batches'])}] {batch_proc['batch']} 배치 처리 중...")
+        timings = batch_proc.get('timings', {})
         for lang, row_count in batch_proc['languages'].items():
-            lines.append(f"  - {lang}: {row_count:,}행 {'읽기' if idx == 1 else '적재'} 완료")
+            line = f"  - {lang}: {row_count:,}행 {'읽기' if idx == 1 else '적재'} 완료"
+            if lang in timings:
+                line += f" ({timings[lang]:.2f}초)"
+            lines.append(line)
+        lines.append("")
+
+    # 파일 로드 요약 (배치 x 언어 파일당 1회)
+    load_timings = [t for proc in log_info['batch_processing'] for t in proc.get('timings', {}).values()]
+    if load_timings:
+        lines.append("[파일 로드]")
+        lines.append(f"  총 파일 로드: {len(load_timings)}회")
+        lines.append(f"  로드 소요 시간: {sum(load_timings):.2f}초")
         lines.append("")
 
     # 중복 KEY 제거 내역
@@ -888,7 +1253,7 @@ def generate_merge_batches_log(log_info: Dict, output_folder: Path) -> Path:
     # 출력 파일
     lines.append("[출력 파일]")
     for lang, path in log_info['output_files'].items():
-        row_count = len(log_info['final_data'][lang]) - 1  # 헤더 제외
+        row_count = len(log_info['final_data'][lang])  # 헤더 제외
         lines.append(f"  - {path} ({row_count:,}행)")
     lines.append("")
 
@@ -918,7 +1283,9 @@ def merge_batches(
     progress_callback=None,
     cancel_check=None,
     overwrite_callback=None,
-    apply_status_auto_complete=True  # Sebastian 추가: 체크박스 기능 (기본값 True로 레거시 호환)
+    apply_status_auto_complete=True,  # Sebastian 추가: 체크박스 기능 (기본값 True로 레거시 호환)
+    load_workers: Optional[int] = None,
+    save_workers: Optional[int] = None
 ) -> Tuple[Dict[str, str], Path]:
     """
     배치 병합 메인 함수
@@ -931,6 +1298,9 @@ def merge_batches(
         progress_callback: 진행률 콜백 함수(percent, message)
         cancel_check: 취소 확인 함수 (returns bool)
         overwrite_callback: 덮어쓰기 확인 함수 (returns bool)
+        apply_status_auto_complete: True면 '번역필요'/'수정' → '완료' 처리
+        load_workers: 파일 로드 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 로드)
+        save_workers: 파일 저장 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 저장)
 
     Returns:
         (출력 파일 경로 딕셔너리, 로그 파일 경로)
@@ -965,55 +1335,12 @@ def merge_batches(
         if progress_callback:
             progress_callback(5, "배치 스캔 완료")
 
-        # Step 3: 언어별 데이터 순차 적재
-        language_data = {}
-        batch_row_counts = {}
-
-        total_batches = len(sorted_batches)
-        load_weight = 40.0  # 40%
-
-        for batch_idx, batch_name in enumerate(sorted_batches):
-            batch_start_progress = 5 + (batch_idx / total_batches) * load_weight
-
-            if progress_callback:
-                progress_callback(
-                    int(batch_start_progress),
-                    f"{batch_name} 배치 읽기 중... ({batch_idx + 1}/{total_batches})"
-                )
-
-            # 배치 처리 로그
-            batch_proc = {
-                'batch': batch_name,
-                'languages': {}
-            }
-
-            # 첫 배치 처리하여 행 수 파악
-            first_lang_data = merge_batches_for_language(
-                'EN', [batch_name], {batch_name: batch_info[batch_name]}, root_folder, cancel_check
-            )
-
-            if batch_idx == 0:
-                # 첫 배치 (기준 배치): 데이터 초기화
-                for lang in VALID_LANGUAGES:
-                    language_data[lang] = merge_batches_for_language(
-                        lang, [batch_name], {batch_name: batch_info[batch_name]}, root_folder, cancel_check
-                    )
-                    batch_proc['languages'][lang] = len(language_data[lang]) - 1  # 헤더 제외
-
-                batch_row_counts[batch_name] = len(language_data['EN']) - 1
-            else:
-                # 이후 배치: 데이터 적재
-                for lang in VALID_LANGUAGES:
-                    new_data = merge_batches_for_language(
-                        lang, [batch_name], {batch_name: batch_info[batch_name]}, root_folder, cancel_check
-                    )
-                    # 헤더 제외하고 기존 데이터에 추가
-                    language_data[lang].extend(new_data[1:])
-                    batch_proc['languages'][lang] = len(new_data) - 1
-
-                batch_row_counts[batch_name] = len(new_data) - 1
-
-            log_info['batch_processing'].append(batch_proc)
+        # Step 3: 언어별 데이터 순차 적재 (배치 x 언어 파일을 각 1회씩 병렬 로드)
+        load_plan = plan_batch_loads(sorted_batches, batch_info, root_folder)
+        language_data, batch_row_counts, batch_processing = load_planned_batches(
+            load_plan, progress_callback, cancel_check, max_workers=load_workers
+        )
+        log_info['batch_processing'] = batch_processing
 
         if progress_callback:
             progress_callback(45, "모든 배치 읽기 완료")
@@ -1045,8 +1372,8 @@ def merge_batches(
                 progress_callback(80, "Status 자동 완료 건너뜀")
 
         # 최종 통계
-        total_rows = sum(len(data) - 1 for data in language_data.values()) // 7  # 헤더 제외, 언어 평균
-        final_rows = len(final_data['EN']) - 1
+        total_rows = sum(len(table) for table in language_data.values()) // 7  # 헤더 제외, 언어 평균
+        final_rows = len(final_data['EN'])
         duplicates_removed = len(duplicate_log)
 
         log_info['final_stats'] = {
@@ -1062,7 +1389,9 @@ def merge_batches(
         output_date = datetime.now().strftime("%y%m%d")
         output_dir = root_folder / "Output"
 
-        saved_files = save_merged_batches(final_data, output_dir, output_date, overwrite_callback)
+        saved_files = save_merged_batches(
+            final_data, output_dir, output_date, overwrite_callback, max_workers=save_workers
+        )
 
         log_info['output_files'] = saved_files
 
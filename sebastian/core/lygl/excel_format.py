@@ -4,12 +4,53 @@ Excel 서식 적용 모듈
 PRD 섹션 2.1.4 "Excel Format Specification"에 정의된 서식을 적용합니다.
 """
 
-from typing import Optional
+from copy import copy
+from typing import Iterable, Optional, Sequence
+from openpyxl import Workbook
+from openpyxl.cell import Cell
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 
 
+# Split 파일 열 너비 (MS Excel 기준 원본 파일과 동일)
+SPLIT_COLUMN_WIDTHS = {
+    "A": 25,  # Table
+    "B": 40,  # KEY
+    "C": 60,  # Source
+    "D": 60,  # Target (MS Excel 확인: 60)
+    "E": 12,  # Status
+    "F": 30,  # NOTE
+    "G": 20,  # Date
+}
+
+
+def _excel_header_style():
+    """표준 서식 헤더 (Font, Alignment, Fill)"""
+    return (
+        Font(name="Calibri", size=11, color="000000"),
+        Alignment(horizontal="general", vertical="center", wrap_text=True),
+        PatternFill(start_color="DBEEF4", end_color="DBEEF4", fill_type="solid"),
+    )
+
+
+def _excel_data_style():
+    """표준 서식 데이터 (Font, Alignment)"""
+    return (
+        Font(name="Calibri", size=11, color="000000"),
+        Alignment(horizontal="general", vertical="center", wrap_text=True),
+    )
+
+
+def _split_style():
+    """Split 서식 (Font, Alignment) - 수평 정렬은 None(기본값), 수직은 center, 줄바꿈 True"""
+    return (
+        Font(name="Calibri", size=11, color="000000"),
+        Alignment(horizontal=None, vertical="center", wrap_text=True),
+    )
+
+
 def apply_excel_format(worksheet: Worksheet, is_merged: bool = True) -> None:
     """
     Excel 워크시트에 표준 서식 적용
@@ -61,13 +102,7 @@ def apply_excel_format(worksheet: Worksheet, is_merged: bool = True) -> None:
             worksheet.row_dimensions[row].height = 30  # 데이터
 
     # 3. 헤더 서식 (1행)
-    header_fill = PatternFill(
-        start_color="DBEEF4", end_color="DBEEF4", fill_type="solid"
-    )
-    header_font = Font(name="Calibri", size=11, color="000000")
-    header_alignment = Alignment(
-        horizontal="general", vertical="center", wrap_text=True
-    )
+    header_font, header_alignment, header_fill = _excel_header_style()
 
     num_cols = 13 if is_merged else 7
     for col_idx in range(1, num_cols + 1):
@@ -77,8 +112,7 @@ def apply_excel_format(worksheet: Worksheet, is_merged: bool = True) -> None:
         cell.alignment = header_alignment
 
     # 4. 데이터 서식 (2행 이상)
-    data_font = Font(name="Calibri", size=11, color="000000")
-    data_alignment = Alignment(horizontal="general", vertical="center", wrap_text=True)
+    data_font, data_alignment = _excel_data_style()
 
     for row_idx in range(2, worksheet.max_row + 1):
         for col_idx in range(1, num_cols + 1):
@@ -116,17 +150,7 @@ def apply_split_format(worksheet: Worksheet) -> None:
         원본 파일: .claude/docs/Tables by Language/251104_EN.xlsx
     """
     # 1. 열 너비 설정 (MS Excel 기준 원본 파일과 동일)
-    widths = {
-        "A": 25,  # Table
-        "B": 40,  # KEY
-        "C": 60,  # Source
-        "D": 60,  # Target (MS Excel 확인: 60)
-        "E": 12,  # Status
-        "F": 30,  # NOTE
-        "G": 20,  # Date
-    }
-
-    for col, width in widths.items():
+    for col, width in SPLIT_COLUMN_WIDTHS.items():
         worksheet.column_dimensions[col].width = width
 
     # 2. 행 높이 설정 (원본과 동일)
@@ -139,9 +163,8 @@ def apply_split_format(worksheet: Worksheet) -> None:
             worksheet.row_dimensions[row].height = 30
 
     # 3. 폰트 및 정렬 (원본과 동일)
-    font = Font(name="Calibri", size=11, color="000000")
     # 수평 정렬은 None(기본값), 수직 정렬은 center, 줄바꿈 True
-    alignment = Alignment(horizontal=None, vertical="center", wrap_text=True)
+    font, alignment = _split_style()
 
     # 모든 셀에 폰트와 정렬 적용
     for row_idx in range(1, worksheet.max_row + 1):
@@ -159,6 +182,262 @@ def apply_split_format(worksheet: Worksheet) -> None:
         worksheet.auto_filter.ref = f"A1:G{last_row}"
 
 
+def register_cell_style(
+    worksheet: Worksheet,
+    font: Optional[Font],
+    alignment: Alignment,
+    fill: Optional[PatternFill] = None
+):
+    """
+    셀 서식을 워크북에 한 번만 등록하고 StyleArray 반환
+
+    반환된 StyleArray를 복사해 셀에 지정하면 셀마다 Font/Alignment를 다시 등록하지 않습니다.
+    (openpyxl copy_worksheet와 같은 방식)
+
+    Args:
+        worksheet: 서식을 등록할 워크시트
+        font: 글꼴 (None이면 기본 글꼴 유지)
+        alignment: 정렬
+        fill: 배경색 (None이면 지정하지 않음)
+    """
+    template = Cell(worksheet)
+    if font is not None:
+        template.font = font
+    template.alignment = alignment
+    if fill is not None:
+        template.fill = fill
+    return template._style
+
+
+def append_styled_cells(worksheet, values: Sequence, styles: Sequence) -> None:
+    """
+    셀마다 서식을 지정해 1행 추가
+
+    Args:
+        worksheet: openpyxl Worksheet 또는 WriteOnlyWorksheet 객체
+        values: 행 값
+        styles: 값과 같은 순서의 register_cell_style() 결과 (None이면 서식 없음)
+    """
+    cells = []
+    for col_idx, (value, style) in enumerate(zip(values, styles), start=1):
+        cell = Cell(worksheet, row=1, column=col_idx, value=value)  # 행/열은 append 시 지정됨
+        if style is not None:
+            cell._style = copy(style)
+        cells.append(cell)
+
+    worksheet.append(cells)
+
+
+def _append_styled_row(worksheet, row: Sequence, style, width: int) -> None:
+    """
+    서식이 지정된 셀로 1행 추가
+
+    Args:
+        worksheet: openpyxl Worksheet 또는 WriteOnlyWorksheet 객체
+        row: 행 값 (width보다 짧으면 나머지 셀은 빈 셀로 서식만 적용)
+        style: register_cell_style() 결과
+        width: 서식을 적용할 컬럼 수
+    """
+    values = list(row)
+    values.extend([None] * (width - len(values)))
+
+    styles = [style] * width + [None] * (len(values) - width)
+    append_styled_cells(worksheet, values, styles)
+
+
+class StyledSheetWriter:
+    """
+    서식이 지정된 행을 1행씩 추가하는 시트 작성기
+
+    여러 시트에 동시에 행을 나눠 쓸 때 사용합니다 (Split 단일 스캔).
+    write_only 워크시트는 행을 추가하는 즉시 파일로 내보내므로,
+    행 높이도 해당 행을 추가하기 직전에 지정하고 추가 후 바로 제거합니다 (메모리 일정 유지).
+    """
+
+    def __init__(
+        self,
+        worksheet,
+        header: Sequence,
+        header_style,
+        data_style,
+        width: int,
+        header_height: Optional[float],
+        data_height: float,
+        filter_last_col: str
+    ):
+        self.worksheet = worksheet
+        self.data_style = data_style
+        self.width = width
+        self.data_height = data_height
+        self.filter_last_col = filter_last_col
+        self._streaming = isinstance(worksheet, WriteOnlyWorksheet)
+        self.last_row = 0
+
+        self._append(header, header_style, header_height)
+
+    def _append(self, row: Sequence, style, height: Optional[float]) -> None:
+        self.last_row += 1
+        row_dimensions = self.worksheet.row_dimensions
+        if height is not None:
+            row_dimensions[self.last_row].height = height
+        _append_styled_row(self.worksheet, row, style, self.width)
+        if self._streaming:
+            row_dimensions.pop(self.last_row, None)
+
+    def append(self, row: Sequence) -> None:
+        """데이터 1행 추가"""
+        self._append(row, self.data_style, self.data_height)
+
+    def close(self) -> None:
+        """자동 필터 범위 지정 (마지막 행 기준)"""
+        self.worksheet.auto_filter.ref = f"A1:{self.filter_last_col}{self.last_row}"
+
+
+def excel_sheet_writer(worksheet, header: Sequence, is_merged: bool = True) -> StyledSheetWriter:
+    """
+    표준 서식(apply_excel_format과 동일) 시트 작성기 생성
+
+    Args:
+        worksheet: 빈 openpyxl Worksheet 또는 WriteOnlyWorksheet 객체
+        header: 헤더 행
+        is_merged: True면 병합 파일 형식(13컬럼), False면 언어별 파일 형식(7컬럼)
+    """
+    num_cols = 13 if is_merged else 7
+
+    # 열 너비/틀 고정은 행보다 먼저 지정 (write_only는 첫 행 추가 시 내보냄)
+    for col, width in get_column_widths(is_merged).items():
+        worksheet.column_dimensions[col].width = width
+    worksheet.freeze_panes = "A2"
+
+    return StyledSheetWriter(
+        worksheet,
+        header,
+        register_cell_style(worksheet, *_excel_header_style()),
+        register_cell_style(worksheet, *_excel_data_style()),
+        num_cols,
+        header_height=16.5,
+        data_height=30,
+        filter_last_col=get_column_letter(num_cols),
+    )
+
+
+def split_sheet_writer(worksheet, header: Sequence) -> StyledSheetWriter:
+    """
+    Split 서식(apply_split_format과 동일) 시트 작성기 생성
+
+    Args:
+        worksheet: 빈 openpyxl Worksheet 또는 WriteOnlyWorksheet 객체
+        header: 헤더 행
+    """
+    for col, width in SPLIT_COLUMN_WIDTHS.items():
+        worksheet.column_dimensions[col].width = width
+
+    style = register_cell_style(worksheet, *_split_style())
+    return StyledSheetWriter(
+        worksheet,
+        header,
+        style,
+        style,
+        7,
+        header_height=None,  # 헤더 높이는 기본값 유지
+        data_height=30,
+        filter_last_col="G",
+    )
+
+
+def write_excel_rows(
+    worksheet,
+    header: Sequence,
+    rows: Iterable[Sequence],
+    is_merged: bool = True
+) -> None:
+    """
+    헤더와 데이터 행을 서식이 지정된 셀로 작성 (apply_excel_format과 동일한 결과)
+
+    서식은 워크북에 한 번만 등록하고 셀 작성 시 함께 지정하므로,
+    작성 후 모든 셀을 다시 순회하지 않습니다.
+    write_only 워크시트(new_streaming_workbook)도 지원합니다.
+
+    Args:
+        worksheet: 빈 openpyxl Worksheet 또는 WriteOnlyWorksheet 객체
+        header: 헤더 행
+        rows: 데이터 행 목록
+        is_merged: True면 병합 파일 형식(13컬럼), False면 언어별 파일 형식(7컬럼)
+
+    Reference:
+        PRD 섹션 2.1.4 "Excel Format Specification"
+    """
+    writer = excel_sheet_writer(worksheet, header, is_merged)
+    for row in rows:
+        writer.append(row)
+    writer.close()
+
+
+def write_split_rows(worksheet, header: Sequence, rows: Iterable[Sequence]) -> None:
+    """
+    헤더와 데이터 행을 서식이 지정된 셀로 작성 (apply_split_format과 동일한 결과)
+
+    Args:
+        worksheet: 빈 openpyxl Worksheet 또는 WriteOnlyWorksheet 객체
+        header: 헤더 행
+        rows: 데이터 행 목록
+    """
+    writer = split_sheet_writer(worksheet, header)
+    for row in rows:
+        writer.append(row)
+    writer.close()
+
+
+def new_streaming_workbook(title: str = "Sheet1"):
+    """
+    write_only 모드 워크북 + 시트 생성
+
+    추가된 행은 즉시 임시 파일로 내보내지므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+    저장(save)은 한 번만 가능합니다.
+
+    Args:
+        title: 시트명 (기본: 'Sheet1', MS Excel 기본값)
+
+    Returns:
+        (Workbook, WriteOnlyWorksheet)
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title)
+    return workbook, worksheet
+
+
+def save_streaming_workbook(workbook, output_path) -> None:
+    """
+    write_only 워크북 저장
+
+    저장에 실패하면 열려 있는 시트 스트림(임시 파일)을 정리한 뒤 예외를 다시 발생시킵니다.
+
+    Args:
+        workbook: new_streaming_workbook()으로 만든 Workbook
+        output_path: 저장 경로
+
+    Raises:
+        Exception: 저장 실패 시 원래 예외
+    """
+    try:
+        workbook.save(output_path)
+    except Exception:
+        discard_streaming_workbook(workbook)
+        raise
+
+
+def discard_streaming_workbook(workbook) -> None:
+    """
+    저장하지 않을 write_only 워크북의 시트 스트림(임시 파일) 정리
+
+    Args:
+        workbook: new_streaming_workbook()으로 만든 Workbook
+    """
+    for worksheet in workbook.worksheets:
+        if not worksheet.closed:
+            worksheet.close()
+
+
 def get_column_widths(is_merged: bool = True) -> dict:
     """
     컬럼 너비 매핑 반환
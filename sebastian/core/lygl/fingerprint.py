@@ -0,0 +1,147 @@
+"""
+파일 지문 모듈
+
+Legacy Diff에서 변경되지 않은 파일을 다시 읽지 않도록 파일 지문을 계산/보관합니다.
+
+- 내용 해시: 파일 바이트 전체의 SHA-256 (바이트가 같으면 비교 생략)
+- Target 해시: "기존" 행의 KEY별 Target 해시 (해시가 다른 KEY만 비교)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 캐시 파일 형식 버전 (형식이 바뀌면 기존 캐시는 무시)
+FINGERPRINT_VERSION = 1
+
+# 캐시에 보관할 최대 파일 수 (비교1/비교2 폴더 7개 언어씩)
+MAX_CACHED_FILES = 14 * 2
+
+# 내용 해시 계산 시 한 번에 읽는 크기
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_content_hash(file_path: Path) -> str:
+    """
+    파일 내용 해시 (SHA-256 hex)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        64자리 hex 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def target_digests(baseline_rows: Dict[str, Tuple]) -> Dict[str, str]:
+    """
+    KEY별 Target 해시
+
+    JSON 캐시에 그대로 저장할 수 있도록 KEY는 repr() 문자열로 변환합니다.
+    (숫자 KEY 1과 문자열 KEY '1'을 구분)
+
+    Args:
+        baseline_rows: {KEY: (Source, Target)}
+
+    Returns:
+        {repr(KEY): Target 해시 (16자리 hex)}
+    """
+    return {
+        repr(key): hashlib.blake2b(repr(target).encode('utf-8'), digest_size=8).hexdigest()
+        for key, (source, target) in baseline_rows.items()
+    }
+
+
+def changed_target_keys(digests1: Dict[str, str], digests2: Dict[str, str]) -> Set[str]:
+    """
+    양쪽에 모두 있고 Target 해시가 다른 KEY (repr 문자열)
+
+    Args:
+        digests1: 비교1 target_digests() 결과
+        digests2: 비교2 target_digests() 결과
+
+    Returns:
+        repr(KEY) 집합
+    """
+    return {
+        key for key in digests1.keys() & digests2.keys()
+        if digests1[key] != digests2[key]
+    }
+
+
+class FingerprintCache:
+    """
+    파일 지문 캐시 (내용 해시 → KEY별 Target 해시)
+
+    캐시 폴더에 파일마다 `<내용 해시>.json.gz`로 저장합니다.
+    캐시 읽기/쓰기 실패는 경고만 남기고 무시합니다 (캐시가 없을 때와 동일하게 동작).
+    """
+
+    def __init__(self, cache_dir: Path, max_files: int = MAX_CACHED_FILES):
+        self.cache_dir = Path(cache_dir)
+        self.max_files = max_files
+
+    def _path(self, content_hash: str) -> Path:
+        return self.cache_dir / f"{content_hash}.json.gz"
+
+    def get(self, content_hash: str) -> Optional[Dict[str, str]]:
+        """
+        저장된 KEY별 Target 해시 반환
+
+        Returns:
+            {repr(KEY): Target 해시} (없거나 읽을 수 없으면 None)
+        """
+        path = self._path(content_hash)
+        if not path.exists():
+            return None
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+            os.utime(path)  # 최근 사용 표시 (prune 기준)
+        except (OSError, ValueError) as e:
+            logger.warning(f"지문 캐시 읽기 실패 (무시): {path} - {e}")
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != FINGERPRINT_VERSION:
+            return None
+
+        return data.get('targets')
+
+    def put(self, content_hash: str, digests: Dict[str, str]) -> None:
+        """KEY별 Target 해시 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = self._path(content_hash)
+        temp_path = path.with_name(path.name + '.tmp')
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+                json.dump({'version': FINGERPRINT_VERSION, 'targets': digests}, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"지문 캐시 저장 실패 (무시): {path} - {e}")
+
+    def prune(self) -> None:
+        """최근 사용한 max_files개만 남기고 오래된 캐시 파일 삭제"""
+        try:
+            cached = sorted(
+                self.cache_dir.glob("*.json.gz"),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True
+            )
+            for path in cached[self.max_files:]:
+                path.unlink()
+        except OSError as e:
+            logger.warning(f"지문 캐시 정리 실패 (무시): {self.cache_dir} - {e}")
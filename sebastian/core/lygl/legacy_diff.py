@@ -5,13 +5,19 @@ PRD v1.4.0 섹션 3 "Legacy Diff"에 정의된 알고리즘을 구현합니다.
 두 버전의 언어별 파일을 비교하여 Status가 "기존"인 행의 Target 변경사항을 추출합니다.
 """
 
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, List, Set, Tuple, Optional, Callable
 from datetime import datetime
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
 from openpyxl.styles import PatternFill, Font, Alignment
 
 from .validator import ValidationError
+from .reader import open_sheet, iter_language_rows
+from .excel_format import register_cell_style, append_styled_cells
+from .fingerprint import FingerprintCache, changed_target_keys, file_content_hash, target_digests
 
 
 # 지원 언어 목록
@@ -25,6 +31,10 @@ class LegacyDiffError(Exception):
         self.error_code = error_code
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # 프로세스 풀 작업자에서 발생한 오류도 error_code를 유지한 채 전달
+        return (self.__class__, (self.message, self.error_code))
+
 
 def scan_language_files(folder: Path) -> Dict[str, Path]:
     """
@@ -129,6 +139,69 @@ def validate_diff_folders(folder1: Path, folder2: Path) -> Tuple[bool, str, Dict
     return True, "", file_pairs
 
 
+def _read_baseline_rows(file_path: Path) -> Dict[str, Tuple]:
+    """
+    언어별 파일에서 Status == "기존"인 행만 수집
+
+    읽는 중에 바로 걸러내므로 다른 Status 행은 보관하지 않습니다.
+
+    Args:
+        file_path: 언어별 파일 경로
+
+    Returns:
+        {KEY: (Source, Target)}
+    """
+    data = {}
+    with open_sheet(file_path, data_only=True) as ws:
+        for table, key, source, target, status, note, date in iter_language_rows(ws):
+            # Status == "기존"만 수집
+            if status == "기존":
+                data[key] = (source, target)
+
+    return data
+
+
+def _diff_baseline_rows(
+    data1: Dict[str, Tuple],
+    data2: Dict[str, Tuple],
+    candidate_keys: Optional[Set[str]] = None
+) -> List[Dict]:
+    """
+    두 버전의 "기존" 행에서 Target이 다른 KEY 추출
+
+    Args:
+        data1: 비교1 {KEY: (Source, Target)}
+        data2: 비교2 {KEY: (Source, Target)}
+        candidate_keys: Target 해시가 다른 KEY의 repr() 집합 (None이면 모든 KEY 비교)
+
+    Returns:
+        차이 목록 (KEY 알파벳 순, compare_language_files() 형식)
+    """
+    # KEY 일치 확인 (양쪽 모두 있는 KEY만 비교, 한쪽에만 있는 KEY는 무시)
+    common_keys = data1.keys() & data2.keys()
+    if candidate_keys is not None:
+        common_keys = {key for key in common_keys if repr(key) in candidate_keys}
+
+    # Target 비교 (다른 것만 수집)
+    differences = []
+
+    for key in sorted(common_keys):  # KEY 알파벳 순으로 처리
+        source, target1 = data1[key]
+        target2 = data2[key][1]
+
+        # Target이 다른 경우만
+        if target1 != target2:
+            differences.append({
+                'key': key,
+                'source': source,
+                'target_old': target1,
+                'target_new': target2,
+                'status': '기존'
+            })
+
+    return differences
+
+
 def compare_language_files(
     file1: Path,
     file2: Path,
@@ -163,80 +236,162 @@ def compare_language_files(
     Reference:
         PRD v1.4.0 섹션 3.4.1
     """
-    # 1. 파일1 로드 (비교1)
-    wb1 = load_workbook(file1, data_only=True)
-    ws1 = wb1.active
+    # 1. 파일1 로드 (비교1), 파일2 로드 (비교2)
+    data1 = _read_baseline_rows(file1)
+    data2 = _read_baseline_rows(file2)
 
-    data1 = {}  # {KEY: {'source': ..., 'target': ..., 'status': ...}}
-    for row in ws1.iter_rows(min_row=2, values_only=True):
-        if len(row) >= 5:
-            table, key, source, target, status = row[:5]
+    # 2. Target 비교
+    return _diff_baseline_rows(data1, data2)
 
-            # Status == "기존"만 수집
-            if status == "기존":
-                data1[key] = {
-                    'source': source,
-                    'target': target,
-                    'status': status
-                }
 
-    wb1.close()
+# ProcessPoolExecutor에서 사용할 함수는 반드시 글로벌로 정의해야 함
+def _read_baseline_task(file_path: Path, with_digests: bool) -> Tuple[Dict[str, Tuple], Optional[Dict[str, str]]]:
+    """
+    "기존" 행 수집 + KEY별 Target 해시 계산 (작업자 프로세스용)
 
-    # 2. 파일2 로드 (비교2)
-    wb2 = load_workbook(file2, data_only=True)
-    ws2 = wb2.active
+    Returns:
+        ({KEY: (Source, Target)}, {repr(KEY): Target 해시} 또는 None)
+    """
+    rows = _read_baseline_rows(file_path)
+    return rows, target_digests(rows) if with_digests else None
 
-    data2 = {}
-    for row in ws2.iter_rows(min_row=2, values_only=True):
-        if len(row) >= 5:
-            table, key, source, target, status = row[:5]
 
-            # Status == "기존"만 수집
-            if status == "기존":
-                data2[key] = {
-                    'source': source,
-                    'target': target,
-                    'status': status
-                }
+def _compare_files(
+    file_pairs: Dict[str, Tuple[Path, Path]],
+    max_workers: int,
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    cache: Optional[FingerprintCache] = None
+) -> Dict[str, List[Dict]]:
+    """
+    언어별 파일 쌍 비교 (파일 지문으로 변경 없는 파일은 읽지 않음)
 
-    wb2.close()
+    처리 규칙:
+        1. 두 파일의 내용 해시가 같으면 비교 생략
+        2. 두 파일의 KEY별 Target 해시가 캐시에 있고 다른 KEY가 없으면 비교 생략
+        3. 비교1 해시만 캐시에 있으면 비교2를 먼저 읽고, 해시가 다른 KEY가 있을 때만 비교1을 읽음
+        4. 양쪽을 모두 읽으면 해시가 다른 KEY만 Target 비교 (캐시 사용 시)
 
-    # 3. KEY 일치 확인 (양쪽 모두 있는 KEY만 비교)
-    keys1 = set(data1.keys())
-    keys2 = set(data2.keys())
-    common_keys = keys1 & keys2
+    max_workers가 2 이상이면 파일을 프로세스 풀에서 동시에 읽고,
+    언어별 두 파일이 모두 도착하는 즉시 비교한 뒤 원본 데이터를 버립니다.
 
-    # KEY 불일치 정보 (로그용, 오류 발생시키지 않음)
-    only_in_1 = keys1 - keys2
-    only_in_2 = keys2 - keys1
+    Returns:
+        {언어코드: 차이 목록} (언어 순서)
+    """
+    all_diffs = {}
+    total_langs = len(VALID_LANGUAGES)
 
-    # 4. Target 비교 (다른 것만 수집)
-    differences = []
+    def finish(lang: str, diffs: List[Dict], message: str) -> None:
+        all_diffs[lang] = diffs
+        if progress_callback:
+            progress = 10 + int(len(all_diffs) / total_langs * 60)
+            progress_callback(progress, f"{lang} {message} ({len(all_diffs)}/{total_langs})")
 
-    for key in sorted(common_keys):  # KEY 알파벳 순으로 처리
-        target1 = data1[key]['target']
-        target2 = data2[key]['target']
+    # 1. 읽을 파일 결정
+    hashes = {}     # {언어코드: (비교1 내용 해시, 비교2 내용 해시)}
+    digests = {}    # {언어코드: [비교1 Target 해시, 비교2 Target 해시]} (모르면 None)
+    rows = {}       # {언어코드: [비교1 데이터, 비교2 데이터]} (읽기 전이면 None)
+    deferred = set()  # 비교2 결과를 보고 비교1 읽기 여부를 정할 언어
+    queue = deque()   # 읽을 (언어코드, 파일 순번) 목록
 
-        # Target이 다른 경우만
-        if target1 != target2:
-            differences.append({
-                'key': key,
-                'source': data1[key]['source'],
-                'target_old': target1,
-                'target_new': target2,
-                'status': '기존'
-            })
+    for lang in VALID_LANGUAGES:
+        hashes[lang] = tuple(file_content_hash(path) for path in file_pairs[lang])
+        if hashes[lang][0] == hashes[lang][1]:
+            finish(lang, [], "파일 동일 - 비교 생략")
+            continue
+
+        digests[lang] = [cache.get(h) if cache else None for h in hashes[lang]]
+        cached1, cached2 = digests[lang]
+        if cached1 is not None and cached2 is not None and not changed_target_keys(cached1, cached2):
+            finish(lang, [], "'기존' 행 동일 - 비교 생략")
+            continue
+
+        rows[lang] = [None, None]
+        queue.append((lang, 1))
+        if cached1 is not None and cached2 is None:
+            deferred.add(lang)
+        else:
+            queue.append((lang, 0))
+
+    # 2. 파일 읽기 + 도착하는 대로 비교
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 and queue else None
+    try:
+        pending = {}  # {Future: (언어코드, 파일 순번)}
+
+        while queue or pending:
+            if executor:
+                while queue:
+                    lang, side = queue.popleft()
+                    future = executor.submit(_read_baseline_task, file_pairs[lang][side], cache is not None)
+                    pending[future] = (lang, side)
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                # 작업자 오류는 result()에서 전파됨
+                results = [(pending.pop(future), future.result()) for future in done]
+            else:
+                lang, side = queue.popleft()
+                results = [((lang, side), _read_baseline_task(file_pairs[lang][side], cache is not None))]
+
+            for (lang, side), (data, file_digests) in results:
+                rows[lang][side] = data
+                if cache:
+                    cache.put(hashes[lang][side], file_digests)
+                    digests[lang][side] = file_digests
+
+                data1, data2 = rows[lang]
+                if data1 is None:
+                    if lang in deferred:
+                        deferred.discard(lang)
+                        if changed_target_keys(*digests[lang]):
+                            queue.append((lang, 0))
+                        else:
+                            del rows[lang]
+                            finish(lang, [], "'기존' 행 동일 - 비교 생략")
+                    continue
+                if data2 is None:
+                    continue
+
+                # 두 파일 모두 도착 → 비교 후 원본 데이터 해제
+                del rows[lang]
+                candidate_keys = changed_target_keys(*digests[lang]) if cache else None
+                finish(lang, _diff_baseline_rows(data1, data2, candidate_keys), "파일 비교 완료")
+    finally:
+        if executor:
+            # 오류 시 남은 작업은 시작하지 않고 정리
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return {lang: all_diffs[lang] for lang in VALID_LANGUAGES}
+
+
+def build_changed_key_sets(all_diffs: Dict[str, List[Dict]]) -> Dict[str, set]:
+    """
+    언어별 변경된 KEY 집합 (한 번만 생성)
 
-    return differences
+    Args:
+        all_diffs: {언어코드: [차이 목록]}
+
+    Returns:
+        {언어코드: 변경된 KEY 집합} (VALID_LANGUAGES 전체)
+    """
+    return {
+        lang: {diff['key'] for diff in all_diffs.get(lang, [])}
+        for lang in VALID_LANGUAGES
+    }
 
 
-def create_overview_sheet(wb: Workbook, all_diffs: Dict[str, List[Dict]]) -> Dict[str, int]:
+def create_overview_sheet(
+    wb: Workbook,
+    all_diffs: Dict[str, List[Dict]],
+    changed_keys: Optional[Dict[str, set]] = None
+) -> Dict[str, int]:
     """
     Overview 시트 생성
 
+    KEY별 언어 변경 여부(O/X)는 언어별 변경 KEY 집합으로 판단하고,
+    셀 서식은 행을 추가할 때 함께 지정합니다.
+
     Args:
         wb: Workbook 객체
         all_diffs: {언어코드: [차이 목록]}
+        changed_keys: build_changed_key_sets() 결과 (None이면 all_diffs에서 생성)
 
     Returns:
         {KEY: Overview 인덱스} 매핑
@@ -244,72 +399,60 @@ def create_overview_sheet(wb: Workbook, all_diffs: Dict[str, List[Dict]]) -> Dic
     Reference:
         PRD v1.4.0 섹션 3.5.3
     """
-    ws = wb.create_sheet("Overview", 0)  # 첫 번째 시트
+    if changed_keys is None:
+        changed_keys = build_changed_key_sets(all_diffs)
 
-    # 헤더
-    ws.append(['#', 'KEY', 'EN', 'CT', 'CS', 'JA', 'TH', 'PT-BR', 'RU'])
-
-    # 헤더 스타일
-    header_fill = PatternFill(start_color="DBEEF4", end_color="DBEEF4", fill_type="solid")
-    header_font = Font(name="Calibri", size=11, bold=True)
-    header_align = Alignment(horizontal="center", vertical="center")
+    ws = wb.create_sheet("Overview", 0)  # 첫 번째 시트
 
-    for col in range(1, 10):
-        cell = ws.cell(1, col)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_align
+    # 서식 (워크북에 한 번만 등록)
+    center_align = Alignment(horizontal="center", vertical="center")
+    header_style = register_cell_style(
+        ws,
+        Font(name="Calibri", size=11, bold=True),
+        center_align,
+        PatternFill(start_color="DBEEF4", end_color="DBEEF4", fill_type="solid"),
+    )
+    index_style = register_cell_style(ws, None, center_align)
+    key_style = register_cell_style(ws, None, Alignment(horizontal="left", vertical="center"))
+    o_style = register_cell_style(
+        ws,
+        Font(name="Calibri", size=11, color="006100", bold=True),
+        center_align,
+        PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+    )
+    x_style = register_cell_style(
+        ws,
+        Font(name="Calibri", size=11, color="3C3C3C"),
+        center_align,
+        PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid"),
+    )
 
-    # 모든 언어의 변경된 KEY 수집 (중복 제거)
-    all_changed_keys = set()
-    for diffs in all_diffs.values():
-        for diff in diffs:
-            all_changed_keys.add(diff['key'])
+    # 헤더
+    headers = ['#', 'KEY'] + VALID_LANGUAGES
+    append_styled_cells(ws, headers, [header_style] * len(headers))
 
-    # KEY 정렬 (알파벳 순)
-    sorted_keys = sorted(all_changed_keys)
+    # 모든 언어의 변경된 KEY (중복 제거, 알파벳 순)
+    sorted_keys = sorted(set().union(*changed_keys.values()))
 
     # KEY -> 인덱스 매핑
     overview_key_index = {}
 
-    # 각 KEY별로 언어별 변경 여부 확인
+    # 각 KEY별로 언어별 변경 여부 확인 (집합 조회)
+    language_key_sets = [changed_keys[lang] for lang in VALID_LANGUAGES]
     for idx, key in enumerate(sorted_keys, start=1):
-        row_data = [idx, key]
         overview_key_index[key] = idx
 
-        for lang in VALID_LANGUAGES:
-            # 해당 언어에서 이 KEY가 변경되었는지 확인
-            lang_diffs = all_diffs.get(lang, [])
-            has_change = any(d['key'] == key for d in lang_diffs)
-
-            row_data.append('O' if has_change else 'X')
-
-        ws.append(row_data)
-
-    # 셀 스타일 (O/X)
-    o_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-    o_font = Font(name="Calibri", size=11, color="006100", bold=True)
-
-    x_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    x_font = Font(name="Calibri", size=11, color="3C3C3C")
-
-    center_align = Alignment(horizontal="center", vertical="center")
-
-    for row_idx in range(2, ws.max_row + 1):
-        for col_idx in range(3, 10):  # C열(3)부터 I열(9)까지
-            cell = ws.cell(row_idx, col_idx)
-            cell.alignment = center_align
-
-            if cell.value == 'O':
-                cell.fill = o_fill
-                cell.font = o_font
-            elif cell.value == 'X':
-                cell.fill = x_fill
-                cell.font = x_font
+        row_data = [idx, key]
+        row_styles = [index_style, key_style]
+        for key_set in language_key_sets:
+            if key in key_set:
+                row_data.append('O')
+                row_styles.append(o_style)
+            else:
+                row_data.append('X')
+                row_styles.append(x_style)
 
-        # 인덱스, KEY 열 정렬
-        ws.cell(row_idx, 1).alignment = center_align
-        ws.cell(row_idx, 2).alignment = Alignment(horizontal="left", vertical="center")
+        append_styled_cells(ws, row_data, row_styles)
 
     # 열 너비 설정
     ws.column_dimensions['A'].width = 8   # #
@@ -332,6 +475,8 @@ def create_language_sheet(
     """
     언어별 상세 시트 생성
 
+    셀 서식과 행 높이는 행을 추가할 때 함께 지정합니다.
+
     Args:
         wb: Workbook 객체
         language_code: 언어 코드
@@ -343,41 +488,43 @@ def create_language_sheet(
     """
     ws = wb.create_sheet(language_code)
 
-    # 헤더
-    ws.append(['Overview Index', 'KEY', 'Source', '이전 Target', '현재 Target'])
-
-    # 헤더 스타일
-    header_fill = PatternFill(start_color="DBEEF4", end_color="DBEEF4", fill_type="solid")
-    header_font = Font(name="Calibri", size=11, bold=True)
-    header_align = Alignment(horizontal="left", vertical="center")
+    # 서식 (워크북에 한 번만 등록)
+    header_style = register_cell_style(
+        ws,
+        Font(name="Calibri", size=11, bold=True),
+        Alignment(horizontal="left", vertical="center"),
+        PatternFill(start_color="DBEEF4", end_color="DBEEF4", fill_type="solid"),
+    )
+    data_styles = [
+        register_cell_style(
+            ws,
+            Font(name="Calibri", size=11),
+            Alignment(horizontal="left", vertical="center", wrap_text=True),
+        )
+    ] * 5
 
-    for col in range(1, 6):
-        cell = ws.cell(1, col)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_align
+    # 헤더
+    append_styled_cells(
+        ws,
+        ['Overview Index', 'KEY', 'Source', '이전 Target', '현재 Target'],
+        [header_style] * 5,
+    )
 
     # 데이터 (Overview 인덱스 순서대로)
     sorted_diffs = sorted(diffs, key=lambda d: overview_key_index.get(d['key'], 0))
 
-    for diff in sorted_diffs:
-        ws.append([
-            overview_key_index.get(diff['key'], 0),
-            diff['key'],
-            diff['source'],
-            diff['target_old'],
-            diff['target_new']
-        ])
-
-    # 데이터 행 스타일
-    data_align = Alignment(horizontal="left", vertical="center", wrap_text=True)
-    data_font = Font(name="Calibri", size=11)
-
-    for row_idx in range(2, ws.max_row + 1):
-        for col_idx in range(1, 6):
-            cell = ws.cell(row_idx, col_idx)
-            cell.font = data_font
-            cell.alignment = data_align
+    for row_idx, diff in enumerate(sorted_diffs, start=2):
+        append_styled_cells(
+            ws,
+            [
+                overview_key_index.get(diff['key'], 0),
+                diff['key'],
+                diff['source'],
+                diff['target_old'],
+                diff['target_new']
+            ],
+            data_styles,
+        )
 
         # 행 높이
         ws.row_dimensions[row_idx].height = 30
@@ -397,16 +544,25 @@ def legacy_diff(
     folder1: Path,
     folder2: Path,
     output_path: Path,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    max_workers: Optional[int] = None,
+    fingerprint_dir: Optional[Path] = None
 ) -> Tuple[Path, Dict[str, int]]:
     """
     Legacy Diff 메인 함수
 
+    max_workers가 2 이상이면 14개 파일을 프로세스 풀에서 동시에 읽고,
+    언어별 두 파일이 모두 읽히는 대로 비교합니다.
+    내용이 같은 파일 쌍은 읽지 않으며, fingerprint_dir을 지정하면 KEY별 Target 해시를
+    보관해 두었다가 다음 비교에서 변경 없는 파일 읽기를 생략합니다.
+
     Args:
         folder1: 비교1 폴더
         folder2: 비교2 폴더
         output_path: 출력 파일 경로
         progress_callback: 진행률 콜백
+        max_workers: 파일 읽기 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 비교)
+        fingerprint_dir: 파일 지문 캐시 폴더 (None이면 캐시 사용 안 함)
 
     Returns:
         (출력 파일 경로, {언어코드: 변경 개수})
@@ -432,19 +588,14 @@ def legacy_diff(
         progress_callback(10, "파일 비교 중...")
 
     # Step 2: 언어별 파일 비교
-    all_diffs = {}
-    total_langs = len(VALID_LANGUAGES)
-
-    for lang_idx, lang in enumerate(VALID_LANGUAGES):
-        file1, file2 = file_pairs[lang]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(VALID_LANGUAGES) * 2)
 
-        diffs = compare_language_files(file1, file2, lang)
-        all_diffs[lang] = diffs
-
-        # 진행률 업데이트 (10% ~ 70%)
-        if progress_callback:
-            progress = 10 + int((lang_idx + 1) / total_langs * 60)
-            progress_callback(progress, f"{lang} 파일 비교 중 ({lang_idx + 1}/{total_langs})...")
+    cache = FingerprintCache(fingerprint_dir) if fingerprint_dir else None
+    all_diffs = _compare_files(file_pairs, max_workers, progress_callback, cache)
+    if cache:
+        cache.prune()
 
     # 변경사항 없으면 오류
     total_changes = sum(len(diffs) for diffs in all_diffs.values())
@@ -462,7 +613,8 @@ def legacy_diff(
     wb = Workbook()
 
     # Overview 시트 생성 (KEY -> 인덱스 매핑도 반환)
-    overview_key_index = create_overview_sheet(wb, all_diffs)
+    changed_keys = build_changed_key_sets(all_diffs)
+    overview_key_index = create_overview_sheet(wb, all_diffs, changed_keys)
 
     if progress_callback:
         progress_callback(85, "언어별 시트 생성 중...")
@@ -6,9 +6,12 @@ PRD 섹션 2.2.1 "Merge Operation"에 정의된 알고리즘을 구현합니다.
 """
 
 import logging
-from typing import Dict
+import os
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 from pathlib import Path
-from openpyxl import load_workbook, Workbook
+from openpyxl import Workbook
 
 logger = logging.getLogger(__name__)
 
@@ -19,25 +22,98 @@ from .validator import (
     validate_language_files,
     validate_headers,
     validate_key,
-    validate_row_match,
+    find_column_mismatches,
+    format_mismatch,
+    raise_mismatch_errors,
     normalize_empty_value,
+    ROW_MATCH_FIELDS,
 )
-from .excel_format import apply_excel_format
+from .excel_format import write_excel_rows, new_streaming_workbook, save_streaming_workbook
+from .reader import LANGUAGE_FILE_HEADERS
+from .table import LanguageTable, read_language_table
+
+
+def _merge_language_table(
+    lang_code: str,
+    lang_table: LanguageTable,
+    en_index: Dict,
+    en_fields: Dict[str, List],
+    target_column: List
+) -> List[str]:
+    """
+    언어 테이블 1개를 EN 기준으로 검증하고 Target 컬럼에 병합
+
+    행마다 dict를 만들지 않고 KEY로 정렬한 컬럼을 일괄 비교하며,
+    첫 오류에서 멈추지 않고 파일의 모든 오류를 수집합니다.
+
+    Args:
+        lang_code: 언어 코드
+        lang_table: 언어 파일 테이블
+        en_index: {KEY: EN 행 위치}
+        en_fields: {필드명: EN 컬럼} (ROW_MATCH_FIELDS)
+        target_column: 병합 결과 Target 컬럼 (EN 행 순서)
+
+    Returns:
+        오류 메시지 목록 (파일 행 순서, 없으면 빈 리스트)
+    """
+    keys = lang_table.column("KEY")
+    positions = [en_index.get(key) for key in keys]
+
+    # EN에 있는 KEY 행만 비교 (없는 KEY는 별도 오류)
+    found = [idx for idx, pos in enumerate(positions) if pos is not None]
+    checked = lang_table if len(found) == len(positions) else lang_table.take(found)
+    en_positions = [positions[idx] for idx in found]
+
+    lang_fields = {field: checked.column(field) for field in ROW_MATCH_FIELDS}
+    lang_fields["NOTE"] = [normalize_empty_value(value) for value in lang_fields["NOTE"]]
+
+    mismatches = find_column_mismatches(
+        checked.column("KEY"),
+        {field: [en_fields[field][pos] for pos in en_positions] for field in ROW_MATCH_FIELDS},
+        lang_fields,
+    )
+
+    errors = [
+        (found[idx], format_mismatch(key, field, en_value, lang_value, lang_code))
+        for idx, key, field, en_value, lang_value in mismatches
+    ]
+    errors.extend(
+        (idx, f"KEY '{keys[idx]}' in {lang_code} not found in EN (master) file")
+        for idx, pos in enumerate(positions) if pos is None
+    )
+    errors.sort(key=itemgetter(0))  # 행 순서 (같은 행은 필드 순서 유지)
 
+    # Target 값 병합
+    for pos, target in zip(positions, lang_table.column("Target")):
+        if pos is not None:
+            target_column[pos] = normalize_empty_value(target)
 
-def merge(language_files: Dict[str, Path], progress_callback=None) -> Workbook:
+    return [message for _, message in errors]
+
+
+def merge(
+    language_files: Dict[str, Path],
+    progress_callback=None,
+    read_workers: Optional[int] = None
+) -> Workbook:
     """
     7개 언어별 파일을 1개 병합 파일로 통합
 
+    EN 이외 6개 언어 파일은 프로세스 풀에서 동시에 읽고(EN 로드와 병행),
+    검증/병합은 언어 순서대로 현재 프로세스에서 수행합니다.
+    KEY/공통 필드 불일치는 6개 언어 전체를 확인한 뒤 한 번에 보고합니다.
+
     Args:
         language_files: {'EN': Path('path/to/EN.xlsx'), 'CT': Path(...), ...}
         progress_callback: 진행률 콜백 함수 (optional)
+        read_workers: 언어 파일 읽기 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 읽기)
 
     Returns:
-        병합된 Workbook 객체
+        병합된 Workbook 객체 (write_only 모드, save()는 한 번만 가능)
 
     Raises:
         ValidationError: 파일 수 불일치, KEY 불일치, Table/Source 불일치 시
+            (불일치 메시지는 줄 단위, 전체 목록은 params['errors'])
         FileNotFoundError: 파일이 존재하지 않을 시
         IOError: 파일 읽기 실패 시
 
@@ -58,109 +134,113 @@ def merge(language_files: Dict[str, Path], progress_callback=None) -> Workbook:
     # 1. 파일 수 및 언어 검증 (정확히 7개)
     validate_language_files(list(file_paths.values()))
 
-    # 2. EN 파일 (마스터) 로드
     en_path = file_paths.get("EN")
     if not en_path:
         raise ValidationError("EN (master) file is required")
 
-    try:
-        en_wb = load_workbook(en_path)
-    except Exception as e:
-        raise IOError(f"Failed to read EN file: {e}")
-
-    en_ws = en_wb.active
-    en_data = {}  # {KEY: {Table, Source, Status, NOTE, Target_EN}}
-
-    # 헤더 검증 (대소문자 구분)
-    expected_headers = ["Table", "KEY", "Source", "Target", "Status", "NOTE", "Date"]
-    actual_headers = [cell.value for cell in en_ws[1]]
-    validate_headers(actual_headers, expected_headers, en_path.name)
-
-    # EN 데이터 수집 (2행부터)
-    for idx, row in enumerate(en_ws.iter_rows(min_row=2, values_only=True), start=2):
-        if len(row) < 6:
-            continue  # 빈 행 스킵
-
-        table, key, source, target_en, status, note = row[:6]
-        date = row[6] if len(row) > 6 else ""
-
-        # KEY 검증
-        validate_key(key, idx, en_path.name)
-
-        # 중복 KEY 검증
-        if key in en_data:
-            raise ValidationError(f"Duplicate KEY in EN file: {key}")
-
-        en_data[key] = {
-            "Table": table,
-            "Source": source,
-            "Target_EN": normalize_empty_value(target_en),
-            "Status": status,
-            "NOTE": normalize_empty_value(note),
-            "Date": normalize_empty_value(date),
-        }
-
-    # 3. 나머지 언어 파일 처리
     lang_codes = ["CT", "CS", "JA", "TH", "PT-BR", "RU"]
-    for file_idx, lang_code in enumerate(lang_codes, start=1):
-        lang_path = file_paths.get(lang_code)
-        if not lang_path:
+    for lang_code in lang_codes:
+        if not file_paths.get(lang_code):
             raise ValidationError(f"Missing language file: {lang_code}")
 
-        # 진행 상황 콜백 (EN 포함 총 7개 중 현재 처리)
-        if progress_callback:
-            progress_callback(None, f"{lang_code} 파일 처리 중 ({file_idx + 1}/7)...")
+    if read_workers is None:
+        read_workers = os.cpu_count() or 1
+    read_workers = min(read_workers, len(lang_codes))
 
+    # 6개 언어 파일 읽기 시작 (EN 로드/검증과 병행)
+    executor = ProcessPoolExecutor(max_workers=read_workers) if read_workers > 1 else None
+    try:
+        futures = {
+            lang_code: executor.submit(read_language_table, file_paths[lang_code])
+            for lang_code in lang_codes
+        } if executor else {}
+
+        # 2. EN 파일 (마스터) 로드
         try:
-            lang_wb = load_workbook(lang_path)
+            actual_headers, en_table = read_language_table(en_path)
         except Exception as e:
-            raise IOError(f"Failed to read {lang_code} file: {e}")
-
-        lang_ws = lang_wb.active
-
-        # 헤더 검증
-        lang_headers = [cell.value for cell in lang_ws[1]]
-        validate_headers(lang_headers, expected_headers, lang_path.name)
-
-        # 데이터 검증 및 병합
-        for idx, row in enumerate(
-            lang_ws.iter_rows(min_row=2, values_only=True), start=2
-        ):
-            if len(row) < 6:
-                continue  # 빈 행 스킵
-
-            table, key, source, target, status, note = row[:6]
-            date = row[6] if len(row) > 6 else ""
-
-            # KEY 존재 여부 확인 (EN에 없으면 에러)
-            if key not in en_data:
-                raise ValidationError(
-                    f"KEY '{key}' in {lang_code} not found in EN (master) file"
-                )
-
-            # Table, Source, Status, NOTE, Date 일치 확인
-            en_row = en_data[key]
-            lang_row = {
-                "Table": table,
-                "Source": source,
-                "Status": status,
-                "NOTE": normalize_empty_value(note),
-                "Date": normalize_empty_value(date),
-            }
-
-            validate_row_match(key, en_row, lang_row, lang_code)
-
-            # Target 값 병합
-            column_name = LANGUAGE_MAPPING[lang_code]["column_name"]
-            en_data[key][column_name] = normalize_empty_value(target)
-
-    # 4. 병합 파일 생성
-    merged_wb = Workbook()
-    merged_ws = merged_wb.active
-    merged_ws.title = "Sheet1"  # 시트명을 'Sheet1'으로 설정 (MS Excel 기본값)
-
-    # 헤더 작성
-    merged_ws.append(
+            raise IOError(f"Failed to read EN file: {e}")
+
+        # 헤더 검증 (대소문자 구분)
+        expected_headers = LANGUAGE_FILE_HEADERS
+        validate_headers(actual_headers, expected_headers, en_path.name)
+
+        # EN 데이터 수집 (2행부터): KEY 검증 + 중복 KEY 검증
+        en_index = {}  # {KEY: EN 행 위치}
+        for idx, key in enumerate(en_table.column("KEY"), start=2):
+            # KEY 검증
+            validate_key(key, idx, en_path.name)
+
+            # 중복 KEY 검증
+            if key in en_index:
+                raise ValidationError(f"Duplicate KEY in EN file: {key}")
+
+            en_index[key] = idx - 2
+
+        # EN 기준 컬럼 (Table/Source/Status는 원본 값, NOTE/Date는 정규화)
+        en_tables = en_table.column("Table")
+        en_sources = en_table.column("Source")
+        en_statuses = en_table.column("Status")
+        en_notes = [normalize_empty_value(value) for value in en_table.column("NOTE")]
+        en_dates = [normalize_empty_value(value) for value in en_table.column("Date")]
+        en_fields = {
+            "Table": en_tables,
+            "Source": en_sources,
+            "Status": en_statuses,
+            "NOTE": en_notes,
+        }
+
+        # Target 컬럼 (EN 행 순서, 없는 언어 값은 빈 문자열)
+        targets = {
+            LANGUAGE_MAPPING[lang]["column_name"]: [""] * len(en_table)
+            for lang in LANGUAGE_ORDER
+        }
+        targets["Target_EN"] = [normalize_empty_value(value) for value in en_table.column("Target")]
+
+        # 3. 나머지 언어 파일 처리 (언어 순서대로 검증/병합)
+        row_errors = []
+        for file_idx, lang_code in enumerate(lang_codes, start=1):
+            lang_path = file_paths[lang_code]
+
+            # 진행 상황 콜백 (EN 포함 총 7개 중 현재 처리)
+            if progress_callback:
+                progress_callback(None, f"{lang_code} 파일 처리 중 ({file_idx + 1}/7)...")
+
+            try:
+                if executor:
+                    lang_headers, lang_table = futures[lang_code].result()
+                else:
+                    lang_headers, lang_table = read_language_table(lang_path)
+            except Exception as e:
+                raise IOError(f"Failed to read {lang_code} file: {e}")
+
+            # 헤더 검증
+            validate_headers(lang_headers, expected_headers, lang_path.name)
+
+            # 데이터 검증 및 병합 (오류는 모아서 마지막에 보고)
+            lang_errors = _merge_language_table(
+                lang_code,
+                lang_table,
+                en_index,
+                en_fields,
+                targets[LANGUAGE_MAPPING[lang_code]["column_name"]],
+            )
+            if lang_errors:
+                logger.warning(f"{lang_code} 파일 불일치 {len(lang_errors)}건")
+                row_errors.extend(lang_errors)
+
+        raise_mismatch_errors(row_errors)
+    finally:
+        if executor:
+            # 오류 시 남은 읽기 작업은 시작하지 않고 정리
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # 4. 병합 파일 생성 (write_only: 행을 추가하는 즉시 임시 파일로 내보냄)
+    merged_wb, merged_ws = new_streaming_workbook("Sheet1")  # MS Excel 기본 시트명
+
+    # 헤더 + 데이터 작성 (EN 파일 순서 유지, 셀 작성 시 서식 함께 적용)
+    write_excel_rows(
+        merged_ws,
         [
             "Table",
             "KEY",
@@ -175,37 +255,33 @@ def merge(language_files: Dict[str, Path], progress_callback=None) -> Workbook:
             "Status",
             "NOTE",
             "Date",
-        ]
+        ],
+        zip(
+            en_tables,
+            en_table.column("KEY"),
+            en_sources,
+            targets["Target_EN"],
+            targets["Target_CT"],
+            targets["Target_CS"],
+            targets["Target_JA"],
+            targets["Target_TH"],
+            targets["Target_PT"],
+            targets["Target_RU"],
+            en_statuses,
+            en_notes,
+            en_dates,
+        ),
+        is_merged=True,
     )
 
-    # 데이터 작성 (EN 파일 순서 유지)
-    for key, data in en_data.items():
-        merged_ws.append(
-            [
-                data["Table"],
-                key,
-                data["Source"],
-                data.get("Target_EN", ""),
-                data.get("Target_CT", ""),
-                data.get("Target_CS", ""),
-                data.get("Target_JA", ""),
-                data.get("Target_TH", ""),
-                data.get("Target_PT", ""),
-                data.get("Target_RU", ""),
-                data["Status"],
-                data["NOTE"],
-                data["Date"],
-            ]
-        )
-
-    # 5. Excel 서식 적용
-    apply_excel_format(merged_ws, is_merged=True)
-
     return merged_wb
 
 
 def merge_files(
-    language_file_paths: Dict[str, str], output_path: str, progress_callback=None
+    language_file_paths: Dict[str, str],
+    output_path: str,
+    progress_callback=None,
+    read_workers: Optional[int] = None,
 ) -> None:
     """
     7개 언어별 파일을 병합하여 파일로 저장
@@ -214,6 +290,7 @@ def merge_files(
         language_file_paths: {'EN': 'path/to/EN.xlsx', ...}
         output_path: 출력 파일 경로
         progress_callback: 진행률 콜백 함수 (optional)
+        read_workers: 언어 파일 읽기 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 읽기)
 
     Raises:
         ValidationError: 검증 실패 시
@@ -235,7 +312,7 @@ def merge_files(
         progress_callback(0, "병합 작업을 시작합니다...")
 
     # 병합 수행 (progress_callback 전달)
-    merged_wb = merge(file_paths, progress_callback=progress_callback)
+    merged_wb = merge(file_paths, progress_callback=progress_callback, read_workers=read_workers)
 
     if progress_callback:
         progress_callback(80, "병합된 파일을 저장하는 중...")
@@ -243,7 +320,7 @@ def merge_files(
     # 파일 저장
     output = Path(output_path)
     try:
-        merged_wb.save(output)
+        save_streaming_workbook(merged_wb, output)
     except Exception as e:
         raise IOError(f"Failed to write output file: {e}")
 
@@ -0,0 +1,123 @@
+"""
+워크북 읽기 모듈
+
+LY/GL 파일을 openpyxl read_only 모드로 열어 셀 값만 읽습니다.
+셀 객체와 스타일을 만들지 않으므로 대용량 파일의 로드 시간과 메모리 사용량이 줄어듭니다.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from openpyxl import load_workbook
+
+
+# 언어별 파일 컬럼 구조 (PRD 섹션 2.1.4)
+LANGUAGE_FILE_HEADERS = ["Table", "KEY", "Source", "Target", "Status", "NOTE", "Date"]
+LANGUAGE_FILE_WIDTH = len(LANGUAGE_FILE_HEADERS)
+
+
+def load_readonly_workbook(file_path: Path, data_only: bool = False):
+    """
+    워크북을 읽기 전용(read_only) 모드로 로드
+
+    반환된 Workbook은 사용 후 반드시 close()로 파일 핸들을 닫아야 합니다.
+
+    Args:
+        file_path: xlsx 파일 경로
+        data_only: True면 수식 대신 캐시된 값을 읽음
+
+    Returns:
+        읽기 전용 Workbook 객체
+    """
+    return load_workbook(file_path, read_only=True, data_only=data_only)
+
+
+@contextmanager
+def open_sheet(file_path: Path, data_only: bool = False):
+    """
+    워크북을 읽기 전용으로 열고 활성 시트를 반환
+
+    with 블록을 벗어나면 파일 핸들을 즉시 닫습니다.
+    (read_only 모드는 wb.close() 전까지 파일을 열어둠)
+
+    Args:
+        file_path: xlsx 파일 경로
+        data_only: True면 수식 대신 캐시된 값을 읽음
+
+    Yields:
+        ReadOnlyWorksheet 객체
+    """
+    wb = load_readonly_workbook(file_path, data_only=data_only)
+    try:
+        yield wb.active
+    finally:
+        wb.close()
+
+
+def read_header(ws) -> List:
+    """
+    1행(헤더) 값 목록 반환
+
+    Args:
+        ws: 워크시트 객체
+
+    Returns:
+        헤더 값 리스트 (빈 시트면 빈 리스트)
+    """
+    for row in ws.iter_rows(min_row=1, max_row=1, values_only=True):
+        return list(row)
+    return []
+
+
+def iter_rows(ws, width: int, min_row: int = 2) -> Iterator[Tuple]:
+    """
+    데이터 행을 고정 길이 튜플로 반환
+
+    저장 도구에 따라 행 끝의 빈 셀이 생략될 수 있으므로
+    모든 행을 width 길이로 맞춥니다 (부족하면 None으로 채우고, 넘치면 자름).
+
+    Args:
+        ws: 워크시트 객체
+        width: 튜플 길이 (컬럼 수)
+        min_row: 시작 행 번호 (기본: 2, 헤더 제외)
+
+    Yields:
+        길이 width의 값 튜플
+    """
+    padding = (None,) * width
+    for row in ws.iter_rows(min_row=min_row, values_only=True):
+        if len(row) == width:
+            yield row
+        elif len(row) > width:
+            yield row[:width]
+        else:
+            yield row + padding[len(row):]
+
+
+def iter_language_rows(ws, min_row: int = 2) -> Iterator[Tuple]:
+    """
+    언어별 파일의 데이터 행을 7-튜플로 반환
+
+    Yields:
+        (Table, KEY, Source, Target, Status, NOTE, Date)
+    """
+    return iter_rows(ws, LANGUAGE_FILE_WIDTH, min_row)
+
+
+def read_language_rows(file_path: Path, data_only: bool = False) -> Tuple[List, List[Tuple]]:
+    """
+    언어별 파일 전체를 읽어 헤더와 데이터 행 반환
+
+    Args:
+        file_path: 언어별 파일 경로
+        data_only: True면 수식 대신 캐시된 값을 읽음
+
+    Returns:
+        (헤더 리스트, [(Table, KEY, Source, Target, Status, NOTE, Date), ...])
+    """
+    with open_sheet(file_path, data_only=data_only) as ws:
+        headers = read_header(ws)
+        rows = list(iter_language_rows(ws))
+
+    return headers, rows
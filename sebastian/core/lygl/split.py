@@ -6,9 +6,9 @@ PRD 섹션 2.2.2 "Split Operation"에 정의된 알고리즘을 구현합니다.
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
-from openpyxl import load_workbook, Workbook
+from openpyxl import Workbook
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,45 @@ from .validator import (
     validate_key,
     normalize_empty_value,
 )
-from .excel_format import apply_split_format
+from .excel_format import (
+    split_sheet_writer,
+    new_streaming_workbook,
+    save_streaming_workbook,
+    discard_streaming_workbook,
+)
+from .reader import LANGUAGE_FILE_HEADERS, load_readonly_workbook, read_header, iter_rows
+
+
+def _iter_valid_rows(rows: Iterable[Tuple], file_name: str) -> Iterator[Tuple]:
+    """
+    병합 파일 데이터 행 검증
+
+    완전히 빈 불완전 행은 건너뛰고, 일부만 채워진 불완전 행과 잘못된 KEY는 에러로 처리합니다.
+
+    Args:
+        rows: 병합 파일 데이터 행 (헤더 제외)
+        file_name: 에러 메시지용 파일명
+
+    Yields:
+        검증된 13-튜플 행
+
+    Raises:
+        ValidationError: 불완전 행, KEY 검증 실패 시
+    """
+    for idx, row in enumerate(rows, start=2):
+        if len(row) < 13:
+            # 행이 불완전한 경우 검증
+            if any(cell is not None and str(cell).strip() != "" for cell in row):
+                # 일부 데이터가 있으면 에러
+                raise ValidationError(
+                    f"Incomplete row found in merged file at row {idx}"
+                )
+            continue  # 완전히 빈 행은 스킵
+
+        # KEY 검증
+        validate_key(row[1], idx, file_name)
+
+        yield row
 
 
 def split(merged_file_path: Path, progress_callback=None) -> Dict[str, Workbook]:
@@ -32,7 +70,7 @@ def split(merged_file_path: Path, progress_callback=None) -> Dict[str, Workbook]
         progress_callback: 진행률 콜백 함수 (optional)
 
     Returns:
-        {'EN': Workbook, 'CT': Workbook, ...}
+        {'EN': Workbook, 'CT': Workbook, ...} (write_only 모드, save()는 한 번만 가능)
 
     Raises:
         ValidationError: 헤더 불일치, 빈 행 등
@@ -49,88 +87,78 @@ def split(merged_file_path: Path, progress_callback=None) -> Dict[str, Workbook]
 
     # 1. 병합 파일 로드
     try:
-        merged_wb = load_workbook(merged_path)
+        merged_wb = load_readonly_workbook(merged_path)
     except Exception as e:
         raise IOError(f"Failed to read merged file: {e}")
 
-    merged_ws = merged_wb.active
-
-    # 헤더 검증
-    expected_headers = [
-        "Table",
-        "KEY",
-        "Source",
-        "Target_EN",
-        "Target_CT",
-        "Target_CS",
-        "Target_JA",
-        "Target_TH",
-        "Target_PT",
-        "Target_RU",
-        "Status",
-        "NOTE",
-        "Date",
-    ]
-    actual_headers = [cell.value for cell in merged_ws[1]]
-    validate_headers(actual_headers, expected_headers, merged_path.name)
-
-    # 2. 각 언어별 파일 생성
-    result_workbooks = {}
-
-    for file_idx, lang_code in enumerate(LANGUAGE_ORDER, start=1):
-        # 진행 상황 콜백
-        if progress_callback:
-            progress_callback(None, f"{lang_code} 파일 생성 중 ({file_idx}/7)...")
-        
-        lang_wb = Workbook()
-        lang_ws = lang_wb.active
-        lang_ws.title = "Sheet1"  # 시트명을 'Sheet1'으로 설정 (MS Excel 기본값)
-
-        # 헤더 작성
-        lang_ws.append(["Table", "KEY", "Source", "Target", "Status", "NOTE", "Date"])
-
-        # Target 컬럼 인덱스 계산
-        target_column_name = LANGUAGE_MAPPING[lang_code]["column_name"]
-        target_col_index = expected_headers.index(target_column_name)
-
-        # 데이터 추출
-        for idx, row in enumerate(
-            merged_ws.iter_rows(min_row=2, values_only=True), start=2
-        ):
-            if len(row) < 13:
-                # 행이 불완전한 경우 검증
-                if any(cell is not None and str(cell).strip() != "" for cell in row):
-                    # 일부 데이터가 있으면 에러
-                    raise ValidationError(
-                        f"Incomplete row found in merged file at row {idx}"
-                    )
-                continue  # 완전히 빈 행은 스킵
-
-            table = row[0]
-            key = row[1]
-            source = row[2]
-            target = row[target_col_index] if len(row) > target_col_index else ""
-            status = row[10] if len(row) > 10 else ""
-            note = row[11] if len(row) > 11 else ""
-            date = row[12] if len(row) > 12 else ""
-
-            # KEY 검증
-            validate_key(key, idx, merged_path.name)
-
-            # 값 정규화
-            target = normalize_empty_value(target)
-            status = normalize_empty_value(status) if status else ""
-            note = normalize_empty_value(note)
-            date = normalize_empty_value(date)
+    try:
+        merged_ws = merged_wb.active
+
+        # 헤더 검증
+        expected_headers = [
+            "Table",
+            "KEY",
+            "Source",
+            "Target_EN",
+            "Target_CT",
+            "Target_CS",
+            "Target_JA",
+            "Target_TH",
+            "Target_PT",
+            "Target_RU",
+            "Status",
+            "NOTE",
+            "Date",
+        ]
+        actual_headers = read_header(merged_ws)
+        validate_headers(actual_headers, expected_headers, merged_path.name)
+
+        # 2. 7개 언어 파일 작성기 준비 (write_only: 행은 즉시 임시 파일로 내보냄)
+        result_workbooks = {}
+        writers = {}
+        for lang_code in LANGUAGE_ORDER:
+            lang_wb, lang_ws = new_streaming_workbook("Sheet1")  # MS Excel 기본 시트명
+            result_workbooks[lang_code] = lang_wb
+            # Split 전용 서식: 헤더 배경색 없음, 틀 고정 없음
+            writers[lang_code] = split_sheet_writer(lang_ws, LANGUAGE_FILE_HEADERS)
+
+        # Target 컬럼 인덱스 (언어 순서)
+        target_indices = [
+            (writers[lang_code], expected_headers.index(LANGUAGE_MAPPING[lang_code]["column_name"]))
+            for lang_code in LANGUAGE_ORDER
+        ]
 
-            lang_ws.append([table, key, source, target, status, note, date])
+        if progress_callback:
+            progress_callback(None, "병합 파일을 읽으며 7개 언어 파일을 동시에 작성하는 중...")
 
-        # Split 전용 서식 적용 (헤더 배경색 없음, 틀 고정 없음)
-        apply_split_format(lang_ws)
+        try:
+            # 3. 병합 파일 1회 스캔: 행마다 검증/정규화 1회 → 7개 언어 파일에 동시 작성
+            for row in _iter_valid_rows(iter_rows(merged_ws, len(actual_headers)), merged_path.name):
+                table, key, source = row[0], row[1], row[2]
+                status = normalize_empty_value(row[10]) if row[10] else ""
+                note = normalize_empty_value(row[11])
+                date = normalize_empty_value(row[12])
+
+                for writer, target_idx in target_indices:
+                    writer.append(
+                        (table, key, source, normalize_empty_value(row[target_idx]), status, note, date)
+                    )
+        except Exception:
+            # 저장하지 않을 워크북의 임시 파일 정리
+            for lang_wb in result_workbooks.values():
+                discard_streaming_workbook(lang_wb)
+            raise
 
-        result_workbooks[lang_code] = lang_wb
+        # 4. 언어별 파일 마무리 (자동 필터 범위)
+        for file_idx, lang_code in enumerate(LANGUAGE_ORDER, start=1):
+            if progress_callback:
+                progress_callback(None, f"{lang_code} 파일 생성 중 ({file_idx}/7)...")
+            writers[lang_code].close()
 
-    return result_workbooks
+        return result_workbooks
+    finally:
+        # read_only 모드는 파일 핸들을 열어두므로 명시적으로 닫음
+        merged_wb.close()
 
 
 def split_file(
@@ -204,7 +232,7 @@ def split_file(
 
         # 저장
         try:
-            workbooks[lang_code].save(output_path)
+            save_streaming_workbook(workbooks[lang_code], output_path)
         except Exception as e:
             raise IOError(f"Failed to write {lang_code} file: {e}")
 
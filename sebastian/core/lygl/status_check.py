@@ -5,15 +5,32 @@ Status Check 모듈
 EN 파일을 기준으로 다른 6개 언어의 Status를 비교하여 불일치하는 키만 보고합니다.
 """
 
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import compress, repeat
+from operator import ne, or_
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Tuple
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
 from openpyxl.styles import PatternFill, Font, Alignment
 
+from .table import read_language_table
+
 
 # 지원 언어 목록
 VALID_LANGUAGES = ['EN', 'CT', 'CS', 'JA', 'TH', 'PT-BR', 'RU']
 
+# 통계 대상 Status (Summary 표 순서)
+STATUS_NAMES = ['기존', '번역필요', '수정', '완료']
+
+# 언어 파일에 KEY가 없을 때 표시하는 Status (코드 0)
+MISSING_STATUS = 'Missing'
+
+# Source 단어 수를 계산하는 Status
+WORD_COUNT_STATUSES = ['번역필요', '수정']
+
 
 class StatusCheckError(Exception):
     """Status Check 처리 오류"""
@@ -22,6 +39,10 @@ class StatusCheckError(Exception):
         self.error_code = error_code
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # 프로세스 풀 작업자에서 발생한 오류도 error_code를 유지한 채 전달
+        return (self.__class__, (self.message, self.error_code))
+
 
 def read_language_file(file_path: Path) -> Dict[str, str]:
     """
@@ -36,6 +57,32 @@ def read_language_file(file_path: Path) -> Dict[str, str]:
     파일 구조:
         | Table | KEY | Source | Target | Status |
 
+    예외:
+        - 파일이 없으면 FileNotFoundError
+        - 파일 형식이 잘못되면 StatusCheckError
+    """
+    key_status_map, _, _ = scan_language_file(file_path)
+    return key_status_map
+
+
+def scan_language_file(
+    file_path: Path,
+    count_words: bool = False
+) -> Tuple[Dict[str, str], Dict[str, int], Optional[Dict[str, int]]]:
+    """
+    언어 파일을 한 번 읽어 Status Check에 필요한 값을 모두 수집
+
+    행을 한 번 순회하면서 {KEY: Status} 매핑과 (EN 파일이면) Source 단어 수를 함께 계산합니다.
+
+    Args:
+        file_path: LY Table Split 파일 경로
+        count_words: True면 '번역필요'/'수정' 행의 Source 단어 수도 계산 (EN 파일)
+
+    Returns:
+        ({KEY: Status}, Status 통계, 단어 수 또는 None)
+        - Status 통계: {'기존': 10, '번역필요': 5, '수정': 2, '완료': 3}
+        - 단어 수: {'번역필요': 1234, '수정': 567, '합계': 1801}
+
     예외:
         - 파일이 없으면 FileNotFoundError
         - 파일 형식이 잘못되면 StatusCheckError
@@ -44,27 +91,34 @@ def read_language_file(file_path: Path) -> Dict[str, str]:
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
 
     try:
-        wb = load_workbook(file_path, data_only=True)
-        ws = wb.active
-
-        key_status_map = {}
-
         # 첫 행은 헤더, 2행부터 데이터
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if len(row) >= 5:
-                table, key, source, target, status = row[:5]
+        _, table = read_language_table(file_path, data_only=True)
 
-                # KEY와 Status가 모두 있는 경우만 수집
-                if key and status:
-                    key_status_map[key] = status
+        key_status_map = {}
+        word_counts = {status: 0 for status in WORD_COUNT_STATUSES}
+        sources = table.column('Source') if count_words else repeat(None)
 
-        wb.close()
+        for key, status, source in zip(table.column('KEY'), table.column('Status'), sources):
+            # KEY와 Status가 모두 있는 경우만 수집
+            if key and status:
+                key_status_map[key] = status
 
-        return key_status_map
+            # '번역필요' 또는 '수정' 상태의 Source 단어 수
+            if source and status in word_counts:
+                word_counts[status] += count_korean_words(source)
 
     except Exception as e:
         raise StatusCheckError(f"파일 읽기 실패: {file_path}\n오류: {str(e)}")
 
+    counts = Counter(key_status_map.values())
+    statistics = {status: counts[status] for status in STATUS_NAMES}
+
+    if not count_words:
+        return key_status_map, statistics, None
+
+    word_counts['합계'] = sum(word_counts.values())
+    return key_status_map, statistics, word_counts
+
 
 def calculate_status_statistics(
     all_data: Dict[str, Dict[str, str]]
@@ -85,15 +139,67 @@ def calculate_status_statistics(
     statistics = {}
 
     for lang in VALID_LANGUAGES:
-        stats = {'기존': 0, '번역필요': 0, '수정': 0, '완료': 0}
+        counts = Counter(all_data[lang].values())
+        statistics[lang] = {status: counts[status] for status in STATUS_NAMES}
 
-        for status in all_data[lang].values():
-            if status in stats:
-                stats[status] += 1
+    return statistics
 
-        statistics[lang] = stats
 
-    return statistics
+def encode_status_columns(
+    all_data: Dict[str, Dict[str, str]],
+    keys: List[str]
+) -> Tuple[Dict[str, array], List[str]]:
+    """
+    언어별 Status를 KEY 순서로 정렬된 정수 코드 배열로 변환
+
+    코드 0은 KEY 없음(Missing), 1~4는 STATUS_NAMES 순서,
+    그 밖의 Status 값은 5부터 차례로 코드를 부여합니다.
+
+    Args:
+        all_data: {언어코드: {KEY: Status}}
+        keys: 기준 KEY 목록 (배열 순서)
+
+    Returns:
+        ({언어코드: Status 코드 배열}, 코드 → Status 문자열 목록)
+    """
+    names = [MISSING_STATUS] + STATUS_NAMES
+    codes = {name: code for code, name in enumerate(names)}
+    codes[None] = 0  # dict.get() 결과 (KEY 없음)
+
+    for lang in VALID_LANGUAGES:
+        for status in set(all_data[lang].values()):
+            if status not in codes:
+                codes[status] = len(names)
+                names.append(status)
+
+    columns = {
+        lang: array('H', map(codes.__getitem__, map(all_data[lang].get, keys)))
+        for lang in VALID_LANGUAGES
+    }
+
+    return columns, names
+
+
+def find_inconsistent_rows(columns: Dict[str, array]) -> bytearray:
+    """
+    EN과 Status 코드가 하나라도 다른 행 마스크
+
+    Args:
+        columns: encode_status_columns() 결과 코드 배열
+
+    Returns:
+        행별 0/1 마스크 (1 = 불일치)
+    """
+    en_codes = columns['EN']
+    mask = bytearray(len(en_codes))
+
+    for lang in VALID_LANGUAGES[1:]:
+        lang_codes = columns[lang]
+        if lang_codes == en_codes:
+            continue
+        mask = bytearray(map(or_, mask, map(ne, en_codes, lang_codes)))
+
+    return mask
 
 
 def count_korean_words(text: str) -> int:
@@ -163,40 +269,77 @@ def calculate_korean_word_count(
     """
     if not en_file_path.exists():
         raise FileNotFoundError(f"EN 파일을 찾을 수 없습니다: {en_file_path}")
-    
+
     try:
-        wb = load_workbook(en_file_path, data_only=True)
-        ws = wb.active
-        
-        # 초기화
-        word_counts = {
-            '번역필요': 0,
-            '수정': 0,
-            '합계': 0
-        }
-        
-        # 각 행 처리 (2행부터 데이터)
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if len(row) >= 5:
-                table, key, source, target, status = row[:5]
-                
-                # '번역필요' 또는 '수정' 상태만 처리
-                if status in ['번역필요', '수정'] and source:
-                    # Source 컬럼(C열)에서 한국어 단어 수 계산
-                    korean_words = count_korean_words(source)
-                    word_counts[status] += korean_words
-                    word_counts['합계'] += korean_words
-        
-        wb.close()
+        _, _, word_counts = scan_language_file(en_file_path, count_words=True)
         return word_counts
-    
+
     except Exception as e:
         raise StatusCheckError(f"한국어 단어 수 계산 실패: {en_file_path}\n오류: {str(e)}")
 
 
-def check_status_consistency(
+def _scan_files_sequential(
     files: Dict[str, Path],
     progress_callback: Optional[Callable[[int, str], None]] = None
+) -> Dict[str, Tuple]:
+    """
+    7개 언어 파일을 현재 프로세스에서 순서대로 읽기
+
+    Returns:
+        {언어코드: scan_language_file() 결과}
+    """
+    results = {}
+    for idx, (lang, file_path) in enumerate(files.items()):
+        if progress_callback:
+            percent = 10 + int((idx + 1) / 7 * 30)
+            progress_callback(percent, f"{lang} 파일 읽기 중 ({idx + 1}/7)...")
+
+        results[lang] = scan_language_file(file_path, count_words=(lang == 'EN'))
+
+    return results
+
+
+def _scan_files_parallel(
+    files: Dict[str, Path],
+    max_workers: int,
+    progress_callback: Optional[Callable[[int, str], None]] = None
+) -> Dict[str, Tuple]:
+    """
+    7개 언어 파일을 프로세스 풀에서 동시에 읽기
+
+    파일 하나가 끝날 때마다 완료 순서대로 진행 상황을 전달합니다.
+
+    Returns:
+        {언어코드: scan_language_file() 결과}
+    """
+    results = {}
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        # scan_language_file은 모듈 최상위 함수이므로 작업자에서 바로 실행 가능
+        future_to_lang = {
+            executor.submit(scan_language_file, file_path, lang == 'EN'): lang
+            for lang, file_path in files.items()
+        }
+
+        for completed, future in enumerate(as_completed(future_to_lang), start=1):
+            lang = future_to_lang[future]
+            results[lang] = future.result()  # 작업자 오류는 여기서 전파됨
+
+            if progress_callback:
+                percent = 10 + int(completed / len(files) * 30)
+                progress_callback(percent, f"{lang} 파일 읽기 완료 ({completed}/{len(files)})")
+    finally:
+        # 오류 시 남은 작업은 시작하지 않고 정리
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+def check_status_consistency(
+    files: Dict[str, Path],
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    max_workers: Optional[int] = None
 ) -> Tuple[List[Dict], Dict[str, Dict[str, int]]]:
     """
     Status 통일 여부 검증 + 통계 계산
@@ -204,17 +347,47 @@ def check_status_consistency(
     Args:
         files: {언어코드: Path} (7개 언어 파일)
         progress_callback: (percent, message) 진행 상황 콜백
+        max_workers: 파일 읽기 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 읽기)
 
     Returns:
         (inconsistencies, statistics)
         - inconsistencies: 불일치하는 키 목록
         - statistics: 각 언어별 Status 통계
 
+    예외:
+        - 7개 파일이 아니면 StatusCheckError
+    """
+    inconsistencies, statistics, _ = _check_status_consistency(files, progress_callback, max_workers)
+    return inconsistencies, statistics
+
+
+def _check_status_consistency(
+    files: Dict[str, Path],
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    max_workers: Optional[int] = None
+) -> Tuple[List[Dict], Dict[str, Dict[str, int]], Dict[str, int]]:
+    """
+    Status 통일 여부 검증 + 통계 + EN Source 단어 수 계산
+
+    각 언어 파일은 한 번만 읽습니다 (EN은 같은 순회에서 단어 수까지 계산).
+    max_workers가 2 이상이면 7개 파일을 프로세스 풀에서 동시에 읽습니다.
+
+    Args:
+        files: {언어코드: Path} (7개 언어 파일)
+        progress_callback: (percent, message) 진행 상황 콜백
+        max_workers: 파일 읽기 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 읽기)
+
+    Returns:
+        (inconsistencies, statistics, korean_word_counts)
+        - inconsistencies: 불일치하는 키 목록
+        - statistics: 각 언어별 Status 통계
+        - korean_word_counts: EN '번역필요'/'수정' Source 단어 수
+
     처리 규칙:
         1. EN 파일의 모든 KEY를 기준으로 수집
-        2. 각 KEY에 대해 7개 언어의 Status 수집
+        2. 각 KEY에 대해 7개 언어의 Status를 코드 배열로 정렬 (없으면 'Missing')
         3. Status가 모두 동일하면 일치, 하나라도 다르면 불일치
-        4. 불일치하는 KEY만 반환
+        4. 불일치하는 KEY만 반환 (KEY 정렬 순서)
 
     예외:
         - 7개 파일이 아니면 StatusCheckError
@@ -241,57 +414,46 @@ def check_status_consistency(
     if progress_callback:
         progress_callback(10, "파일 읽기 중...")
 
-    # 3. 각 언어 파일 읽기
-    all_data = {}
-    for idx, (lang, file_path) in enumerate(files.items()):
-        if progress_callback:
-            percent = 10 + int((idx + 1) / 7 * 30)
-            progress_callback(percent, f"{lang} 파일 읽기 중 ({idx + 1}/7)...")
+    # 3. 각 언어 파일 읽기 (KEY→Status, 통계, EN 단어 수를 한 번에 수집)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(files))
 
-        all_data[lang] = read_language_file(file_path)
+    if max_workers > 1:
+        scanned = _scan_files_parallel(files, max_workers, progress_callback)
+    else:
+        scanned = _scan_files_sequential(files, progress_callback)
+
+    all_data = {lang: scanned[lang][0] for lang in VALID_LANGUAGES}
+    korean_word_counts = scanned['EN'][2]
 
     if progress_callback:
         progress_callback(40, "Status 비교 중...")
 
-    # 4. 통계 계산
-    statistics = calculate_status_statistics(all_data)
-
-    # 5. EN 파일의 모든 KEY 수집 (기준)
-    en_keys = set(all_data['EN'].keys())
-
-    # 6. 각 KEY별 Status 비교
-    inconsistencies = []
-    total_keys = len(en_keys)
-
-    for idx, key in enumerate(sorted(en_keys)):
-        if progress_callback and idx % 100 == 0:
-            percent = 40 + int((idx + 1) / total_keys * 50)
-            progress_callback(percent, f"비교 중... ({idx + 1}/{total_keys})")
-
-        # 각 언어에서 이 KEY의 Status 수집
-        statuses = {}
-        for lang in VALID_LANGUAGES:
-            # 해당 언어 파일에 KEY가 있으면 Status, 없으면 'Missing'
-            statuses[lang] = all_data[lang].get(key, 'Missing')
+    # 4. 통계 (언어 순서 정렬)
+    statistics = {lang: scanned[lang][1] for lang in VALID_LANGUAGES}
 
-        # 모든 Status가 동일한지 확인
-        unique_statuses = set(statuses.values())
-        is_consistent = len(unique_statuses) == 1
+    # 5. EN 파일의 모든 KEY (기준) → 언어별 Status 코드 배열
+    en_keys = sorted(all_data['EN'])
+    columns, status_names = encode_status_columns(all_data, en_keys)
 
-        # 불일치하는 경우만 결과에 추가
-        if not is_consistent:
-            inconsistencies.append({
-                'key': key,
-                'statuses': statuses,
-                'is_consistent': False
-            })
+    # 6. 모든 Status가 동일하지 않은 KEY만 결과에 추가
+    mask = find_inconsistent_rows(columns)
+    inconsistencies = [
+        {
+            'key': en_keys[idx],
+            'statuses': {lang: status_names[columns[lang][idx]] for lang in VALID_LANGUAGES},
+            'is_consistent': False
+        }
+        for idx in compress(range(len(en_keys)), mask)
+    ]
 
     # 소요 시간 계산
     elapsed_time = time.time() - start_time
     if progress_callback:
         progress_callback(90, f"비교 완료. 소요 시간: {int(elapsed_time)}초")
 
-    return inconsistencies, statistics
+    return inconsistencies, statistics, korean_word_counts
 
 
 def create_status_check_output(
@@ -521,7 +683,8 @@ def create_status_check_output(
 def status_check(
     files: Dict[str, Path],
     output_path: Path,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    max_workers: Optional[int] = None
 ) -> int:
     """
     Status Check 전체 프로세스 실행
@@ -530,6 +693,7 @@ def status_check(
         files: {언어코드: Path}
         output_path: 출력 파일 경로
         progress_callback: (percent, message) 진행 상황 콜백
+        max_workers: 파일 읽기 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 읽기)
 
     Returns:
         불일치하는 키의 개수
@@ -537,18 +701,13 @@ def status_check(
     예외:
         StatusCheckError: 처리 중 오류 발생
     """
-    # Step 1: Status 비교 + 통계 계산
-    inconsistencies, statistics = check_status_consistency(files, progress_callback)
+    # Step 1: Status 비교 + 통계 + 한국어 단어 수 계산 (파일마다 한 번만 읽음)
+    inconsistencies, statistics, word_counts = _check_status_consistency(
+        files, progress_callback, max_workers
+    )
 
-    # Step 2: 한국어 단어 수 계산 (조건부: 불일치 0개일 때만)
-    korean_word_counts = None
-    if len(inconsistencies) == 0:
-        # 모든 Status가 동일 → 한국어 단어 수 계산
-        if progress_callback:
-            progress_callback(91, "한국어 단어 수 계산 중...")
-        
-        en_file_path = files['EN']
-        korean_word_counts = calculate_korean_word_count(en_file_path)
+    # Step 2: 한국어 단어 수는 불일치 0개일 때만 출력
+    korean_word_counts = word_counts if len(inconsistencies) == 0 else None
 
     # Step 3: 결과 출력 (통계 + 한국어 단어 수 포함)
     create_status_check_output(
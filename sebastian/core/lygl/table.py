@@ -0,0 +1,252 @@
+"""
+언어 테이블 모듈
+
+LY/GL 언어별 데이터를 행 리스트 대신 컬럼 배열로 보관합니다.
+헤더는 데이터와 분리되어 있으며, 필터링은 행을 복사하지 않고 행 위치만 고르는 뷰를 반환합니다.
+"""
+
+from itertools import compress, islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .reader import LANGUAGE_FILE_HEADERS, open_sheet, read_header, iter_language_rows
+
+
+# 행 → 컬럼 변환 시 한 번에 처리할 행 수 (행 튜플을 모두 들고 있지 않도록 나눠서 변환)
+_TRANSPOSE_CHUNK_SIZE = 4096
+
+
+class LanguageTable:
+    """
+    언어별 데이터 테이블 (컬럼 배열 + KEY 인덱스)
+
+    - columns: 헤더 순서대로의 컬럼별 값 리스트
+    - select(): 같은 컬럼 배열을 공유하는 뷰 반환 (행 복사 없음)
+    - key_index: {KEY: 행 위치} (필요할 때 한 번 생성)
+    """
+
+    __slots__ = ('headers', 'columns', '_positions', '_key_index')
+
+    def __init__(
+        self,
+        headers: Sequence[str] = LANGUAGE_FILE_HEADERS,
+        columns: Optional[List[List]] = None,
+        positions: Optional[List[int]] = None
+    ):
+        self.headers = list(headers)
+        self.columns = columns if columns is not None else [[] for _ in self.headers]
+        self._positions = positions  # None이면 전체 행, 아니면 선택된 행 위치 목록
+        self._key_index = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence], headers: Sequence[str] = LANGUAGE_FILE_HEADERS) -> 'LanguageTable':
+        """
+        행 목록으로 테이블 생성
+
+        Args:
+            rows: 헤더 길이와 같은 길이의 행 목록 (헤더 행 제외)
+            headers: 컬럼명 목록
+
+        Returns:
+            LanguageTable 객체
+        """
+        table = cls(headers)
+        table.extend_rows(rows)
+        return table
+
+    @property
+    def is_view(self) -> bool:
+        """select()로 만든 뷰 여부"""
+        return self._positions is not None
+
+    def extend_rows(self, rows: Iterable[Sequence]) -> None:
+        """
+        행 목록을 컬럼 배열 끝에 추가
+
+        Args:
+            rows: 헤더 길이와 같은 길이의 행 목록
+
+        Raises:
+            ValueError: 뷰에 추가하려는 경우
+        """
+        if self.is_view:
+            raise ValueError("select()로 만든 뷰에는 행을 추가할 수 없습니다.")
+
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, _TRANSPOSE_CHUNK_SIZE))
+            if not chunk:
+                break
+            for column, values in zip(self.columns, zip(*chunk)):
+                column.extend(values)
+
+        self._key_index = None
+
+    def extend(self, other: 'LanguageTable') -> None:
+        """다른 테이블의 행을 끝에 추가 (컬럼 순서 동일해야 함)"""
+        if self.is_view:
+            raise ValueError("select()로 만든 뷰에는 행을 추가할 수 없습니다.")
+
+        for column, values in zip(self.columns, other.iter_columns()):
+            column.extend(values)
+
+        self._key_index = None
+
+    def __len__(self) -> int:
+        if self._positions is not None:
+            return len(self._positions)
+        return len(self.columns[0]) if self.columns else 0
+
+    def column(self, name: str) -> List:
+        """
+        컬럼 값 목록
+
+        전체 테이블은 내부 리스트를 그대로 반환하므로 수정하지 마세요.
+        뷰는 선택된 행의 값으로 새 리스트를 만듭니다.
+        """
+        values = self.columns[self.headers.index(name)]
+        if self._positions is None:
+            return values
+        return [values[pos] for pos in self._positions]
+
+    def iter_columns(self) -> Iterator[List]:
+        """헤더 순서대로 컬럼 값 목록 반환"""
+        for name in self.headers:
+            yield self.column(name)
+
+    def iter_rows(self) -> Iterator[Tuple]:
+        """행 튜플 반환 (헤더 제외)"""
+        if self._positions is None:
+            return zip(*self.columns)
+        return zip(*(map(column.__getitem__, self._positions) for column in self.columns))
+
+    def row(self, index: int) -> List:
+        """index번째 행 (0부터, 헤더 제외)"""
+        pos = index if self._positions is None else self._positions[index]
+        return [column[pos] for column in self.columns]
+
+    def to_rows(self, include_header: bool = True) -> List[List]:
+        """[[헤더], [행1], ...] 형식으로 변환"""
+        rows = [list(self.headers)] if include_header else []
+        rows.extend(list(row) for row in self.iter_rows())
+        return rows
+
+    def compact(self) -> 'LanguageTable':
+        """
+        선택된 행만 담은 전체 테이블 반환
+
+        뷰를 다른 프로세스로 보낼 때 사용합니다 (공유 컬럼 전체가 아닌 선택된 행만 전달).
+        전체 테이블은 그대로 반환합니다.
+        """
+        if self._positions is None:
+            return self
+        return LanguageTable(self.headers, list(self.iter_columns()))
+
+    def select(self, mask: Sequence) -> 'LanguageTable':
+        """
+        keep 마스크로 행을 고른 뷰 반환
+
+        컬럼 배열은 복사하지 않고 공유하며, 선택된 행 위치만 보관합니다.
+
+        Args:
+            mask: 현재 행 수와 같은 길이의 참/거짓 시퀀스 (True/1 = 유지)
+
+        Returns:
+            LanguageTable 뷰
+        """
+        if len(mask) != len(self):
+            raise ValueError(f"마스크 길이({len(mask)})가 행 수({len(self)})와 다릅니다.")
+
+        return self.take(list(compress(range(len(self)), mask)))
+
+    def take(self, positions: List[int]) -> 'LanguageTable':
+        """
+        행 위치 목록으로 행을 고른 뷰 반환
+
+        Args:
+            positions: 현재 행 기준 위치 목록 (0부터, 오름차순)
+
+        Returns:
+            LanguageTable 뷰 (전체 테이블이면 positions 리스트를 그대로 공유)
+        """
+        if self._positions is not None:
+            positions = [self._positions[pos] for pos in positions]
+        return LanguageTable(self.headers, self.columns, positions)
+
+    def replace_values(self, name: str, mapping: Dict) -> int:
+        """
+        컬럼 값 일괄 치환 (선택된 행만)
+
+        뷰는 원본 테이블과 컬럼 배열을 공유하므로 원본에도 반영됩니다.
+
+        Args:
+            name: 컬럼명
+            mapping: {이전 값: 새 값}
+
+        Returns:
+            치환된 셀 수
+        """
+        values = self.columns[self.headers.index(name)]
+        positions = range(len(values)) if self._positions is None else self._positions
+
+        replaced = 0
+        for pos in positions:
+            value = values[pos]
+            if value in mapping:
+                values[pos] = mapping[value]
+                replaced += 1
+
+        return replaced
+
+    @property
+    def key_index(self) -> Dict:
+        """
+        {KEY: 행 위치} 매핑 (0부터, 헤더 제외)
+
+        KEY가 중복되면 마지막 행 위치가 남습니다.
+        """
+        if self._key_index is None:
+            self._key_index = {key: idx for idx, key in enumerate(self.column('KEY'))}
+        return self._key_index
+
+
+def select_all(tables: Dict[str, LanguageTable], mask: Sequence) -> Dict[str, LanguageTable]:
+    """
+    같은 keep 마스크를 여러 테이블에 한 번에 적용
+
+    유지할 행 위치는 마스크에서 한 번만 계산하고 모든 테이블이 공유합니다.
+
+    Args:
+        tables: {이름: LanguageTable} (모두 마스크와 같은 행 수)
+        mask: 참/거짓 시퀀스 (True/1 = 유지)
+
+    Returns:
+        {이름: LanguageTable 뷰}
+
+    Raises:
+        ValueError: 행 수가 마스크 길이와 다른 테이블이 있는 경우
+    """
+    for name, table in tables.items():
+        if len(table) != len(mask):
+            raise ValueError(f"{name} 행 수({len(table)})가 마스크 길이({len(mask)})와 다릅니다.")
+
+    positions = list(compress(range(len(mask)), mask))
+    return {name: table.take(positions) for name, table in tables.items()}
+
+
+def read_language_table(file_path: Path, data_only: bool = False) -> Tuple[List, LanguageTable]:
+    """
+    언어별 파일을 읽어 LanguageTable로 반환
+
+    Args:
+        file_path: 언어별 파일 경로
+        data_only: True면 수식 대신 캐시된 값을 읽음
+
+    Returns:
+        (실제 헤더 리스트, LanguageTable)
+    """
+    with open_sheet(file_path, data_only=data_only) as ws:
+        headers = read_header(ws)
+        table = LanguageTable.from_rows(iter_language_rows(ws))
+
+    return headers, table
@@ -5,7 +5,7 @@ PRD 섹션 2.2 "Core Functionalities"에 정의된 데이터 무결성 규칙을
 """
 
 import re
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
 from pathlib import Path
 
 
@@ -202,6 +202,16 @@ def validate_key(key, row_num: int = 0, file_name: str = "") -> None:
         raise ValidationError(f"Empty KEY found in {file_name} at row {row_num}")
 
 
+# 언어 파일 간 일치해야 하는 공통 필드 (Date 제거: 파일별 시간 차이 허용)
+ROW_MATCH_FIELDS = ["Table", "Source", "Status", "NOTE"]
+
+# 빈 값(None, '')을 동일하게 취급하는 필드
+EMPTY_EQUIVALENT_FIELDS = ("NOTE", "Date")
+
+# 오류 메시지에 표시할 최대 불일치 건수 (전체 목록은 ValidationError.params에 보관)
+MAX_REPORTED_MISMATCHES = 50
+
+
 def validate_row_match(
     key: str,
     en_row: Dict,
@@ -223,22 +233,89 @@ def validate_row_match(
         ValidationError: 필드 불일치 시
     """
     if check_fields is None:
-        check_fields = ["Table", "Source", "Status", "NOTE"]  # Date 제거 (파일별 시간 차이 허용)
+        check_fields = ROW_MATCH_FIELDS
 
     for field in check_fields:
         en_value = en_row.get(field)
         lang_value = lang_row.get(field)
 
         # NOTE, Date 필드는 빈 값 정규화 (None과 '' 동일 처리)
-        if field in ["NOTE", "Date"]:
+        if field in EMPTY_EQUIVALENT_FIELDS:
             en_value = en_value if en_value else ""
             lang_value = lang_value if lang_value else ""
 
         if en_value != lang_value:
-            raise ValidationError(
-                f"{field} mismatch for KEY '{key}': "
-                f"EN={en_value}, {lang_code}={lang_value}"
-            )
+            raise ValidationError(format_mismatch(key, field, en_value, lang_value, lang_code))
+
+
+def find_column_mismatches(
+    keys: Sequence,
+    en_columns: Dict[str, Sequence],
+    lang_columns: Dict[str, Sequence],
+    check_fields: Optional[List[str]] = None,
+) -> List[Tuple[int, str, str, object, object]]:
+    """
+    KEY로 정렬된 EN/언어 컬럼의 공통 필드 불일치를 한 번에 검출
+
+    행마다 dict를 만들지 않고 필드 값 튜플을 비교하며,
+    다른 행만 필드별로 다시 확인합니다.
+
+    Args:
+        keys: KEY 컬럼 (en_columns/lang_columns의 각 컬럼과 같은 길이, 같은 행 순서)
+        en_columns: {필드명: EN 컬럼} (keys 순서로 정렬된 값)
+        lang_columns: {필드명: 언어 컬럼}
+        check_fields: 검증할 필드 목록 (기본: ROW_MATCH_FIELDS)
+
+    Returns:
+        [(행 위치, KEY, 필드명, EN 값, 언어 값), ...] (행 순서 → 필드 순서)
+        NOTE/Date 값은 빈 값 정규화 후의 값입니다.
+    """
+    if check_fields is None:
+        check_fields = ROW_MATCH_FIELDS
+
+    def _column(columns, field):
+        values = columns[field]
+        if field in EMPTY_EQUIVALENT_FIELDS:
+            return [value if value else "" for value in values]
+        return values
+
+    en_values = zip(*(_column(en_columns, field) for field in check_fields))
+    lang_values = zip(*(_column(lang_columns, field) for field in check_fields))
+
+    mismatches = []
+    for idx, (key, en_row, lang_row) in enumerate(zip(keys, en_values, lang_values)):
+        if en_row == lang_row:
+            continue
+        for field, en_value, lang_value in zip(check_fields, en_row, lang_row):
+            if en_value != lang_value:
+                mismatches.append((idx, key, field, en_value, lang_value))
+
+    return mismatches
+
+
+def format_mismatch(key, field: str, en_value, lang_value, lang_code: str) -> str:
+    """공통 필드 불일치 메시지 (validate_row_match와 같은 형식)"""
+    return f"{field} mismatch for KEY '{key}': EN={en_value}, {lang_code}={lang_value}"
+
+
+def raise_mismatch_errors(errors: List[str]) -> None:
+    """
+    불일치 메시지 목록을 하나의 ValidationError로 발생
+
+    Args:
+        errors: 오류 메시지 목록 (비어 있으면 아무 것도 하지 않음)
+
+    Raises:
+        ValidationError: 오류가 1건 이상일 때 (params['errors']에 전체 목록)
+    """
+    if not errors:
+        return
+
+    lines = errors[:MAX_REPORTED_MISMATCHES]
+    if len(errors) > MAX_REPORTED_MISMATCHES:
+        lines.append(f"... and {len(errors) - MAX_REPORTED_MISMATCHES} more mismatches")
+
+    raise ValidationError("\n".join(lines), errors=errors)
 
 
 def normalize_empty_value(value) -> str:
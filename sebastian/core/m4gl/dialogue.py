@@ -3,9 +3,10 @@ import os
 import datetime
 import time
 import stat
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Border, Side
-from openpyxl.worksheet.worksheet import Worksheet
+from concurrent.futures import ProcessPoolExecutor
+
+from .reader import read_excel_columns
+from .writer import write_master_file
 
 
 def profile_function(func):
@@ -20,16 +21,71 @@ def profile_function(func):
 
 
 @profile_function
-def read_excel_file(file_path, sheet_name, header_row, skip_rows):
+def read_excel_file(file_path, sheet_name, header_row, skip_rows, columns):
+    """필요한 열(columns: 원본 열 인덱스)만 읽기, 결과 열 이름은 원본 열 인덱스"""
     start_time = time.time()
-    df = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row, skiprows=skip_rows)
+    df = read_excel_columns(file_path, sheet_name, header_row, skip_rows, columns)
     end_time = time.time()
     print(f"파일 읽기 시간 ({os.path.basename(file_path)}): {end_time - start_time:.2f}초")
     return df
 
 
+# 언어 데이터 열 매핑 (결과 열: (CINEMATIC 열 인덱스, SMALLTALK 열 인덱스))
+LANGUAGE_MAPPING = {
+    'KO (M)': (11, 12),
+    'KO (F)': (12, 13),
+    'EN (M)': (13, 14),
+    'EN (F)': (14, 15),
+    'CT (M)': (15, 16),
+    'CT (F)': (16, 17),
+    'CS (M)': (17, 18),
+    'CS (F)': (18, 19),
+    'JA (M)': (19, 20),
+    'JA (F)': (20, 21),
+    'TH (M)': (21, 22),
+    'TH (F)': (22, 23),
+    'ES-LATAM (M)': (23, 24),
+    'ES-LATAM (F)': (24, 25),
+    'PT-BR (M)': (25, 26),
+    'PT-BR (F)': (26, 27),
+    'NOTE': (29, 30)
+}
+
+
+# 원본 파일별로 읽을 열 (OnOFF, String ID, NPC ID + 언어 열)
+CINEMATIC_COLUMNS = [6, 7, 8] + [cin_idx for cin_idx, _ in LANGUAGE_MAPPING.values()]
+SMALLTALK_COLUMNS = [6, 7, 8] + [small_idx for _, small_idx in LANGUAGE_MAPPING.values()]
+NPC_COLUMNS = [7, 9]  # H열 유니크 아이디, J열 NPC 이름
+
+
+# ProcessPoolExecutor에서 사용할 함수는 반드시 글로벌로 정의해야 함
+def read_dialogue_source(file_path, skip_rows, columns):
+    """DIALOGUE 원본 파일(두 번째 시트)을 읽어 글로벌 OnOFF=1 행만 반환"""
+    data = read_excel_file(file_path, sheet_name=1, header_row=1, skip_rows=skip_rows, columns=columns)
+    # 글로벌 OnOFF=1 필터링 (G열, 인덱스 6)
+    return data[data[6] == 1]
+
+
+# ProcessPoolExecutor에서 사용할 함수는 반드시 글로벌로 정의해야 함
+def read_npc_source(file_path):
+    """NPC 파일(NPC 시트)을 읽어 H열 유니크 아이디 중복을 제거한 데이터 반환"""
+    npc_data = read_excel_file(file_path, sheet_name='NPC', header_row=1, skip_rows=None, columns=NPC_COLUMNS)
+    return npc_data.drop_duplicates(subset=7)
+
+
 # 데이터 읽기 전에 먼저 파일이 존재하는지 확인하고, 열이 존재하는지 확인
-def merge_dialogue(folder_path: str, progress_queue) -> None:
+def merge_dialogue(folder_path: str, progress_queue, max_workers=None) -> None:
+    """
+    CINEMATIC/SMALLTALK 대사와 NPC 이름을 MIR4_MASTER_DIALOGUE 파일로 병합
+
+    3개 원본 파일은 프로세스 풀에서 동시에 읽기 시작하고,
+    각 데이터가 처음 필요한 시점에 읽기 결과를 기다립니다.
+
+    Args:
+        folder_path: 원본 파일 폴더
+        progress_queue: 진행 메시지 Queue
+        max_workers: 파일 읽기 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 읽기)
+    """
     start_time = time.time()
     try:
         # 파일 경로 설정
@@ -48,127 +104,123 @@ def merge_dialogue(folder_path: str, progress_queue) -> None:
         if missing_files:
             raise FileNotFoundError("\n".join(missing_files))
 
-        # 단계 정보 전송
-        progress_queue.put("단계:1/3")
-        progress_queue.put("파일:CINEMATIC_DIALOGUE.xlsm")
-
-        # 데이터 읽기
-        cinematic_data = read_excel_file(cinematic_path, sheet_name=1, header_row=1, skip_rows=9)
-        # 글로벌 OnOFF=1 필터링 (G열, 인덱스 6)
-        cinematic_data = cinematic_data[cinematic_data.iloc[:, 6] == 1]
-        
-        # 시간 계산 및 전송
-        elapsed = int(time.time() - start_time)
-        remaining = int((elapsed / 20) * 80) if elapsed > 0 else 0
-        progress_queue.put(("time", elapsed, remaining))
-        
-        progress_queue.put(20)
-        progress_queue.put("처리된 파일:1")
-
-        progress_queue.put("파일:SMALLTALK_DIALOGUE.xlsm")
-        smalltalk_data = read_excel_file(smalltalk_path, sheet_name=1, header_row=1, skip_rows=4)
-        # 글로벌 OnOFF=1 필터링 (G열, 인덱스 6)
-        smalltalk_data = smalltalk_data[smalltalk_data.iloc[:, 6] == 1]
-        
-        # 시간 계산 및 전송
-        elapsed = int(time.time() - start_time)
-        remaining = int((elapsed / 40) * 60) if elapsed > 0 else 0
-        progress_queue.put(("time", elapsed, remaining))
-        
-        progress_queue.put(40)
-        progress_queue.put("처리된 파일:2")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
 
-        # 단계 업데이트
-        progress_queue.put("단계:2/3")
-        progress_queue.put("파일:데이터 병합 중...")
-
-        # 열 인덱스가 범위를 벗어나지 않는지 확인
-        cinematic_cols = cinematic_data.shape[1]
-        smalltalk_cols = smalltalk_data.shape[1]
-
-        # 결과물 파일의 헤더 설정
-        headers = ['#', 'Table Name', 'String ID', 'Table/ID', 'NPC ID', 'Speaker Name',
-                   'KO (M)', 'KO (F)', 'EN (M)', 'EN (F)', 'CT (M)', 'CT (F)', 'CS (M)',
-                   'CS (F)', 'JA (M)', 'JA (F)', 'TH (M)', 'TH (F)', 'ES-LATAM (M)', 'ES-LATAM (F)',
-                   'PT-BR (M)', 'PT-BR (F)', 'NOTE']
-
-        # 결과 데이터 프레임 생성 - 미리 열을 생성해둠
-        result_df = pd.DataFrame(columns=headers)
-
-        # 각 데이터프레임의 길이 확인
-        cin_len = len(cinematic_data)
-        small_len = len(smalltalk_data)
-        total_len = cin_len + small_len
-
-        # 결과 데이터프레임에 필요한 개수만큼 행 추가 (빈 행으로)
-        result_df = pd.DataFrame(index=range(total_len), columns=headers)
-
-        # 인덱스 열 채우기
-        result_df['#'] = range(1, total_len + 1)
+        # 3개 파일 읽기를 한 번에 시작 (NPC는 3단계에서 처음 사용)
+        sources = {
+            'cinematic': (read_dialogue_source, cinematic_path, 9, CINEMATIC_COLUMNS),
+            'smalltalk': (read_dialogue_source, smalltalk_path, 4, SMALLTALK_COLUMNS),
+            'npc': (read_npc_source, npc_path),
+        }
+        max_workers = min(max_workers, len(sources))
+        executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
 
-        # Table Name 열 채우기
-        result_df.loc[:cin_len-1, 'Table Name'] = 'CINEMATIC_DIALOGUE'
-        result_df.loc[cin_len:, 'Table Name'] = 'SMALLTALK_DIALOGUE'
+        def load(name):
+            """읽기 결과 반환 (병렬 읽기면 완료될 때까지 대기)"""
+            if executor:
+                return futures[name].result()
+            function, *args = sources[name]
+            return function(*args)
 
-        # 안전하게 열 인덱스 확인하고 데이터 할당
-        # String ID 열 (인덱스 7)
-        if 7 < cinematic_cols and 7 < smalltalk_cols:
-            result_df.loc[:cin_len-1, 'String ID'] = cinematic_data.iloc[:, 7].values
-            result_df.loc[cin_len:, 'String ID'] = smalltalk_data.iloc[:, 7].values
+        try:
+            futures = {name: executor.submit(*task) for name, task in sources.items()} if executor else {}
 
-        # Table/ID 열 생성
-        result_df['Table/ID'] = result_df['Table Name'] + '/' + result_df['String ID'].astype(str)
+            # 단계 정보 전송
+            progress_queue.put("단계:1/3")
+            progress_queue.put("파일:CINEMATIC_DIALOGUE.xlsm")
 
-        # NPC ID 열 (인덱스 8)
-        if 8 < cinematic_cols and 8 < smalltalk_cols:
-            result_df.loc[:cin_len-1, 'NPC ID'] = cinematic_data.iloc[:, 8].values
-            result_df.loc[cin_len:, 'NPC ID'] = smalltalk_data.iloc[:, 8].values
-
-        # 나머지 언어 데이터 열 매핑
-        language_mapping = {
-            'KO (M)': (11, 12),
-            'KO (F)': (12, 13),
-            'EN (M)': (13, 14),
-            'EN (F)': (14, 15),
-            'CT (M)': (15, 16),
-            'CT (F)': (16, 17),
-            'CS (M)': (17, 18),
-            'CS (F)': (18, 19),
-            'JA (M)': (19, 20),
-            'JA (F)': (20, 21),
-            'TH (M)': (21, 22),
-            'TH (F)': (22, 23),
-            'ES-LATAM (M)': (23, 24),
-            'ES-LATAM (F)': (24, 25),
-            'PT-BR (M)': (25, 26),
-            'PT-BR (F)': (26, 27),
-            'NOTE': (29, 30)
-        }
+            # 데이터 읽기
+            cinematic_data = load('cinematic')
+        
+            # 시간 계산 및 전송
+            elapsed = int(time.time() - start_time)
+            remaining = int((elapsed / 20) * 80) if elapsed > 0 else 0
+            progress_queue.put(("time", elapsed, remaining))
+        
+            progress_queue.put(20)
+            progress_queue.put("처리된 파일:1")
 
-        # 각 언어 열에 데이터 안전하게 채우기
-        for col_name, (cin_idx, small_idx) in language_mapping.items():
-            # 인덱스가 범위 내에 있는지 확인
-            if cin_idx < cinematic_cols and small_idx < smalltalk_cols:
-                result_df.loc[:cin_len-1, col_name] = cinematic_data.iloc[:, cin_idx].values
-                result_df.loc[cin_len:, col_name] = smalltalk_data.iloc[:, small_idx].values
-            else:
-                # 인덱스가 범위를 벗어나면 빈 값으로 설정
-                result_df[col_name] = ''
-
-        progress_queue.put(60)
-        progress_queue.put("단계:3/3")
-        progress_queue.put("파일:NPC.xlsm")
-
-        # 원본 3(NPC.xlsm) 데이터 읽기 (두 번째 시트)
-        npc_data = pd.read_excel(npc_path, sheet_name='NPC', header=1)
-        npc_data = npc_data.drop_duplicates(subset=npc_data.columns[7])
-        progress_queue.put("처리된 파일:3")
+            progress_queue.put("파일:SMALLTALK_DIALOGUE.xlsm")
+            smalltalk_data = load('smalltalk')
+        
+            # 시간 계산 및 전송
+            elapsed = int(time.time() - start_time)
+            remaining = int((elapsed / 40) * 60) if elapsed > 0 else 0
+            progress_queue.put(("time", elapsed, remaining))
+        
+            progress_queue.put(40)
+            progress_queue.put("처리된 파일:2")
+
+            # 단계 업데이트
+            progress_queue.put("단계:2/3")
+            progress_queue.put("파일:데이터 병합 중...")
+
+            # 결과물 파일의 헤더 설정
+            headers = ['#', 'Table Name', 'String ID', 'Table/ID', 'NPC ID', 'Speaker Name',
+                       'KO (M)', 'KO (F)', 'EN (M)', 'EN (F)', 'CT (M)', 'CT (F)', 'CS (M)',
+                       'CS (F)', 'JA (M)', 'JA (F)', 'TH (M)', 'TH (F)', 'ES-LATAM (M)', 'ES-LATAM (F)',
+                       'PT-BR (M)', 'PT-BR (F)', 'NOTE']
+
+            # 결과 데이터 프레임 생성 - 미리 열을 생성해둠
+            result_df = pd.DataFrame(columns=headers)
+
+            # 각 데이터프레임의 길이 확인
+            cin_len = len(cinematic_data)
+            small_len = len(smalltalk_data)
+            total_len = cin_len + small_len
+
+            # 결과 데이터프레임에 필요한 개수만큼 행 추가 (빈 행으로)
+            result_df = pd.DataFrame(index=range(total_len), columns=headers)
+
+            # 인덱스 열 채우기
+            result_df['#'] = range(1, total_len + 1)
+
+            # Table Name 열 채우기
+            result_df.loc[:cin_len-1, 'Table Name'] = 'CINEMATIC_DIALOGUE'
+            result_df.loc[cin_len:, 'Table Name'] = 'SMALLTALK_DIALOGUE'
+
+            # 안전하게 열 인덱스 확인하고 데이터 할당
+            # String ID 열 (인덱스 7)
+            if 7 in cinematic_data and 7 in smalltalk_data:
+                result_df.loc[:cin_len-1, 'String ID'] = cinematic_data[7].values
+                result_df.loc[cin_len:, 'String ID'] = smalltalk_data[7].values
+
+            # Table/ID 열 생성
+            result_df['Table/ID'] = result_df['Table Name'] + '/' + result_df['String ID'].astype(str)
+
+            # NPC ID 열 (인덱스 8)
+            if 8 in cinematic_data and 8 in smalltalk_data:
+                result_df.loc[:cin_len-1, 'NPC ID'] = cinematic_data[8].values
+                result_df.loc[cin_len:, 'NPC ID'] = smalltalk_data[8].values
+
+            # 각 언어 열에 데이터 안전하게 채우기
+            for col_name, (cin_idx, small_idx) in LANGUAGE_MAPPING.items():
+                # 원본 시트에 열이 있는지 확인 (없는 열은 읽기 결과에서 제외됨)
+                if cin_idx in cinematic_data and small_idx in smalltalk_data:
+                    result_df.loc[:cin_len-1, col_name] = cinematic_data[cin_idx].values
+                    result_df.loc[cin_len:, col_name] = smalltalk_data[small_idx].values
+                else:
+                    # 인덱스가 범위를 벗어나면 빈 값으로 설정
+                    result_df[col_name] = ''
+
+            progress_queue.put(60)
+            progress_queue.put("단계:3/3")
+            progress_queue.put("파일:NPC.xlsm")
+
+            # 원본 3(NPC.xlsm) 데이터 읽기 (두 번째 시트)
+            npc_data = load('npc')
+            progress_queue.put("처리된 파일:3")
+        finally:
+            if executor:
+                # 오류 시 남은 읽기 작업은 시작하지 않고 정리
+                executor.shutdown(wait=False, cancel_futures=True)
 
         # 결과 파일의 'NPC ID' 열과 원본 3의 'H열 유니크 아이디' 열을 기준으로 'J열 NPC 이름' 값을 불러오기
         # 안전하게 매핑을 위해 try-except 구문 사용
         try:
             # Dictionary 매핑을 생성
-            npc_map = dict(zip(npc_data.iloc[:, 7], npc_data.iloc[:, 9]))
+            npc_map = dict(zip(npc_data[7], npc_data[9]))
             # 매핑된 값이 없으면 원래 값을 유지
             result_df['Speaker Name'] = result_df['NPC ID'].map(npc_map).fillna(result_df['NPC ID'])
         except Exception as e:
@@ -206,38 +258,8 @@ def merge_dialogue(folder_path: str, progress_queue) -> None:
             output_file = f'{date_str}_MIR4_MASTER_DIALOGUE_{counter}.xlsx'
             counter += 1
 
-        # 결과 파일 저장 (엑셀)
-        result_df.to_excel(output_file, index=False)
-
-        # 결과 파일 서식 지정
-        wb = load_workbook(output_file)
-        ws = wb.active
-
-        # 폰트 및 서식 설정
-        header_font = Font(name='맑은 고딕', size=12, bold=True, color='9C5700')
-        default_font = Font(name='맑은 고딕', size=10)
-        header_fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-        border_style = Side(border_style='thin', color='000000')
-        full_border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
-
-        # 헤더 행 서식 지정
-        if isinstance(ws, Worksheet):
-            for cell in ws[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.border = full_border
-
-            # 나머지 셀 서식 지정
-            for row in ws.iter_rows(min_row=2):
-                for cell in row:
-                    cell.font = default_font
-                    cell.border = full_border
-
-            # 틀 고정
-            ws.freeze_panes = 'A2'
-
-        # 서식 지정된 파일 저장
-        wb.save(output_file)
+        # 결과 파일 저장 (엑셀, 서식/틀 고정 포함 1회 저장)
+        write_master_file(output_file, result_df)
 
         # 결과 파일 읽기 전용 설정
         os.chmod(output_file, stat.S_IREAD)
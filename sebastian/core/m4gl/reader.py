@@ -0,0 +1,47 @@
+"""
+원본 파일 읽기 모듈
+
+M4GL 원본 xlsm 시트는 열이 40개 이상이지만 병합에는 OnOFF 열과 언어 열 일부만 사용합니다.
+필요한 열만 usecols로 읽어 파싱량과 메모리 사용량을 줄입니다.
+"""
+
+from typing import Iterable, Optional
+
+import pandas as pd
+
+
+def read_excel_columns(
+    file_path: str,
+    sheet_name,
+    header_row: int,
+    skip_rows: Optional[int],
+    columns: Iterable[Optional[int]]
+) -> pd.DataFrame:
+    """
+    시트에서 지정한 열만 읽기
+
+    결과 열 이름은 원본 열 인덱스이므로 data[7]처럼 원본 위치로 접근합니다.
+    시트에 없는 열은 결과에서 제외됩니다 (호출 측에서 `7 in data`로 확인).
+
+    Args:
+        file_path: 원본 파일 경로
+        sheet_name: 시트 이름 또는 인덱스
+        header_row: 헤더 행 (skip_rows 이후 기준)
+        skip_rows: 건너뛸 시작 행 수 (None이면 건너뛰지 않음)
+        columns: 읽을 원본 열 인덱스 (None 항목은 무시, 중복 허용)
+
+    Returns:
+        원본 열 인덱스 순서의 DataFrame
+    """
+    usecols = sorted({col for col in columns if col is not None})
+
+    try:
+        data = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row, skiprows=skip_rows, usecols=usecols)
+    except pd.errors.ParserError:
+        # 시트 열 수보다 큰 인덱스가 있으면 전체를 읽고 있는 열만 선택
+        data = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row, skiprows=skip_rows)
+        usecols = [col for col in usecols if col < data.shape[1]]
+        data = data.iloc[:, usecols]
+
+    data.columns = usecols
+    return data
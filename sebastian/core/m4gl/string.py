@@ -3,9 +3,10 @@ import os
 import datetime
 import time
 import stat
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Border, Side
-from openpyxl.worksheet.worksheet import Worksheet
+from concurrent.futures import ProcessPoolExecutor
+
+from .reader import read_excel_columns
+from .writer import write_master_file
 
 
 def profile_function(func):
@@ -20,15 +21,92 @@ def profile_function(func):
 
 
 @profile_function
-def read_excel_file(file_path, sheet_name, header_row, skip_rows):
+def read_excel_file(file_path, sheet_name, header_row, skip_rows, columns):
+    """필요한 열(columns: 원본 열 인덱스)만 읽기, 결과 열 이름은 원본 열 인덱스"""
     start_time = time.time()
-    df = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row, skiprows=skip_rows)
+    df = read_excel_columns(file_path, sheet_name, header_row, skip_rows, columns)
     end_time = time.time()
     print(f"파일 읽기 시간 ({os.path.basename(file_path)}): {end_time - start_time:.2f}초")
     return df
 
 
-def merge_string(folder_path: str, progress_queue) -> None:
+# 원본 열 인덱스(matching_columns)에 대응하는 결과 열
+STRING_COLUMNS = ['String ID', 'NOTE', 'KO', 'EN', 'CT', 'CS', 'JA', 'TH', 'ES-LATAM', 'PT-BR', 'NPC 이름', '비고']
+
+# 결과물 파일의 헤더
+STRING_HEADERS = ['#', 'Table Name', 'String ID', 'Table/ID'] + STRING_COLUMNS[1:]
+
+
+# ProcessPoolExecutor에서 사용할 함수는 반드시 글로벌로 정의해야 함
+def read_string_source(file_path, header_row, skip_rows, columns):
+    """
+    STRING 원본 파일 1개를 읽어 OnOFF=1 행의 필요한 열만 반환
+
+    OnOFF 열과 columns 열만 읽고, 작업 프로세스에서 필터링까지 마치므로
+    사용하지 않는 열은 파싱/전달되지 않습니다.
+
+    Args:
+        file_path: 원본 파일 경로
+        header_row: 헤더 행 (skip_rows 이후 기준)
+        skip_rows: 건너뛸 시작 행 수
+        columns: STRING_COLUMNS 순서의 원본 열 인덱스 (None이면 해당 열 없음)
+
+    Returns:
+        STRING_COLUMNS 중 원본에 있는 열만 담은 DataFrame
+    """
+    data = read_excel_file(file_path, sheet_name=1, header_row=header_row, skip_rows=skip_rows, columns=[6] + columns)
+    # 글로벌 OnOFF=1 필터링 (G열, 인덱스 6)
+    data = data[data[6] == 1]
+    return pd.DataFrame({
+        name: data[col]
+        for name, col in zip(STRING_COLUMNS, columns)
+        if col is not None
+    })
+
+
+def build_string_table(tables):
+    """
+    파일별 데이터를 한 번에 결합해 MIR4_MASTER_STRING 결과 테이블 생성
+
+    파일마다 누적 결합하지 않고 마지막에 1회만 결합하며,
+    Table Name/Table/ID/# 열은 결합 후 열 단위로 한 번에 만듭니다.
+
+    Args:
+        tables: [(Table Name, read_string_source() 결과), ...] (파일 순서)
+
+    Returns:
+        STRING_HEADERS 순서의 DataFrame (EN이 빈 셀/0/'미사용'인 행 제외)
+    """
+    result_df = pd.concat(
+        [data.reindex(columns=STRING_COLUMNS, fill_value='') for _, data in tables],
+        ignore_index=True
+    )
+    table_names = pd.Series([name for name, _ in tables]).repeat([len(data) for _, data in tables])
+
+    # String ID를 정수로 변환 (소수점 제거)
+    result_df['String ID'] = pd.to_numeric(result_df['String ID'], errors='coerce').fillna(0).astype('int64')
+    result_df.insert(0, 'Table Name', table_names.to_numpy())
+    result_df.insert(2, 'Table/ID', result_df['Table Name'] + '/' + result_df['String ID'].astype(str))
+
+    # EN 열이 빈 셀(NaN) 또는 0 또는 '미사용'인 행 제거
+    result_df = result_df[~(pd.isna(result_df['EN']) | result_df['EN'].isin([0, '미사용']))]
+
+    # 인덱스 열
+    result_df.insert(0, '#', range(1, len(result_df) + 1))
+    return result_df.reset_index(drop=True)
+
+
+def merge_string(folder_path: str, progress_queue, max_workers=None) -> None:
+    """
+    8개 STRING 원본 파일을 MIR4_MASTER_STRING 파일로 병합
+
+    원본 파일은 프로세스 풀에서 동시에 읽고, 결과는 고정된 파일 순서대로 병합합니다.
+
+    Args:
+        folder_path: 원본 파일 폴더
+        progress_queue: 진행 메시지 Queue
+        max_workers: 파일 읽기 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 읽기)
+    """
     start_time = time.time()
     try:
         # 파일 경로 설정
@@ -78,72 +156,57 @@ def merge_string(folder_path: str, progress_queue) -> None:
             "STRING_TOOLTIP.xlsm": [7, 8, 11, 12, 13, 14, 15, 16, 17, 18, None, None]
         }
 
-        # 결과물 파일의 헤더 설정
-        headers = ['#', 'Table Name', 'String ID', 'Table/ID', 'NOTE', 'KO', 'EN', 'CT', 'CS', 'JA', 'TH', 'ES-LATAM', 'PT-BR', 'NPC 이름', '비고']
-
-        # 결과 데이터 프레임 생성
-        result_df = pd.DataFrame(columns=headers)
+        # 파일별 데이터 (파일 순서, 결과 테이블은 마지막에 한 번만 결합)
+        tables = []
 
         # 단계 정보 전송
         progress_queue.put("단계:1/2")
         progress_queue.put("파일:파일 읽는 중...")
 
-        # 각 파일에서 데이터 읽어오기
-        for i, file in enumerate(file_list):
+        # 읽기 시작 전에 모든 파일 존재 확인
+        for file in file_list:
             file_path = os.path.join(folder_path, file)
             if not os.path.isfile(file_path):
                 progress_queue.put(("error", f"파일을 찾을 수 없습니다: {file_path}"))
                 return
 
-            progress_queue.put(f"파일:{file}")
-            data = read_excel_file(file_path, sheet_name=1, header_row=header_rows[file], skip_rows=start_rows[file])
-            # 글로벌 OnOFF=1 필터링 (G열, 인덱스 6)
-            data = data[data.iloc[:, 6] == 1]
-
-            # Table Name 열 채우기
-            table_name = file.replace(".xlsm", "")
-            temp_df = pd.DataFrame({
-                '#': range(len(result_df) + 1, len(result_df) + len(data) + 1),
-                'Table Name': table_name,
-                'String ID': data.iloc[:, matching_columns[file][0]] if matching_columns[file][0] is not None else '',
-                'Table/ID': table_name + '/' + data.iloc[:, matching_columns[file][0]].astype(str) if matching_columns[file][0] is not None else '',
-                'NOTE': data.iloc[:, matching_columns[file][1]] if matching_columns[file][1] is not None else '',
-                'KO': data.iloc[:, matching_columns[file][2]] if matching_columns[file][2] is not None else '',
-                'EN': data.iloc[:, matching_columns[file][3]] if matching_columns[file][3] is not None else '',
-                'CT': data.iloc[:, matching_columns[file][4]] if matching_columns[file][4] is not None else '',
-                'CS': data.iloc[:, matching_columns[file][5]] if matching_columns[file][5] is not None else '',
-                'JA': data.iloc[:, matching_columns[file][6]] if matching_columns[file][6] is not None else '',
-                'TH': data.iloc[:, matching_columns[file][7]] if matching_columns[file][7] is not None else '',
-                'ES-LATAM': data.iloc[:, matching_columns[file][8]] if matching_columns[file][8] is not None else '',
-                'PT-BR': data.iloc[:, matching_columns[file][9]] if matching_columns[file][9] is not None else '',
-                'NPC 이름': data.iloc[:, matching_columns[file][10]] if matching_columns[file][10] is not None else '',
-                '비고': data.iloc[:, matching_columns[file][11]] if matching_columns[file][11] is not None else ''
-            })
-            result_df = pd.concat([result_df, temp_df], ignore_index=True)
-
-            current_progress = int(20 + (50 / len(file_list)) * (i + 1))
-            
-            # 시간 계산 및 전송
-            elapsed = int(time.time() - start_time)
-            remaining = int((elapsed / current_progress) * (100 - current_progress)) if current_progress > 0 else 0
-            progress_queue.put(("time", elapsed, remaining))
-            
-            progress_queue.put(current_progress)
-            progress_queue.put(f"처리된 파일:{i+1}")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(file_list))
 
-        progress_queue.put("단계:2/2")
-        progress_queue.put("파일:결과 파일 저장 중...")
+        # 8개 파일 읽기를 한 번에 시작하고 결과는 파일 순서대로 사용
+        executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        try:
+            read_args = [
+                (os.path.join(folder_path, file), header_rows[file], start_rows[file], matching_columns[file])
+                for file in file_list
+            ]
+            futures = [executor.submit(read_string_source, *args) for args in read_args] if executor else []
+
+            for i, file in enumerate(file_list):
+                progress_queue.put(f"파일:{file}")
+                data = futures[i].result() if executor else read_string_source(*read_args[i])
+
+                tables.append((file.replace(".xlsm", ""), data))
+
+                current_progress = int(20 + (50 / len(file_list)) * (i + 1))
 
-        # String ID를 정수로 변환 (소수점 제거)
-        result_df['String ID'] = pd.to_numeric(result_df['String ID'], errors='coerce').fillna(0).astype('int64')
-        # Table/ID 재생성 (정수 기반)
-        result_df['Table/ID'] = result_df['Table Name'] + '/' + result_df['String ID'].astype(str)
+                # 시간 계산 및 전송
+                elapsed = int(time.time() - start_time)
+                remaining = int((elapsed / current_progress) * (100 - current_progress)) if current_progress > 0 else 0
+                progress_queue.put(("time", elapsed, remaining))
 
-        # 7번째 열(인덱스 6)이 빈 셀(NaN) 또는 0 또는 '미사용'인 행 제거
-        result_df = result_df[~(pd.isna(result_df.iloc[:, 6]) | result_df.iloc[:, 6].isin([0, '미사용']))]
+                progress_queue.put(current_progress)
+                progress_queue.put(f"처리된 파일:{i+1}")
+        finally:
+            if executor:
+                # 오류 시 남은 읽기 작업은 시작하지 않고 정리
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        progress_queue.put("단계:2/2")
+        progress_queue.put("파일:결과 파일 저장 중...")
 
-        # 인덱스 열 갱신
-        result_df['#'] = range(1, len(result_df) + 1)
+        result_df = build_string_table(tables)
 
         # 출력 파일 이름 설정
         date_str = datetime.datetime.now().strftime('%m%d')
@@ -155,38 +218,8 @@ def merge_string(folder_path: str, progress_queue) -> None:
             output_file = f'{date_str}_MIR4_MASTER_STRING_{counter}.xlsx'
             counter += 1
 
-        # 결과 파일 저장 (엑셀)
-        result_df.to_excel(output_file, index=False)
-
-        # 결과 파일 서식 지정
-        wb = load_workbook(output_file)
-        ws = wb.active
-
-        # 폰트 및 서식 설정
-        header_font = Font(name='맑은 고딕', size=12, bold=True, color='9C5700')
-        default_font = Font(name='맑은 고딕', size=10)
-        header_fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-        border_style = Side(border_style='thin', color='000000')
-        full_border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
-
-        # 헤더 행 서식 지정
-        if isinstance(ws, Worksheet):
-            for cell in ws[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.border = full_border
-
-            # 나머지 셀 서식 지정
-            for row in ws.iter_rows(min_row=2):
-                for cell in row:
-                    cell.font = default_font
-                    cell.border = full_border
-
-            # 틀 고정
-            ws.freeze_panes = 'A2'
-
-        # 서식 지정된 파일 저장
-        wb.save(output_file)
+        # 결과 파일 저장 (엑셀, 서식/틀 고정 포함 1회 저장)
+        write_master_file(output_file, result_df)
 
         # 결과 파일 읽기 전용 설정
         os.chmod(output_file, stat.S_IREAD)
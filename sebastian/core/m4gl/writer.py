@@ -0,0 +1,92 @@
+"""
+결과 파일 저장 모듈
+
+MIR4_MASTER_DIALOGUE/STRING 결과를 xlsxwriter로 서식과 함께 한 번에 저장합니다.
+(to_excel 저장 → openpyxl로 다시 열어 셀마다 서식 지정 → 재저장하던 과정을 대체)
+"""
+
+import datetime
+import math
+import numbers
+
+import pandas as pd
+import xlsxwriter
+
+
+# 헤더 서식 (맑은 고딕 12 굵게, 주황 글자/노랑 배경, 얇은 검정 테두리)
+HEADER_FORMAT = {
+    'font_name': '맑은 고딕',
+    'font_size': 12,
+    'bold': True,
+    'font_color': '#9C5700',
+    'bg_color': '#FFEB9C',
+    'pattern': 1,
+    'border': 1,
+    'border_color': '#000000',
+}
+
+# 데이터 셀 서식 (맑은 고딕 10, 얇은 검정 테두리)
+BODY_FORMAT = {
+    'font_name': '맑은 고딕',
+    'font_size': 10,
+    'border': 1,
+    'border_color': '#000000',
+}
+
+# 날짜 셀 표시 형식 (pandas to_excel 기본값과 동일)
+DATETIME_NUM_FORMAT = 'YYYY-MM-DD HH:MM:SS'
+DATE_NUM_FORMAT = 'YYYY-MM-DD'
+
+
+def write_master_file(output_file: str, result_df: pd.DataFrame, sheet_name: str = 'Sheet1') -> None:
+    """
+    결과 DataFrame을 서식이 지정된 xlsx 파일로 저장
+
+    constant_memory 모드로 헤더부터 행 순서대로 한 번만 기록하며,
+    빈 값(NaN/None/빈 문자열)도 테두리 서식을 가진 빈 셀로 기록합니다.
+    문자열은 수식/URL로 변환하지 않고 텍스트 그대로 기록합니다.
+
+    Args:
+        output_file: 출력 파일 경로
+        result_df: 결과 DataFrame (열 이름이 헤더)
+        sheet_name: 시트 이름
+    """
+    workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'remove_timezone': True})
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        header_format = workbook.add_format(HEADER_FORMAT)
+        body_format = workbook.add_format(BODY_FORMAT)
+        datetime_format = workbook.add_format({**BODY_FORMAT, 'num_format': DATETIME_NUM_FORMAT})
+        date_format = workbook.add_format({**BODY_FORMAT, 'num_format': DATE_NUM_FORMAT})
+
+        for col_num, name in enumerate(result_df.columns):
+            worksheet.write_string(0, col_num, str(name), header_format)
+
+        # 틀 고정 (A2)
+        worksheet.freeze_panes(1, 0)
+
+        # 열 단위로 값을 꺼낸 뒤 행 단위로 묶어서 순서대로 기록
+        columns = [result_df[col].tolist() for col in result_df.columns]
+        for row_num, row in enumerate(zip(*columns), start=1):
+            for col_num, value in enumerate(row):
+                if isinstance(value, str) and value:
+                    worksheet.write_string(row_num, col_num, value, body_format)
+                elif isinstance(value, bool):
+                    worksheet.write_boolean(row_num, col_num, value, body_format)
+                elif isinstance(value, numbers.Real):
+                    if math.isnan(value):
+                        worksheet.write_blank(row_num, col_num, None, body_format)
+                    elif math.isinf(value):
+                        worksheet.write_string(row_num, col_num, str(value), body_format)
+                    else:
+                        worksheet.write_number(row_num, col_num, value, body_format)
+                elif value is None or value is pd.NaT or value == '':
+                    worksheet.write_blank(row_num, col_num, None, body_format)
+                elif isinstance(value, datetime.datetime):
+                    worksheet.write_datetime(row_num, col_num, value, datetime_format)
+                elif isinstance(value, datetime.date):
+                    worksheet.write_datetime(row_num, col_num, value, date_format)
+                else:
+                    worksheet.write_string(row_num, col_num, str(value), body_format)
+    finally:
+        workbook.close()
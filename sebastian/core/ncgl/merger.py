@@ -11,6 +11,52 @@ def read_excel_file(file_path):
     return pd.read_excel(file_path)
 
 
+def write_string_all(output_path: str, result_df: pd.DataFrame) -> None:
+    """
+    StringALL 결과를 xlsxwriter constant_memory 모드로 스트리밍 저장
+
+    셀 단위 iloc 조회 대신 열 배열을 한 번만 꺼내 행 순서대로 기록하므로
+    행 수와 관계없이 메모리 사용량이 일정하게 유지됨
+    (constant_memory 모드는 행 순서대로만 기록 가능)
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet('Sheet1')
+
+        # 헤더 스타일 (가운데 정렬)
+        header_format = workbook.add_format({
+            'bold': True,
+            'text_wrap': True,
+            'valign': 'vcenter',
+            'align': 'center',
+            'fg_color': '#DAE9F8',
+            'font_name': '맑은 고딕',
+            'font_size': 10,
+            'border': 1
+        })
+        # 데이터 셀 스타일 (왼쪽 정렬 + 텍스트 서식)
+        cell_format = workbook.add_format({
+            'font_name': '맑은 고딕',
+            'font_size': 10,
+            'align': 'left',
+            'valign': 'vcenter',
+            'num_format': '@'  # 텍스트 서식
+        })
+        for col_num, value in enumerate(result_df.columns.values):
+            worksheet.write(0, col_num, value, header_format)
+            worksheet.set_column(col_num, col_num, 24, cell_format)
+
+        # 열 단위로 문자열 배열을 만든 뒤 행 단위로 묶어서 순서대로 기록
+        columns = [[str(value) for value in result_df[col].tolist()] for col in result_df.columns]
+        for row_num, row in enumerate(zip(*columns), start=1):
+            for col_num, value in enumerate(row):
+                worksheet.write_string(row_num, col_num, value, cell_format)
+    finally:
+        workbook.close()
+
+
 def merge_ncgl(folder_path: str, date: str, milestone: str, progress_queue) -> None:
     start_time = time.time()
 
@@ -84,39 +130,7 @@ def merge_ncgl(folder_path: str, date: str, milestone: str, progress_queue) -> N
         output_file = f"{date}_M{milestone}_StringALL.xlsx"
         output_path = os.path.join(folder_path, output_file)
         try:
-            import xlsxwriter
-            workbook = xlsxwriter.Workbook(output_path)
-            worksheet = workbook.add_worksheet('Sheet1')
-
-            # 헤더 스타일 (가운데 정렬)
-            header_format = workbook.add_format({
-                'bold': True,
-                'text_wrap': True,
-                'valign': 'vcenter',
-                'align': 'center',
-                'fg_color': '#DAE9F8',
-                'font_name': '맑은 고딕',
-                'font_size': 10,
-                'border': 1
-            })
-            # 데이터 셀 스타일 (왼쪽 정렬 + 텍스트 서식)
-            cell_format = workbook.add_format({
-                'font_name': '맑은 고딕',
-                'font_size': 10,
-                'align': 'left',
-                'valign': 'vcenter',
-                'num_format': '@'  # 텍스트 서식
-            })
-            for col_num, value in enumerate(result_df.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-                worksheet.set_column(col_num, col_num, 24, cell_format)
-
-            for row_num in range(len(result_df)):
-                for col_num in range(len(result_df.columns)):
-                    value = result_df.iloc[row_num, col_num]
-                    worksheet.write_string(row_num + 1, col_num, str(value), cell_format)
-
-            workbook.close()
+            write_string_all(output_path, result_df)
             logging.info(f"Successfully saved result to {output_path}")
             print(f"Successfully saved result to {output_path}")
         except Exception as e:
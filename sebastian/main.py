@@ -6,6 +6,7 @@ Sebastian - 게임 현지화 도구 통합 프로그램
 
 import sys
 import logging
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
 from PyQt6.QtWidgets import QApplication
@@ -95,4 +96,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 빌드된 실행 파일에서 ProcessPoolExecutor 작업자 프로세스 지원
+    multiprocessing.freeze_support()
     main()
@@ -306,12 +306,16 @@ class LYGLDiffWorker(QThread):
             timestamp = datetime.datetime.now().strftime('%Y%m%d%H%M%S')
             output_file = Path(self.output_path) / f"{timestamp}_DIFF.xlsx"
 
+            # 파일 지문 캐시 (실행 파일 위치/cache/legacy_diff/, logs와 같은 위치)
+            fingerprint_dir = Path(__file__).parent.parent.parent / "cache" / "legacy_diff"
+
             # legacy_diff 호출
             result_path, change_counts = legacy_diff(
                 folder1=folder1_path,
                 folder2=folder2_path,
                 output_path=output_file,
-                progress_callback=self._progress_callback
+                progress_callback=self._progress_callback,
+                fingerprint_dir=fingerprint_dir
             )
 
             self.progress_updated.emit(100)
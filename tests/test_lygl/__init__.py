@@ -0,0 +1 @@
+"""LY/GL 기능 테스트 패키지"""
@@ -0,0 +1,42 @@
+"""LY/GL 테스트 공용 fixture"""
+
+import pytest
+from openpyxl import Workbook
+
+
+LANGUAGES = ['EN', 'CT', 'CS', 'JA', 'TH', 'PT-BR', 'RU']
+HEADERS = ['Table', 'KEY', 'Source', 'Target', 'Status', 'NOTE', 'Date']
+
+
+def write_xlsx(path, rows, headers=HEADERS):
+    """헤더 + 데이터 행으로 xlsx 파일 생성"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.append(headers)
+    for row in rows:
+        ws.append(list(row))
+    wb.save(path)
+    return path
+
+
+def make_rows(keys, status='기존', date='2025-01-01 10:00', lang='EN'):
+    """KEY 목록으로 언어별 파일 행 생성"""
+    return [
+        ['Table1', key, f'원문 {key}', f'{lang} {key}', status, '', date]
+        for key in keys
+    ]
+
+
+@pytest.fixture
+def language_files(tmp_path):
+    """7개 언어 파일 생성 (251201_{LANG}.xlsx)"""
+    def _make(keys, folder=None, prefix='251201', status='기존', suffix=''):
+        folder = folder or tmp_path
+        folder.mkdir(parents=True, exist_ok=True)
+        files = {}
+        for lang in LANGUAGES:
+            path = folder / f"{prefix}_{lang}{suffix}.xlsx"
+            files[lang] = write_xlsx(path, make_rows(keys, status=status, lang=lang))
+        return files
+    return _make
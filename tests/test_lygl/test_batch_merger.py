@@ -0,0 +1,301 @@
+"""Batch 병합 테스트"""
+
+import pytest
+from datetime import datetime
+from openpyxl import load_workbook
+from sebastian.core.lygl import batch_merger
+from sebastian.core.lygl.batch_merger import (
+    BatchMergerError,
+    UserCancelledError,
+    scan_batch_folders,
+    merge_batches,
+    remove_duplicate_keys,
+    save_merged_batches,
+    parse_and_validate_date,
+)
+from sebastian.core.lygl.table import LanguageTable
+from .conftest import LANGUAGES, write_xlsx, make_rows
+
+
+def make_batch(root, folder_name, rows_by_lang):
+    """배치 폴더와 7개 언어 파일 생성"""
+    date, batch_name = folder_name.split('_', 1)
+    folder = root / folder_name
+    folder.mkdir(parents=True)
+    for lang in LANGUAGES:
+        write_xlsx(folder / f"{date}_{lang}_{batch_name}.xlsx", rows_by_lang(lang))
+
+
+@pytest.fixture
+def batch_root(tmp_path):
+    """REGULAR + EXTRA1 배치 (K2는 EXTRA1에서 최신 Date로 재전달)"""
+    root = tmp_path / "batches"
+    make_batch(root, "251201_REGULAR", lambda lang: make_rows(
+        ['K1', 'K2', 'K3'], status='번역필요', date='2025-01-01 10:00', lang=lang
+    ))
+    make_batch(root, "251205_EXTRA1", lambda lang: make_rows(
+        ['K2', 'K4'], status='수정', date='2025-01-05 10:00', lang=f"{lang}-new"
+    ))
+    return root
+
+
+def run_merge(root, **kwargs):
+    batch_info = scan_batch_folders(root)
+    return merge_batches(
+        root_folder=root,
+        selected_batches=['REGULAR', 'EXTRA1'],
+        base_batch='REGULAR',
+        batch_info=batch_info,
+        **kwargs
+    )
+
+
+class TestMergeBatches:
+    """배치 병합 전체 흐름 테스트"""
+
+    def test_latest_row_kept_in_load_order(self, batch_root):
+        """중복 KEY는 최신 Date 행만 유지, 적재 순서 유지"""
+        saved_files, log_path = run_merge(batch_root, apply_status_auto_complete=False)
+
+        assert set(saved_files) == set(LANGUAGES)
+        rows = list(load_workbook(saved_files['JA']).active.iter_rows(values_only=True))
+        assert [r[1] for r in rows[1:]] == ['K1', 'K3', 'K2', 'K4']
+        assert rows[3][3] == 'JA-new K2'
+        assert rows[3][4] == '수정'
+
+    def test_status_auto_complete(self, batch_root):
+        """번역필요/수정 → 완료"""
+        saved_files, _ = run_merge(batch_root)
+
+        rows = list(load_workbook(saved_files['EN']).active.iter_rows(values_only=True))
+        assert {r[4] for r in rows[1:]} == {'완료'}
+
+    def test_each_file_loaded_once(self, batch_root, monkeypatch):
+        """(배치, 언어) 파일마다 정확히 1회 로드"""
+        loaded = []
+        original = batch_merger.read_language_rows
+
+        def counting_reader(path, *args, **kwargs):
+            loaded.append(path.name)
+            return original(path, *args, **kwargs)
+
+        monkeypatch.setattr(batch_merger, 'read_language_rows', counting_reader)
+
+        _, log_path = run_merge(batch_root, load_workers=1)
+
+        assert len(loaded) == 14
+        assert len(set(loaded)) == 14
+        log_text = log_path.read_text(encoding='utf-8')
+        assert "총 파일 로드: 14회" in log_text
+
+    def test_parallel_load_keeps_load_order(self, batch_root):
+        """병렬 로드 결과가 순차 로드와 동일 (REGULAR → EXTRA 순서)"""
+        sequential, _ = run_merge(batch_root, load_workers=1)
+        sequential_rows = {
+            lang: list(load_workbook(path).active.iter_rows(values_only=True))
+            for lang, path in sequential.items()
+        }
+
+        parallel, log_path = run_merge(batch_root, load_workers=3)
+
+        for lang, path in parallel.items():
+            rows = list(load_workbook(path).active.iter_rows(values_only=True))
+            assert rows == sequential_rows[lang]
+        assert "총 파일 로드: 14회" in log_path.read_text(encoding='utf-8')
+
+    def test_parallel_load_cancel(self, batch_root):
+        """병렬 로드 중 취소 요청 시 UserCancelledError"""
+        with pytest.raises(UserCancelledError):
+            run_merge(batch_root, load_workers=2, cancel_check=lambda: True)
+
+    def test_parallel_load_error_keeps_code(self, batch_root):
+        """작업자 프로세스 오류도 error_code 유지"""
+        write_xlsx(
+            batch_root / "251205_EXTRA1" / "251205_TH_EXTRA1.xlsx",
+            make_rows(['K2', 'K4']),
+            headers=['Table', 'KEY', 'Source', 'Target', 'Status', 'NOTE', 'Modified'],
+        )
+
+        with pytest.raises(BatchMergerError) as exc_info:
+            run_merge(batch_root, load_workers=2)
+
+        assert exc_info.value.error_code == "INVALID_HEADERS"
+
+    def test_same_date_duplicate_rejected(self, tmp_path):
+        """중복 KEY의 Date가 같으면 오류"""
+        root = tmp_path / "batches"
+        make_batch(root, "251201_REGULAR", lambda lang: make_rows(['K1'], lang=lang))
+        make_batch(root, "251205_EXTRA1", lambda lang: make_rows(['K1'], lang=lang))
+
+        with pytest.raises(BatchMergerError) as exc_info:
+            run_merge(root)
+
+        assert exc_info.value.error_code == "DUPLICATE_DATE_SAME"
+
+
+class TestSaveMergedBatches:
+    """최종 파일 저장 테스트"""
+
+    @staticmethod
+    def make_final_data():
+        rows = make_rows(['K1', 'K2', 'K3'])
+        return {lang: LanguageTable.from_rows(rows).select([True, False, True]) for lang in LANGUAGES}
+
+    def test_parallel_save_matches_sequential(self, tmp_path):
+        """병렬 저장 결과가 순차 저장과 동일"""
+        data = self.make_final_data()
+
+        sequential = save_merged_batches(data, tmp_path / "seq", "251201", max_workers=1)
+        parallel = save_merged_batches(data, tmp_path / "par", "251201", max_workers=3)
+
+        assert list(parallel) == LANGUAGES
+        for lang in LANGUAGES:
+            seq_rows = list(load_workbook(sequential[lang]).active.iter_rows(values_only=True))
+            par_rows = list(load_workbook(parallel[lang]).active.iter_rows(values_only=True))
+            assert par_rows == seq_rows
+            assert [r[1] for r in par_rows] == ['KEY', 'K1', 'K3']
+
+    def test_overwrite_declined_before_save(self, tmp_path):
+        """덮어쓰기 거부 시 어떤 파일도 저장하지 않음"""
+        (tmp_path / "251201_EN.xlsx").write_bytes(b'')
+        asked = []
+
+        def decline(files):
+            asked.append(files)
+            return False
+
+        with pytest.raises(UserCancelledError):
+            save_merged_batches(self.make_final_data(), tmp_path, "251201", decline, max_workers=3)
+
+        assert asked == [['251201_EN.xlsx']]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['251201_EN.xlsx']
+
+    @pytest.mark.parametrize('workers', [1, 3])
+    def test_partial_failure_reports_saved_files(self, tmp_path, workers):
+        """저장 실패 시 이미 저장된 파일 목록 안내"""
+        (tmp_path / "251201_JA.xlsx").mkdir()
+
+        with pytest.raises(BatchMergerError) as exc_info:
+            save_merged_batches(self.make_final_data(), tmp_path, "251201", max_workers=workers)
+
+        message = str(exc_info.value)
+        assert exc_info.value.error_code == "FILE_WRITE_ERROR"
+        assert message.startswith("JA 파일 저장에 실패했습니다.")
+        if workers == 1:
+            assert "이미 저장된 파일: EN, CT, CS" in message
+        else:
+            assert "이미 저장된 파일: EN, CT, CS, TH, PT-BR, RU" in message
+
+
+class TestRemoveDuplicateKeys:
+    """중복 KEY 제거 테스트"""
+
+    @staticmethod
+    def make_language_data(en_rows):
+        return {lang: LanguageTable.from_rows(en_rows) for lang in LANGUAGES}
+
+    def test_ledger_tracks_kept_and_removed(self):
+        """여러 배치에 걸친 중복 KEY의 유지/제거 행 조회"""
+        rows = [
+            ['T', 'K1', 'S', 'A', '기존', '', '2025-01-01 10:00'],  # 행 2
+            ['T', 'K2', 'S', 'B', '기존', '', '2025-01-01 10:00'],  # 행 3
+            ['T', 'K1', 'S', 'C', '기존', '', '2025-01-03 10:00'],  # 행 4
+            ['T', 'K1', 'S', 'D', '기존', '', '2025-01-02 10:00'],  # 행 5
+        ]
+        data = self.make_language_data(rows)
+
+        final_data, ledger = remove_duplicate_keys(
+            data, ['REGULAR', 'EXTRA1', 'EXTRA2'], {'REGULAR': 2, 'EXTRA1': 1, 'EXTRA2': 1}
+        )
+
+        assert final_data['EN'].column('Target') == ['B', 'C']
+        assert len(ledger) == 1
+        assert 'K1' in ledger and 'K2' not in ledger
+        assert ledger.kept('K1') == (4, '2025-01-03 10:00')
+        assert ledger.removed('K1') == [(2, '2025-01-01 10:00'), (5, '2025-01-02 10:00')]
+        assert ledger.kept('K2') is None
+        assert ledger.removed_rows() == {2, 5}
+        # 로그 파일 생성용 형식 유지
+        assert list(ledger) == [{
+            'key': 'K1',
+            'kept_row': 4,
+            'kept_date': '2025-01-03 10:00',
+            'removed': [(2, '2025-01-01 10:00'), (5, '2025-01-02 10:00')],
+        }]
+
+    def test_rows_not_copied(self):
+        """중복 제거 결과는 원본 컬럼 배열을 공유하는 뷰"""
+        rows = [
+            ['T', 'K1', 'S', 'A', '기존', '', '2025-01-01 10:00'],
+            ['T', 'K1', 'S', 'B', '기존', '', '2025-01-02 10:00'],
+        ]
+        data = self.make_language_data(rows)
+
+        final_data, _ = remove_duplicate_keys(data, ['REGULAR', 'EXTRA1'], {'REGULAR': 1, 'EXTRA1': 1})
+
+        for lang in LANGUAGES:
+            assert final_data[lang].is_view
+            assert final_data[lang].columns is data[lang].columns
+            assert final_data[lang].column('Target') == ['B']
+
+    def test_language_row_count_mismatch(self):
+        """언어별 행 수가 EN과 다르면 오류"""
+        rows = [
+            ['T', 'K1', 'S', 'A', '기존', '', '2025-01-01 10:00'],
+            ['T', 'K2', 'S', 'B', '기존', '', '2025-01-01 10:00'],
+        ]
+        data = self.make_language_data(rows)
+        data['JA'].extend_rows([['T', 'K3', 'S', 'C', '기존', '', '2025-01-01 10:00']])
+
+        with pytest.raises(BatchMergerError) as exc_info:
+            remove_duplicate_keys(data, ['REGULAR'], {'REGULAR': 2})
+
+        assert exc_info.value.error_code == "LANGUAGE_ROW_COUNT_MISMATCH"
+
+    def test_row_count_checked_before_dedup(self):
+        """제거 후 행 수가 우연히 같아도 적재 행 수가 다르면 오류"""
+        rows = [
+            ['T', 'K1', 'S', 'A', '기존', '', '2025-01-01 10:00'],
+            ['T', 'K1', 'S', 'B', '기존', '', '2025-01-02 10:00'],
+        ]
+        data = self.make_language_data(rows)
+        data['JA'] = LanguageTable.from_rows(rows[1:])
+
+        with pytest.raises(BatchMergerError) as exc_info:
+            remove_duplicate_keys(data, ['REGULAR', 'EXTRA1'], {'REGULAR': 1, 'EXTRA1': 1})
+
+        assert exc_info.value.error_code == "LANGUAGE_ROW_COUNT_MISMATCH"
+
+
+class TestParseAndValidateDate:
+    """Date 파싱 테스트"""
+
+    def test_valid_date(self):
+        """YYYY-MM-DD HH:MM 형식 파싱 (앞뒤 공백 허용)"""
+        assert parse_and_validate_date(' 2025-01-02 03:04 ', 'K1', 2) == datetime(2025, 1, 2, 3, 4)
+
+    @pytest.mark.parametrize("date_str", [None, '', '   '])
+    def test_empty_date(self, date_str):
+        """빈 Date는 DATE_EMPTY_IN_DUPLICATE"""
+        with pytest.raises(BatchMergerError) as exc_info:
+            parse_and_validate_date(date_str, 'K1', 2)
+        assert exc_info.value.error_code == "DATE_EMPTY_IN_DUPLICATE"
+
+    def test_invalid_format_repeated(self):
+        """잘못된 형식은 캐시된 이후에도 매번 DATE_FORMAT_INVALID"""
+        for row_idx in (2, 3):
+            with pytest.raises(BatchMergerError) as exc_info:
+                parse_and_validate_date('2025/01/02', 'K1', row_idx)
+            assert exc_info.value.error_code == "DATE_FORMAT_INVALID"
+            assert f"{row_idx}" in str(exc_info.value)
+
+    def test_distinct_strings_parsed_once(self):
+        """같은 Date 문자열은 한 번만 파싱"""
+        batch_merger._parse_date_text.cache_clear()
+
+        for row_idx in range(100):
+            parse_and_validate_date('2025-03-04 05:06', 'K1', row_idx)
+
+        info = batch_merger._parse_date_text.cache_info()
+        assert info.misses == 1
+        assert info.hits == 99
@@ -0,0 +1,117 @@
+"""Excel 서식 테스트"""
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from sebastian.core.lygl.excel_format import (
+    apply_excel_format,
+    apply_split_format,
+    write_excel_rows,
+    write_split_rows,
+    new_streaming_workbook,
+)
+from .conftest import HEADERS, make_rows
+
+
+MERGED_HEADERS = [
+    "Table", "KEY", "Source",
+    "Target_EN", "Target_CT", "Target_CS", "Target_JA", "Target_TH", "Target_PT", "Target_RU",
+    "Status", "NOTE", "Date",
+]
+
+
+def cell_snapshot(cell):
+    """셀 값 + 서식 비교용 튜플"""
+    return (
+        cell.value,
+        cell.font.name, cell.font.sz, cell.font.b, cell.font.color.rgb if cell.font.color else None,
+        cell.alignment.horizontal, cell.alignment.vertical, cell.alignment.wrap_text,
+        cell.fill.fill_type, cell.fill.fgColor.rgb,
+    )
+
+
+def sheet_snapshot(path):
+    """저장된 시트의 셀/행/열 서식 스냅샷"""
+    ws = load_workbook(path).active
+    return {
+        'cells': [[cell_snapshot(cell) for cell in row] for row in ws.iter_rows()],
+        'row_heights': {idx: dim.height for idx, dim in ws.row_dimensions.items()},
+        'column_widths': {col: dim.width for col, dim in ws.column_dimensions.items()},
+        'freeze_panes': ws.freeze_panes,
+        'auto_filter': ws.auto_filter.ref,
+    }
+
+
+def save_sheet(path, fill, streaming=False):
+    if streaming:
+        wb, ws = new_streaming_workbook("Sheet1")
+    else:
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Sheet1"
+    fill(ws)
+    wb.save(path)
+    return path
+
+
+class TestStyleOnceFormat:
+    """셀 작성 시 서식 지정 결과가 기존 서식 적용 결과와 동일한지 확인"""
+
+    @pytest.mark.parametrize('streaming', [False, True])
+    @pytest.mark.parametrize('keys', [['K1', 'K2', 'K3'], []])
+    def test_split_format_identical(self, tmp_path, keys, streaming):
+        """write_split_rows == append + apply_split_format"""
+        rows = make_rows(keys, status='수정')
+        rows[:1] = [['T', keys[0], None, '', '수정', None, '2025-01-01 10:00']] if keys else []
+
+        def legacy(ws):
+            ws.append(HEADERS)
+            for row in rows:
+                ws.append(row)
+            apply_split_format(ws)
+
+        expected = sheet_snapshot(save_sheet(tmp_path / "legacy.xlsx", legacy))
+        actual = sheet_snapshot(save_sheet(
+            tmp_path / "styled.xlsx", lambda ws: write_split_rows(ws, HEADERS, rows), streaming
+        ))
+
+        assert actual == expected
+
+    @pytest.mark.parametrize('streaming', [False, True])
+    @pytest.mark.parametrize('is_merged', [True, False])
+    def test_excel_format_identical(self, tmp_path, is_merged, streaming):
+        """write_excel_rows == append + apply_excel_format"""
+        headers = MERGED_HEADERS if is_merged else HEADERS
+        rows = [
+            [f"{name} {idx}" for name in headers]
+            for idx in range(3)
+        ]
+
+        def legacy(ws):
+            ws.append(headers)
+            for row in rows:
+                ws.append(row)
+            apply_excel_format(ws, is_merged=is_merged)
+
+        expected = sheet_snapshot(save_sheet(tmp_path / "legacy.xlsx", legacy))
+        actual = sheet_snapshot(save_sheet(
+            tmp_path / "styled.xlsx",
+            lambda ws: write_excel_rows(ws, headers, rows, is_merged=is_merged),
+            streaming,
+        ))
+
+        assert actual == expected
+        assert actual['cells'][0][0][-1] == '00DBEEF4'  # 헤더 배경색
+
+    def test_streaming_keeps_no_rows(self, tmp_path):
+        """write_only 시트는 작성한 행/행 높이를 메모리에 남기지 않음"""
+        wb, ws = new_streaming_workbook()
+
+        write_split_rows(ws, HEADERS, make_rows([f'K{i}' for i in range(50)]))
+
+        assert len(ws.row_dimensions) == 0
+        assert ws.auto_filter.ref == "A1:G51"
+
+        wb.save(tmp_path / "out.xlsx")
+        saved = load_workbook(tmp_path / "out.xlsx").active
+        assert saved.max_row == 51
+        assert saved.row_dimensions[51].height == 30
@@ -0,0 +1,233 @@
+"""Legacy Diff 테스트"""
+
+import importlib
+import re
+import shutil
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from sebastian.core.lygl.legacy_diff import (
+    LegacyDiffError,
+    compare_language_files,
+    create_language_sheet,
+    create_overview_sheet,
+    legacy_diff,
+)
+from sebastian.core.lygl.fingerprint import FingerprintCache
+from .conftest import LANGUAGES, write_xlsx, make_rows
+
+# sebastian.core.lygl.legacy_diff 속성은 legacy_diff() 함수이므로 모듈은 직접 가져옴
+legacy_diff_module = importlib.import_module('sebastian.core.lygl.legacy_diff')
+
+
+@pytest.fixture
+def read_log(monkeypatch):
+    """순차 비교에서 읽은 파일 기록"""
+    paths = []
+    original = legacy_diff_module._read_baseline_rows
+
+    def logging_read(file_path):
+        paths.append(file_path)
+        return original(file_path)
+
+    monkeypatch.setattr(legacy_diff_module, '_read_baseline_rows', logging_read)
+    return paths
+
+
+def workbook_values(path):
+    """{시트명: [행 값 튜플, ...]}"""
+    wb = load_workbook(path)
+    return {ws.title: list(ws.iter_rows(values_only=True)) for ws in wb.worksheets}
+
+
+@pytest.fixture
+def diff_folders(tmp_path, language_files):
+    """비교1/비교2 폴더 (비교2의 CT/RU 일부 Target 변경)"""
+    keys = ['K1', 'K2', 'K3', 'K4']
+    folder1 = tmp_path / "v1"
+    folder2 = tmp_path / "v2"
+    language_files(keys, folder=folder1)
+    files2 = language_files(keys, folder=folder2, prefix='251202')
+
+    rows = make_rows(keys, lang='CT')
+    rows[1][3] = '새 번역 K2'
+    rows[3][3] = '새 번역 K4'
+    rows[3][4] = '수정'  # 기존이 아닌 행은 비교하지 않음
+    write_xlsx(files2['CT'], rows)
+
+    rows = make_rows(keys, lang='RU')
+    rows[1][3] = '새 번역 K2'
+    write_xlsx(files2['RU'], rows)
+
+    return folder1, folder2
+
+
+class TestCompareLanguageFiles:
+    """언어별 파일 비교 테스트"""
+
+    def test_baseline_rows_only(self, tmp_path):
+        """Status == 기존이고 양쪽에 있는 KEY의 Target 차이만 반환"""
+        rows1 = make_rows(['K1', 'K2', 'K3'])
+        rows2 = make_rows(['K1', 'K2', 'K4'])
+        rows2[0][3] = '변경'
+        rows2[1][3] = '변경'
+        rows2[1][4] = '수정'
+        file1 = write_xlsx(tmp_path / "251201_EN.xlsx", rows1)
+        file2 = write_xlsx(tmp_path / "251202_EN.xlsx", rows2)
+
+        diffs = compare_language_files(file1, file2, 'EN')
+
+        assert diffs == [{
+            'key': 'K1', 'source': '원문 K1', 'target_old': 'EN K1', 'target_new': '변경', 'status': '기존'
+        }]
+
+
+class TestParallelDiff:
+    """병렬 Legacy Diff 테스트"""
+
+    def test_parallel_equals_sequential(self, tmp_path, diff_folders):
+        """병렬 비교 결과 파일이 순차 비교와 동일"""
+        folder1, folder2 = diff_folders
+        messages = []
+
+        _, expected_stats = legacy_diff(folder1, folder2, tmp_path / "seq.xlsx", max_workers=1)
+        _, actual_stats = legacy_diff(
+            folder1, folder2, tmp_path / "par.xlsx",
+            lambda percent, message: messages.append(message), max_workers=4
+        )
+
+        assert actual_stats == expected_stats
+        assert list(actual_stats) == LANGUAGES
+        assert actual_stats['CT'] == 1 and actual_stats['RU'] == 1
+        assert workbook_values(tmp_path / "par.xlsx") == workbook_values(tmp_path / "seq.xlsx")
+
+        counts = [match.group(1) for match in (re.search(r'\((\d+)/7\)', m) for m in messages) if match]
+        assert counts == [str(n) for n in range(1, 8)]
+
+    def test_no_changes(self, tmp_path, language_files):
+        """변경 사항이 없으면 오류 코드 유지"""
+        language_files(['K1'], folder=tmp_path / "v1")
+        language_files(['K1'], folder=tmp_path / "v2", prefix='251202')
+
+        with pytest.raises(LegacyDiffError) as exc_info:
+            legacy_diff(tmp_path / "v1", tmp_path / "v2", tmp_path / "out.xlsx", max_workers=2)
+
+        assert exc_info.value.error_code == "LEGACY_DIFF_NO_CHANGES"
+
+
+def make_diff(key):
+    return {'key': key, 'source': f'원문 {key}', 'target_old': 'old', 'target_new': 'new', 'status': '기존'}
+
+
+class TestResultSheets:
+    """결과 시트 생성 테스트"""
+
+    def test_overview_marks_and_styles(self, tmp_path):
+        """변경된 언어는 O(녹색), 나머지는 X(회색)로 행 작성 시 서식 지정"""
+        all_diffs = {'EN': [make_diff('K2')], 'CT': [make_diff('K1'), make_diff('K2')], 'RU': []}
+        wb = Workbook()
+
+        index = create_overview_sheet(wb, all_diffs)
+        create_language_sheet(wb, 'CT', all_diffs['CT'], index)
+        wb.save(tmp_path / "out.xlsx")
+
+        saved = load_workbook(tmp_path / "out.xlsx")
+        overview = saved['Overview']
+        assert index == {'K1': 1, 'K2': 2}
+        assert [list(row) for row in overview.iter_rows(min_row=2, values_only=True)] == [
+            [1, 'K1', 'X', 'O', 'X', 'X', 'X', 'X', 'X'],
+            [2, 'K2', 'O', 'O', 'X', 'X', 'X', 'X', 'X'],
+        ]
+        assert overview['C3'].fill.fgColor.rgb == '00C6EFCE' and overview['C3'].font.b
+        assert overview['C2'].fill.fgColor.rgb == '00E7E6E6'
+        assert overview['A1'].fill.fgColor.rgb == '00DBEEF4'
+        assert overview.auto_filter.ref == "A1:I3"
+
+        sheet = saved['CT']
+        assert [row[0] for row in sheet.iter_rows(min_row=2, values_only=True)] == [1, 2]
+        assert sheet['C2'].alignment.wrap_text
+        assert sheet.row_dimensions[3].height == 30
+
+
+class TestFingerprints:
+    """파일 지문으로 변경 없는 파일 읽기 생략 테스트"""
+
+    def test_identical_files_not_read(self, tmp_path, diff_folders, read_log):
+        """바이트가 같은 파일 쌍은 읽지 않음"""
+        folder1, folder2 = diff_folders
+        for lang in ['EN', 'CS', 'JA', 'TH', 'PT-BR']:
+            shutil.copy(folder1 / f"251201_{lang}.xlsx", folder2 / f"251202_{lang}.xlsx")
+
+        _, stats = legacy_diff(folder1, folder2, tmp_path / "out.xlsx", max_workers=1)
+
+        assert stats == {lang: 1 if lang in ('CT', 'RU') else 0 for lang in LANGUAGES}
+        assert sorted(path.name for path in read_log) == [
+            '251201_CT.xlsx', '251201_RU.xlsx', '251202_CT.xlsx', '251202_RU.xlsx'
+        ]
+
+    @pytest.mark.parametrize('max_workers', [1, 3])
+    def test_cached_targets_skip_unchanged(self, tmp_path, diff_folders, max_workers):
+        """캐시된 Target 해시가 같으면 '기존' 외 행만 바뀐 파일은 비교 결과 없음"""
+        folder1, folder2 = diff_folders
+        cache_dir = tmp_path / "cache"
+        legacy_diff(folder1, folder2, tmp_path / "first.xlsx", max_workers=max_workers,
+                    fingerprint_dir=cache_dir)
+
+        # 비교3: 비교2에서 '수정' 행 Target만 변경 (바이트는 다르지만 '기존' 행 동일)
+        folder3 = tmp_path / "v3"
+        shutil.copytree(folder2, folder3)
+        rows = make_rows(['K1', 'K2', 'K3', 'K4'], lang='CT')
+        rows[1][3] = '새 번역 K2'
+        rows[3][3] = '또 다른 번역'
+        rows[3][4] = '수정'
+        write_xlsx(folder3 / "251202_CT.xlsx", rows)
+
+        with pytest.raises(LegacyDiffError) as exc_info:
+            legacy_diff(folder2, folder3, tmp_path / "second.xlsx", max_workers=max_workers,
+                        fingerprint_dir=cache_dir)
+        assert exc_info.value.error_code == "LEGACY_DIFF_NO_CHANGES"
+
+        # '기존' 행 Target 변경은 검출
+        rows[0][3] = '바뀐 번역 K1'
+        write_xlsx(folder3 / "251202_CT.xlsx", rows)
+
+        _, stats = legacy_diff(folder2, folder3, tmp_path / "third.xlsx", max_workers=max_workers,
+                               fingerprint_dir=cache_dir)
+        assert stats['CT'] == 1
+        ct_rows = list(load_workbook(tmp_path / "third.xlsx")['CT'].iter_rows(min_row=2, values_only=True))
+        assert ct_rows == [(1, 'K1', '원문 K1', 'CT K1', '바뀐 번역 K1')]
+
+    def test_deferred_read(self, tmp_path, diff_folders, read_log):
+        """비교1 해시가 캐시에 있으면 비교2를 먼저 읽고, 같으면 비교1은 읽지 않음"""
+        folder1, folder2 = diff_folders
+        cache_dir = tmp_path / "cache"
+        legacy_diff(folder1, folder2, tmp_path / "first.xlsx", max_workers=1, fingerprint_dir=cache_dir)
+        read_log.clear()
+
+        folder3 = tmp_path / "v3"
+        shutil.copytree(folder2, folder3)
+        rows = make_rows(['K1', 'K2', 'K3', 'K4'], lang='RU')
+        rows[1][3] = '새 번역 K2'
+        rows[2][4] = '수정'  # '기존' 행 Target은 그대로
+        write_xlsx(folder3 / "251202_RU.xlsx", rows)
+        rows = make_rows(['K1', 'K2', 'K3', 'K4'], lang='JA')
+        rows[0][3] = '새 번역 K1'
+        write_xlsx(folder3 / "251202_JA.xlsx", rows)
+
+        _, stats = legacy_diff(folder2, folder3, tmp_path / "second.xlsx", max_workers=1,
+                               fingerprint_dir=cache_dir)
+
+        assert stats['JA'] == 1 and stats['RU'] == 0
+        assert [path.parent.name + '/' + path.name for path in read_log] == [
+            'v3/251202_JA.xlsx', 'v2/251202_JA.xlsx', 'v3/251202_RU.xlsx'
+        ]
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        """읽을 수 없는 캐시 파일은 없는 것으로 취급"""
+        cache = FingerprintCache(tmp_path / "cache")
+        cache.put('abc', {"'K1'": '00'})
+        (tmp_path / "cache" / "def.json.gz").write_bytes(b'broken')
+
+        assert cache.get('abc') == {"'K1'": '00'}
+        assert cache.get('def') is None
+        assert cache.get('missing') is None
@@ -0,0 +1,159 @@
+"""Merge / Split 테스트"""
+
+import importlib
+
+import pytest
+from openpyxl import load_workbook
+from sebastian.core.lygl import merge_files, split_file
+from sebastian.core.lygl.validator import ValidationError
+from .conftest import LANGUAGES, HEADERS, write_xlsx, make_rows
+
+# sebastian.core.lygl.split 속성은 split() 함수이므로 모듈은 직접 가져옴
+split_module = importlib.import_module('sebastian.core.lygl.split')
+
+
+class TestMergeSplit:
+    """병합/분할 왕복 테스트"""
+
+    def test_round_trip(self, tmp_path, language_files):
+        """Merge 후 Split하면 원본 데이터가 복원됨"""
+        files = language_files(['K1', 'K2', 'K3'], folder=tmp_path / "in")
+        merged_path = tmp_path / "251201_LYGL_StringALL.xlsx"
+
+        merge_files({lang: str(p) for lang, p in files.items()}, str(merged_path))
+
+        merged_ws = load_workbook(merged_path).active
+        merged_rows = list(merged_ws.iter_rows(values_only=True))
+        assert merged_rows[0][3] == 'Target_EN'
+        assert [r[1] for r in merged_rows[1:]] == ['K1', 'K2', 'K3']
+        assert merged_rows[1][4] == 'CT K1'
+
+        output_paths = split_file(str(merged_path), str(tmp_path / "out"))
+
+        assert set(output_paths) == set(LANGUAGES)
+        ru_rows = list(load_workbook(output_paths['RU']).active.iter_rows(values_only=True))
+        assert list(ru_rows[0]) == HEADERS
+        assert list(ru_rows[1]) == ['Table1', 'K1', '원문 K1', 'RU K1', '기존', None, '2025-01-01 10:00']
+
+    def test_merge_source_mismatch(self, tmp_path, language_files):
+        """언어 파일 Source가 EN과 다르면 오류"""
+        files = language_files(['K1'], folder=tmp_path / "in")
+        rows = make_rows(['K1'], lang='CT')
+        rows[0][2] = '다른 원문'
+        write_xlsx(files['CT'], rows)
+
+        with pytest.raises(ValidationError, match="Source mismatch"):
+            merge_files({lang: str(p) for lang, p in files.items()}, str(tmp_path / "out.xlsx"))
+
+    @pytest.mark.parametrize('read_workers', [1, 3])
+    def test_merge_parallel_read_identical(self, tmp_path, language_files, read_workers):
+        """병렬 읽기 결과가 순차 읽기와 동일 (언어 파일 행 순서가 달라도 EN 순서 유지)"""
+        files = language_files(['K1', 'K2', 'K3'], folder=tmp_path / "in")
+        write_xlsx(files['JA'], make_rows(['K3', 'K1', 'K2'], lang='JA'))
+        paths = {lang: str(p) for lang, p in files.items()}
+
+        merge_files(paths, str(tmp_path / "seq.xlsx"), read_workers=1)
+        merge_files(paths, str(tmp_path / "par.xlsx"), read_workers=read_workers)
+
+        expected = list(load_workbook(tmp_path / "seq.xlsx").active.iter_rows(values_only=True))
+        actual = list(load_workbook(tmp_path / "par.xlsx").active.iter_rows(values_only=True))
+        assert actual == expected
+        assert [r[6] for r in actual[1:]] == ['JA K1', 'JA K2', 'JA K3']
+
+    @pytest.mark.parametrize('read_workers', [1, 3])
+    def test_merge_reports_all_mismatches(self, tmp_path, language_files, read_workers):
+        """모든 언어의 불일치를 행 순서(같은 행은 필드 순서)로 한 번에 보고"""
+        files = language_files(['K1', 'K2', 'K3'], folder=tmp_path / "in")
+        rows = make_rows(['K1', 'K2', 'K3'], lang='CS')
+        rows[1][5] = '다른 비고'
+        rows[1][4] = '신규'
+        rows[2][2] = '다른 원문'
+        write_xlsx(files['CS'], rows)
+        rows = make_rows(['K9', 'K1'], lang='TH')
+        rows[1][0] = 'Table2'
+        write_xlsx(files['TH'], rows)
+
+        with pytest.raises(ValidationError) as exc_info:
+            merge_files({lang: str(p) for lang, p in files.items()}, str(tmp_path / "out.xlsx"),
+                        read_workers=read_workers)
+
+        assert str(exc_info.value).splitlines() == [
+            "Status mismatch for KEY 'K2': EN=기존, CS=신규",
+            "NOTE mismatch for KEY 'K2': EN=, CS=다른 비고",
+            "Source mismatch for KEY 'K3': EN=원문 K3, CS=다른 원문",
+            "KEY 'K9' in TH not found in EN (master) file",
+            "Table mismatch for KEY 'K1': EN=Table1, TH=Table2",
+        ]
+        assert not (tmp_path / "out.xlsx").exists()
+
+    def test_merge_unknown_key(self, tmp_path, language_files):
+        """EN에 없는 KEY는 KEY 오류"""
+        files = language_files(['K1', 'K2'], folder=tmp_path / "in")
+        write_xlsx(files['TH'], make_rows(['K1', 'K9'], lang='TH'))
+
+        with pytest.raises(ValidationError, match="^KEY 'K9' in TH not found in EN"):
+            merge_files({lang: str(p) for lang, p in files.items()}, str(tmp_path / "out.xlsx"),
+                        read_workers=2)
+
+    def test_merge_read_error_wrapped(self, tmp_path, language_files):
+        """작업 프로세스의 읽기 오류도 IOError로 전달"""
+        files = language_files(['K1'], folder=tmp_path / "in")
+        files['RU'].write_bytes(b'not an xlsx file')
+
+        with pytest.raises(IOError, match="Failed to read RU file"):
+            merge_files({lang: str(p) for lang, p in files.items()}, str(tmp_path / "out.xlsx"),
+                        read_workers=3)
+
+
+MERGED_HEADERS = [
+    'Table', 'KEY', 'Source',
+    'Target_EN', 'Target_CT', 'Target_CS', 'Target_JA', 'Target_TH', 'Target_PT', 'Target_RU',
+    'Status', 'NOTE', 'Date',
+]
+
+
+def make_merged_row(key, status='수정'):
+    return ['Table1', key, f'원문 {key}'] + [f'{lang} {key}' for lang in LANGUAGES] + [status, None, '2025-01-01 10:00']
+
+
+class TestSplit:
+    """분할 테스트"""
+
+    def test_merged_sheet_scanned_once(self, tmp_path, monkeypatch):
+        """병합 시트는 1회만 스캔하고 7개 언어 파일에 동시 작성"""
+        merged_path = write_xlsx(
+            tmp_path / "251201_LYGL_StringALL.xlsx",
+            [make_merged_row(key) for key in ['K1', 'K2']],
+            headers=MERGED_HEADERS,
+        )
+        scans = []
+        original = split_module.iter_rows
+
+        def counting_iter_rows(*args, **kwargs):
+            scans.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(split_module, 'iter_rows', counting_iter_rows)
+
+        output_paths = split_file(str(merged_path), str(tmp_path / "out"))
+
+        assert len(scans) == 1
+        for lang in LANGUAGES:
+            rows = list(load_workbook(output_paths[lang]).active.iter_rows(values_only=True))
+            assert rows[1:] == [
+                ('Table1', key, f'원문 {key}', f'{lang} {key}', '수정', None, '2025-01-01 10:00')
+                for key in ['K1', 'K2']
+            ]
+
+    def test_invalid_key_mid_file(self, tmp_path):
+        """중간 행 KEY 오류 시 ValidationError, 출력 파일 없음"""
+        merged_path = write_xlsx(
+            tmp_path / "251201_LYGL_StringALL.xlsx",
+            [make_merged_row('K1'), make_merged_row(None)],
+            headers=MERGED_HEADERS,
+        )
+
+        with pytest.raises(ValidationError):
+            split_file(str(merged_path), str(tmp_path / "out"))
+
+        assert list((tmp_path / "out").iterdir()) == []
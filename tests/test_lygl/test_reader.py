@@ -0,0 +1,59 @@
+"""워크북 읽기 모듈 테스트"""
+
+from sebastian.core.lygl.reader import (
+    LANGUAGE_FILE_HEADERS,
+    open_sheet,
+    read_header,
+    iter_rows,
+    read_language_rows,
+)
+from .conftest import write_xlsx
+
+
+class TestReader:
+    """읽기 전용 로더 테스트"""
+
+    def test_read_language_rows(self, tmp_path):
+        """헤더와 7-튜플 데이터 행 반환"""
+        path = write_xlsx(tmp_path / "251201_EN.xlsx", [
+            ['T', 'K1', 'S1', 'E1', '기존', None, '2025-01-01 10:00'],
+            ['T', 'K2', 'S2', 'E2', '수정', 'note', None],
+        ])
+
+        headers, rows = read_language_rows(path)
+
+        assert headers == LANGUAGE_FILE_HEADERS
+        assert rows == [
+            ('T', 'K1', 'S1', 'E1', '기존', None, '2025-01-01 10:00'),
+            ('T', 'K2', 'S2', 'E2', '수정', 'note', None),
+        ]
+
+    def test_short_rows_are_padded(self, tmp_path):
+        """Date 컬럼 없는 파일도 7-튜플로 맞춰짐"""
+        path = write_xlsx(
+            tmp_path / "251201_EN.xlsx",
+            [['T', 'K1', 'S1', 'E1', '기존', '']],
+            headers=LANGUAGE_FILE_HEADERS[:6],
+        )
+
+        headers, rows = read_language_rows(path)
+
+        assert len(headers) == 6
+        assert rows == [('T', 'K1', 'S1', 'E1', '기존', None, None)]
+
+    def test_iter_rows_truncates_wide_rows(self, tmp_path):
+        """지정 폭보다 긴 행은 잘림"""
+        path = write_xlsx(tmp_path / "wide.xlsx", [[1, 2, 3, 4]], headers=['A', 'B', 'C', 'D'])
+
+        with open_sheet(path) as ws:
+            assert read_header(ws) == ['A', 'B', 'C', 'D']
+            assert list(iter_rows(ws, 2)) == [(1, 2)]
+
+    def test_file_handle_closed(self, tmp_path):
+        """with 블록 종료 후 파일 핸들이 닫힘"""
+        path = write_xlsx(tmp_path / "251201_EN.xlsx", [])
+
+        with open_sheet(path) as ws:
+            archive = ws.parent._archive
+
+        assert archive.fp is None
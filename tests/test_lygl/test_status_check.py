@@ -0,0 +1,183 @@
+"""Status Check 테스트"""
+
+import importlib
+import random
+import re
+
+import pytest
+
+from openpyxl import load_workbook
+from sebastian.core.lygl.status_check import (
+    VALID_LANGUAGES,
+    StatusCheckError,
+    calculate_korean_word_count,
+    calculate_status_statistics,
+    check_status_consistency,
+    encode_status_columns,
+    find_inconsistent_rows,
+    scan_language_file,
+)
+from .conftest import write_xlsx, make_rows
+
+# sebastian.core.lygl.status_check 속성은 status_check() 함수이므로 모듈은 직접 가져옴
+status_check_module = importlib.import_module('sebastian.core.lygl.status_check')
+
+
+def write_language_files(folder, rows_by_lang=None):
+    """7개 언어 파일 생성 (rows_by_lang에 없는 언어는 K1~K3 기본 행)"""
+    rows_by_lang = rows_by_lang or {}
+    return {
+        lang: write_xlsx(
+            folder / f"251201_{lang}.xlsx",
+            rows_by_lang.get(lang, make_rows(['K1', 'K2', 'K3'], lang=lang)),
+        )
+        for lang in VALID_LANGUAGES
+    }
+
+
+def naive_inconsistent_keys(all_data):
+    """KEY별 7개 언어 Status 집합 비교 (기존 방식)"""
+    result = []
+    for key in sorted(all_data['EN']):
+        statuses = {lang: all_data[lang].get(key, 'Missing') for lang in VALID_LANGUAGES}
+        if len(set(statuses.values())) != 1:
+            result.append((key, statuses))
+    return result
+
+
+class TestStatusEngine:
+    """Status 코드 배열 비교 테스트"""
+
+    def test_matches_naive_comparison(self):
+        """코드 배열 비교 결과가 KEY별 집합 비교와 동일"""
+        rng = random.Random(0)
+        statuses = ['기존', '번역필요', '수정', '완료', '보류']
+        keys = [f'K{i:03d}' for i in range(300)]
+        all_data = {
+            lang: {key: rng.choice(statuses[:2] if rng.random() < 0.9 else statuses)
+                   for key in keys if rng.random() > 0.02}
+            for lang in VALID_LANGUAGES
+        }
+
+        en_keys = sorted(all_data['EN'])
+        columns, names = encode_status_columns(all_data, en_keys)
+        mask = find_inconsistent_rows(columns)
+
+        actual = [
+            (key, {lang: names[columns[lang][idx]] for lang in VALID_LANGUAGES})
+            for idx, key in enumerate(en_keys) if mask[idx]
+        ]
+        assert actual == naive_inconsistent_keys(all_data)
+
+    def test_missing_and_unknown_status(self):
+        """KEY 없음은 'Missing', 통계 외 Status도 구분해서 비교"""
+        all_data = {lang: {'K1': '기존', 'K2': '기존'} for lang in VALID_LANGUAGES}
+        del all_data['JA']['K1']
+        all_data['RU']['K2'] = '보류'
+
+        columns, names = encode_status_columns(all_data, ['K1', 'K2'])
+
+        assert list(find_inconsistent_rows(columns)) == [1, 1]
+        assert names[columns['JA'][0]] == 'Missing'
+        assert names[columns['RU'][1]] == '보류'
+
+    def test_statistics(self):
+        """언어별 4개 Status 개수 (그 외 값은 제외)"""
+        all_data = {lang: {'K1': '기존', 'K2': '수정', 'K3': '보류'} for lang in VALID_LANGUAGES}
+
+        statistics = calculate_status_statistics(all_data)
+
+        assert statistics['EN'] == {'기존': 1, '번역필요': 0, '수정': 1, '완료': 0}
+        assert list(statistics) == VALID_LANGUAGES
+
+
+class TestCheckStatusConsistency:
+    """파일 기반 Status 비교 테스트"""
+
+    def test_inconsistent_keys(self, tmp_path):
+        """EN 기준 KEY 정렬 순서로 불일치 키만 반환"""
+        files = {}
+        for lang in VALID_LANGUAGES:
+            rows = make_rows(['K2', 'K1', 'K3'], lang=lang)
+            if lang == 'CT':
+                rows[0][4] = '수정'
+            if lang == 'RU':
+                rows = rows[1:]
+            files[lang] = write_xlsx(tmp_path / f"251201_{lang}.xlsx", rows)
+
+        inconsistencies, statistics = check_status_consistency(files, max_workers=1)
+
+        assert [item['key'] for item in inconsistencies] == ['K2']
+        assert inconsistencies[0]['statuses']['CT'] == '수정'
+        assert inconsistencies[0]['statuses']['RU'] == 'Missing'
+        assert statistics['RU']['기존'] == 2
+
+
+class TestFusedScan:
+    """언어 파일 1회 읽기 테스트"""
+
+    def test_scan_collects_all(self, tmp_path):
+        """KEY→Status, 통계, Source 단어 수를 한 번에 수집"""
+        rows = make_rows(['K1', 'K2', 'K3', 'K4'], status='번역필요')
+        rows[1][4] = '수정'
+        rows[2][4] = '완료'
+        rows[3][1] = None  # KEY 없는 행도 단어 수에는 포함
+        rows[0][2] = '강타 피해 {10011}%'
+        path = write_xlsx(tmp_path / "251201_EN.xlsx", rows)
+
+        key_status_map, statistics, word_counts = scan_language_file(path, count_words=True)
+
+        assert key_status_map == {'K1': '번역필요', 'K2': '수정', 'K3': '완료'}
+        assert statistics == {'기존': 0, '번역필요': 1, '수정': 1, '완료': 1}
+        assert word_counts == {'번역필요': 5, '수정': 2, '합계': 7}
+        assert word_counts == calculate_korean_word_count(path)
+
+    def test_each_file_read_once(self, tmp_path, monkeypatch):
+        """status_check는 7개 파일을 각각 한 번만 읽음"""
+        files = write_language_files(tmp_path, {
+            lang: make_rows(['K1', 'K2'], status='수정', lang=lang) for lang in VALID_LANGUAGES
+        })
+        read_paths = []
+        original = status_check_module.read_language_table
+
+        def counting_read(path, *args, **kwargs):
+            read_paths.append(path)
+            return original(path, *args, **kwargs)
+
+        monkeypatch.setattr(status_check_module, 'read_language_table', counting_read)
+
+        count = status_check_module.status_check(files, tmp_path / "result.xlsx", max_workers=1)
+
+        assert count == 0
+        assert sorted(read_paths) == sorted(files.values())
+        values = [row[1] for row in load_workbook(tmp_path / "result.xlsx").active.iter_rows(values_only=True)]
+        assert '단어 수' in values
+
+
+class TestParallelRead:
+    """7개 파일 병렬 읽기 테스트"""
+
+    def test_parallel_equals_sequential(self, tmp_path):
+        """병렬 읽기 결과가 순차 읽기와 동일하고 파일마다 완료 진행 상황 전달"""
+        rows = make_rows(['K1', 'K2', 'K3'], lang='JA')
+        rows[2][4] = '수정'
+        files = write_language_files(tmp_path, {'JA': rows})
+        messages = []
+
+        expected = check_status_consistency(files, max_workers=1)
+        actual = check_status_consistency(
+            files, lambda percent, message: messages.append(message), max_workers=4
+        )
+
+        assert actual == expected
+        assert [item['key'] for item in actual[0]] == ['K3']
+        counts = [re.search(r'\((\d+)/7\)', m).group(1) for m in messages if '읽기 완료' in m]
+        assert counts == ['1', '2', '3', '4', '5', '6', '7']
+
+    def test_worker_error(self, tmp_path):
+        """작업자 프로세스의 읽기 오류 전달"""
+        files = write_language_files(tmp_path)
+        files['TH'].write_bytes(b'not an xlsx file')
+
+        with pytest.raises(StatusCheckError, match="파일 읽기 실패"):
+            check_status_consistency(files, max_workers=3)
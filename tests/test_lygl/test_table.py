@@ -0,0 +1,130 @@
+"""언어 테이블 테스트"""
+
+import pytest
+from sebastian.core.lygl import table as table_module
+from sebastian.core.lygl.reader import LANGUAGE_FILE_HEADERS
+from sebastian.core.lygl.table import LanguageTable, read_language_table, select_all
+from .conftest import write_xlsx, make_rows
+
+
+class TestLanguageTable:
+    """컬럼 배열 테이블 테스트"""
+
+    def test_from_rows_columns(self, monkeypatch):
+        """행 목록이 컬럼 배열로 변환됨 (청크 경계 포함)"""
+        monkeypatch.setattr(table_module, '_TRANSPOSE_CHUNK_SIZE', 2)
+        rows = make_rows(['K1', 'K2', 'K3'])
+
+        table = LanguageTable.from_rows(rows)
+
+        assert len(table) == 3
+        assert table.headers == LANGUAGE_FILE_HEADERS
+        assert table.column('KEY') == ['K1', 'K2', 'K3']
+        assert [list(row) for row in table.iter_rows()] == rows
+        assert table.to_rows() == [LANGUAGE_FILE_HEADERS] + rows
+
+    def test_empty_table(self):
+        """빈 테이블"""
+        table = LanguageTable.from_rows([])
+
+        assert len(table) == 0
+        assert list(table.iter_rows()) == []
+        assert table.to_rows() == [LANGUAGE_FILE_HEADERS]
+
+    def test_select_shares_columns(self):
+        """select()는 컬럼을 복사하지 않는 뷰를 반환"""
+        table = LanguageTable.from_rows(make_rows(['K1', 'K2', 'K3', 'K4']))
+
+        view = table.select(bytearray([1, 0, 1, 1]))
+        nested = view.select([False, True, True])
+
+        assert view.columns is table.columns
+        assert view.column('KEY') == ['K1', 'K3', 'K4']
+        assert nested.column('KEY') == ['K3', 'K4']
+        assert nested.row(0) == table.row(2)
+        assert len(table) == 4
+
+    def test_compact_view(self):
+        """compact()는 선택된 행만 담은 전체 테이블"""
+        table = LanguageTable.from_rows(make_rows(['K1', 'K2', 'K3']))
+
+        compacted = table.select([True, False, True]).compact()
+
+        assert not compacted.is_view
+        assert compacted.columns[1] == ['K1', 'K3']
+        assert table.compact() is table
+
+    def test_select_mask_length(self):
+        """마스크 길이가 행 수와 다르면 오류"""
+        table = LanguageTable.from_rows(make_rows(['K1', 'K2']))
+
+        with pytest.raises(ValueError):
+            table.select([True])
+
+    def test_view_is_read_only_for_rows(self):
+        """뷰에는 행을 추가할 수 없음"""
+        view = LanguageTable.from_rows(make_rows(['K1'])).select([True])
+
+        with pytest.raises(ValueError):
+            view.extend_rows(make_rows(['K2']))
+
+    def test_replace_values_on_view(self):
+        """뷰의 치환은 선택된 행에만 적용되고 원본에 반영됨"""
+        table = LanguageTable.from_rows(make_rows(['K1', 'K2'], status='수정'))
+        view = table.select([False, True])
+
+        replaced = view.replace_values('Status', {'수정': '완료'})
+
+        assert replaced == 1
+        assert table.column('Status') == ['수정', '완료']
+
+    def test_key_index(self):
+        """KEY → 행 위치 인덱스 (extend 후 재생성)"""
+        table = LanguageTable.from_rows(make_rows(['K1', 'K2']))
+        assert table.key_index == {'K1': 0, 'K2': 1}
+
+        table.extend(LanguageTable.from_rows(make_rows(['K3'])))
+
+        assert table.key_index == {'K1': 0, 'K2': 1, 'K3': 2}
+        assert table.select([False, True, True]).key_index == {'K2': 0, 'K3': 1}
+
+
+class TestSelectAll:
+    """여러 테이블 일괄 선택 테스트"""
+
+    def test_positions_shared(self):
+        """마스크에서 계산한 행 위치를 모든 테이블이 공유"""
+        tables = {
+            lang: LanguageTable.from_rows(make_rows(['K1', 'K2', 'K3'], lang=lang))
+            for lang in ['EN', 'JA']
+        }
+
+        views = select_all(tables, bytearray([1, 0, 1]))
+
+        assert views['EN'].column('KEY') == ['K1', 'K3']
+        assert views['JA'].column('Target') == ['JA K1', 'JA K3']
+        assert views['EN']._positions is views['JA']._positions
+
+    def test_length_mismatch(self):
+        """행 수가 다른 테이블이 있으면 오류"""
+        tables = {
+            'EN': LanguageTable.from_rows(make_rows(['K1', 'K2'])),
+            'JA': LanguageTable.from_rows(make_rows(['K1'])),
+        }
+
+        with pytest.raises(ValueError):
+            select_all(tables, bytearray([1, 1]))
+
+
+class TestReadLanguageTable:
+    """파일 → 테이블 로드 테스트"""
+
+    def test_read_language_table(self, tmp_path):
+        """헤더와 7개 컬럼 배열 반환"""
+        path = write_xlsx(tmp_path / "251201_EN.xlsx", make_rows(['K1', 'K2']))
+
+        headers, table = read_language_table(path)
+
+        assert headers == LANGUAGE_FILE_HEADERS
+        assert table.column('KEY') == ['K1', 'K2']
+        assert table.column('Target') == ['EN K1', 'EN K2']
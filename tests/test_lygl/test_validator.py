@@ -0,0 +1,62 @@
+"""검증 모듈 테스트"""
+
+import pytest
+from sebastian.core.lygl import validator
+from sebastian.core.lygl.validator import (
+    ValidationError,
+    find_column_mismatches,
+    raise_mismatch_errors,
+    validate_row_match,
+)
+
+
+def columns(rows):
+    """[(Table, Source, Status, NOTE), ...] → {필드명: 컬럼}"""
+    return dict(zip(['Table', 'Source', 'Status', 'NOTE'], map(list, zip(*rows))))
+
+
+class TestFindColumnMismatches:
+    """컬럼 일괄 비교 테스트"""
+
+    def test_all_mismatches_in_order(self):
+        """행 순서 → 필드 순서로 모든 불일치 반환"""
+        en = columns([('T', 'S1', '기존', ''), ('T', 'S2', '기존', ''), ('T', 'S3', '기존', 'n')])
+        lang = columns([('T', 'S1', '기존', None), ('X', 'S2', '신규', ''), ('T', 'S3', '기존', 'm')])
+
+        mismatches = find_column_mismatches(['K1', 'K2', 'K3'], en, lang)
+
+        assert mismatches == [
+            (1, 'K2', 'Table', 'T', 'X'),
+            (1, 'K2', 'Status', '기존', '신규'),
+            (2, 'K3', 'NOTE', 'n', 'm'),
+        ]
+
+    def test_same_result_as_row_match(self):
+        """각 불일치는 validate_row_match의 첫 오류와 같은 메시지"""
+        en = columns([('T', 'S', '기존', None)])
+        lang = columns([('T', 'S', '완료', '비고')])
+
+        (_, key, field, en_value, lang_value), _ = find_column_mismatches(['K1'], en, lang)
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_row_match('K1', {f: v[0] for f, v in en.items()}, {f: v[0] for f, v in lang.items()}, 'JA')
+        assert str(exc_info.value) == validator.format_mismatch(key, field, en_value, lang_value, 'JA')
+
+
+class TestRaiseMismatchErrors:
+    """불일치 보고 테스트"""
+
+    def test_no_errors(self):
+        """오류가 없으면 통과"""
+        raise_mismatch_errors([])
+
+    def test_message_truncated(self, monkeypatch):
+        """메시지는 최대 건수까지 표시, 전체 목록은 params에 보관"""
+        monkeypatch.setattr(validator, 'MAX_REPORTED_MISMATCHES', 2)
+        errors = ['e1', 'e2', 'e3', 'e4']
+
+        with pytest.raises(ValidationError) as exc_info:
+            raise_mismatch_errors(errors)
+
+        assert str(exc_info.value).splitlines() == ['e1', 'e2', '... and 2 more mismatches']
+        assert exc_info.value.params['errors'] == errors
@@ -0,0 +1 @@
+"""M4/GL 기능 테스트 패키지"""
@@ -0,0 +1,156 @@
+"""M4/GL 테스트 공용 fixture"""
+
+import queue
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+
+# STRING 원본 파일별 (시작 행, 열 인덱스: String ID, NOTE, KO, EN, CT, CS, JA, TH, ES-LATAM, PT-BR, NPC 이름, 비고)
+STRING_SOURCES = {
+    "SEQUENCE_DIALOGUE.xlsm": (9, [7, None, 10, 11, 12, 13, 14, 15, 16, 17, None, None]),
+    "STRING_BUILTIN.xlsm": (4, [7, 21, 8, 9, 10, 11, 12, 13, 14, 15, None, None]),
+    "STRING_MAIL.xlsm": (4, [7, None, 8, 9, 10, 11, 12, 13, 14, 15, None, None]),
+    "STRING_MESSAGE.xlsm": (4, [7, 21, 8, 9, 10, 11, 12, 13, 14, 15, None, None]),
+    "STRING_NPC.xlsm": (4, [7, 20, 9, 10, 11, 12, 13, 14, 15, 16, 18, 19]),
+    "STRING_QUESTTEMPLATE.xlsm": (7, [7, 0, 12, 13, 14, 15, 16, 17, 18, 19, None, None]),
+    "STRING_TEMPLATE.xlsm": (4, [7, 19, 8, 9, 10, 11, 12, 13, 14, 15, None, 18]),
+    "STRING_TOOLTIP.xlsm": (4, [7, 8, 11, 12, 13, 14, 15, 16, 17, 18, None, None]),
+}
+STRING_FIELDS = ['String ID', 'NOTE', 'KO', 'EN', 'CT', 'CS', 'JA', 'TH', 'ES-LATAM', 'PT-BR', 'NPC 이름', '비고']
+
+# DIALOGUE 언어 열 인덱스 (CINEMATIC, SMALLTALK)
+DIALOGUE_LANGUAGES = {
+    'KO (M)': (11, 12), 'KO (F)': (12, 13), 'EN (M)': (13, 14), 'EN (F)': (14, 15),
+    'CT (M)': (15, 16), 'CT (F)': (16, 17), 'CS (M)': (17, 18), 'CS (F)': (18, 19),
+    'JA (M)': (19, 20), 'JA (F)': (20, 21), 'TH (M)': (21, 22), 'TH (F)': (22, 23),
+    'ES-LATAM (M)': (23, 24), 'ES-LATAM (F)': (24, 25), 'PT-BR (M)': (25, 26), 'PT-BR (F)': (26, 27),
+    'NOTE': (29, 30),
+}
+
+SOURCE_WIDTH = 40  # 사용하지 않는 열도 포함된 넓은 원본 시트
+
+
+def write_source(path, rows, skip_rows, header_row, sheet_name='DATA', sheet_index=1, width=SOURCE_WIDTH):
+    """
+    M4GL 원본 xlsm 파일 생성
+
+    시작 행(skip_rows) + 헤더 위 설명 행(header_row) 아래에 헤더와 데이터 행을 작성합니다.
+    사용하지 않는 열은 'etc' 값으로 채우고, width 밖의 값은 생략합니다.
+    """
+    wb = Workbook()
+    wb.active.title = "INFO"
+    wb.active.append(["설명"])
+    ws = wb.create_sheet(sheet_name, sheet_index)
+    for idx in range(skip_rows + header_row):
+        ws.append([f"설명 {idx}"] + [None] * (width - 1))
+    ws.append([f"COL{col}" for col in range(width)])
+    for values in rows:
+        row = ['etc'] * width
+        for col, value in values.items():
+            if col < width:
+                row[col] = value
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+def string_row(file, string_id, on=1, en=True):
+    """STRING 원본 행 ({열 인덱스: 값}), en=False면 EN 빈 셀, 문자열이면 해당 값"""
+    table = file.replace(".xlsm", "")
+    columns = STRING_SOURCES[file][1]
+    values = {6: on}
+    for field, col in zip(STRING_FIELDS, columns):
+        if col is not None:
+            values[col] = string_id if field == 'String ID' else f"{table} {field} {string_id}"
+    if en is not True:
+        values[columns[3]] = en if en else None
+    return values
+
+
+@pytest.fixture
+def string_folder(tmp_path):
+    """8개 STRING 원본 파일 (ID 1, 5만 출력 대상)"""
+    folder = tmp_path / "string"
+    folder.mkdir()
+    for file, (skip_rows, _) in STRING_SOURCES.items():
+        rows = [
+            string_row(file, 1),
+            string_row(file, 2, on=0),
+            string_row(file, 3, en='미사용'),
+            string_row(file, 4, en=False),
+            string_row(file, 5),
+        ]
+        write_source(folder / file, rows, skip_rows, header_row=2)
+    return folder
+
+
+def dialogue_row(table, string_id, npc_id, on=1, en=True):
+    """DIALOGUE 원본 행 ({열 인덱스: 값})"""
+    side = 0 if table == 'CINEMATIC_DIALOGUE' else 1
+    values = {6: on, 7: string_id, 8: npc_id}
+    for field, cols in DIALOGUE_LANGUAGES.items():
+        values[cols[side]] = f"{table} {field} {string_id}"
+    if not en:
+        values[DIALOGUE_LANGUAGES['EN (M)'][side]] = None
+    return values
+
+
+@pytest.fixture
+def dialogue_folder(tmp_path):
+    """CINEMATIC/SMALLTALK/NPC 원본 파일"""
+    folder = tmp_path / "dialogue"
+    folder.mkdir()
+    write_source(
+        folder / "CINEMATIC_DIALOGUE.xlsm",
+        [
+            dialogue_row('CINEMATIC_DIALOGUE', 10, 'NPC_A'),
+            dialogue_row('CINEMATIC_DIALOGUE', 11, 'NPC_B', on=0),
+            dialogue_row('CINEMATIC_DIALOGUE', 12, 'NPC_X'),
+        ],
+        skip_rows=9, header_row=1,
+    )
+    write_source(
+        folder / "SMALLTALK_DIALOGUE.xlsm",
+        [
+            dialogue_row('SMALLTALK_DIALOGUE', 20, 'NPC_B'),
+            dialogue_row('SMALLTALK_DIALOGUE', 21, 'NPC_A', en=False),
+        ],
+        skip_rows=4, header_row=1,
+    )
+    write_source(
+        folder / "NPC.xlsm",
+        [
+            {7: 'NPC_A', 9: '아린'},
+            {7: 'NPC_B', 9: '부엉'},
+            {7: 'NPC_A', 9: '중복'},
+        ],
+        skip_rows=0, header_row=1, sheet_name='NPC', sheet_index=2,
+    )
+    return folder
+
+
+def run_merge(merge_function, folder, output_dir, monkeypatch):
+    """
+    병합 실행 후 (출력 파일 경로, 진행 메시지 목록) 반환
+
+    출력 파일은 현재 폴더에 저장되므로 output_dir로 이동해서 실행합니다.
+    """
+    monkeypatch.chdir(output_dir)
+    progress_queue = queue.Queue()
+    merge_function(str(folder), progress_queue)
+
+    messages = []
+    while not progress_queue.empty():
+        messages.append(progress_queue.get_nowait())
+
+    errors = [msg for msg in messages if isinstance(msg, tuple) and msg[0] == "error"]
+    assert not errors
+    outputs = list(output_dir.glob("*_MIR4_MASTER_*.xlsx"))
+    assert len(outputs) == 1
+    return outputs[0], messages
+
+
+def read_output(path):
+    """출력 시트 값 (행 목록)"""
+    return [list(row) for row in load_workbook(path).active.iter_rows(values_only=True)]
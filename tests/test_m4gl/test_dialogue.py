@@ -0,0 +1,70 @@
+"""M4/GL DIALOGUE 병합 테스트"""
+
+import queue
+
+import pytest
+from sebastian.core.m4gl import merge_dialogue
+from .conftest import DIALOGUE_LANGUAGES, dialogue_row, write_source, run_merge, read_output
+
+
+def expected_dialogue_row(number, table, string_id, npc_id, speaker):
+    return [number, table, string_id, f"{table}/{string_id}", npc_id, speaker] + [
+        f"{table} {field} {string_id}" for field in DIALOGUE_LANGUAGES
+    ]
+
+
+class TestMergeDialogue:
+    """DIALOGUE 병합 테스트"""
+
+    @pytest.mark.parametrize('max_workers', [1, 3])
+    def test_output_rows(self, tmp_path, dialogue_folder, monkeypatch, max_workers):
+        """CINEMATIC → SMALLTALK 순서, OnOFF/EN 필터, NPC 이름은 첫 번째 값으로 매핑"""
+        output, messages = run_merge(
+            lambda folder, q: merge_dialogue(folder, q, max_workers=max_workers),
+            dialogue_folder, tmp_path, monkeypatch,
+        )
+
+        rows = read_output(output)
+        assert rows[0][:6] == ['#', 'Table Name', 'String ID', 'Table/ID', 'NPC ID', 'Speaker Name']
+        assert rows[0][6:] == list(DIALOGUE_LANGUAGES)
+        assert rows[1:] == [
+            expected_dialogue_row(1, 'CINEMATIC_DIALOGUE', 10, 'NPC_A', '아린'),
+            expected_dialogue_row(2, 'CINEMATIC_DIALOGUE', 12, 'NPC_X', 'NPC_X'),
+            expected_dialogue_row(3, 'SMALLTALK_DIALOGUE', 20, 'NPC_B', '부엉'),
+        ]
+        assert [msg for msg in messages if isinstance(msg, str) and msg.startswith(("단계:", "파일:", "처리된 파일:"))] == [
+            "단계:1/3", "파일:CINEMATIC_DIALOGUE.xlsm", "처리된 파일:1",
+            "파일:SMALLTALK_DIALOGUE.xlsm", "처리된 파일:2",
+            "단계:2/3", "파일:데이터 병합 중...",
+            "단계:3/3", "파일:NPC.xlsm", "처리된 파일:3",
+            "파일:결과 파일 저장 중...",
+        ]
+
+    def test_missing_language_column_left_empty(self, tmp_path, dialogue_folder, monkeypatch):
+        """원본 시트에 없는 언어 열은 빈 셀"""
+        write_source(
+            dialogue_folder / "SMALLTALK_DIALOGUE.xlsm",
+            [dialogue_row('SMALLTALK_DIALOGUE', 20, 'NPC_B')],
+            skip_rows=4, header_row=1, width=30,  # NOTE 열(인덱스 30) 없음
+        )
+
+        output, _ = run_merge(merge_dialogue, dialogue_folder, tmp_path, monkeypatch)
+
+        rows = read_output(output)
+        assert [row[1] for row in rows[1:]] == ['CINEMATIC_DIALOGUE', 'CINEMATIC_DIALOGUE', 'SMALLTALK_DIALOGUE']
+        assert [row[-1] for row in rows[1:]] == [None, None, None]
+        assert rows[3][-2] == 'SMALLTALK_DIALOGUE PT-BR (F) 20'
+
+    def test_npc_read_error(self, tmp_path, dialogue_folder, monkeypatch):
+        """작업 프로세스의 NPC 읽기 오류는 3단계에서 오류 메시지로 전달"""
+        (dialogue_folder / "NPC.xlsm").write_bytes(b'not an xlsm file')
+        monkeypatch.chdir(tmp_path)
+        progress_queue = queue.Queue()
+
+        merge_dialogue(str(dialogue_folder), progress_queue, max_workers=3)
+
+        messages = list(progress_queue.queue)
+        assert messages[-1][0] == "error"
+        assert "처리된 파일:2" in messages
+        assert "처리된 파일:3" not in messages
+        assert not list(tmp_path.glob("*.xlsx"))
@@ -0,0 +1,32 @@
+"""M4/GL 원본 열 선택 읽기 테스트"""
+
+import pandas as pd
+from sebastian.core.m4gl.reader import read_excel_columns
+from .conftest import write_source
+
+
+class TestReadExcelColumns:
+    """필요한 열만 읽기 테스트"""
+
+    def test_same_values_as_full_read(self, tmp_path):
+        """선택한 열은 전체 읽기 결과와 같고 열 이름은 원본 열 인덱스"""
+        path = write_source(
+            tmp_path / "SOURCE.xlsm",
+            [{6: 1, 7: 100, 9: '값'}, {6: 0, 7: 101.5, 30: '선택 열 밖의 값'}, {6: 1, 7: None}],
+            skip_rows=4, header_row=2,
+        )
+
+        data = read_excel_columns(path, 1, 2, 4, [7, None, 9, 6, 7])
+
+        full = pd.read_excel(path, sheet_name=1, header=2, skiprows=4)
+        expected = full.iloc[:, [6, 7, 9]].set_axis([6, 7, 9], axis=1)
+        pd.testing.assert_frame_equal(data, expected)
+
+    def test_missing_columns_excluded(self, tmp_path):
+        """시트에 없는 열 인덱스는 결과에서 제외"""
+        path = write_source(tmp_path / "NARROW.xlsm", [{6: 1, 7: 100}], skip_rows=0, header_row=1, width=10)
+
+        data = read_excel_columns(path, 1, 1, None, [6, 7, 29, 30])
+
+        assert list(data.columns) == [6, 7]
+        assert data[7].tolist() == [100]
@@ -0,0 +1,100 @@
+"""M4/GL STRING 병합 테스트"""
+
+import queue
+import stat
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+from sebastian.core.m4gl import merge_string
+from sebastian.core.m4gl.string import STRING_HEADERS, build_string_table
+from .conftest import STRING_SOURCES, STRING_FIELDS, run_merge, read_output
+
+
+def expected_string_rows():
+    """파일 순서대로 ID 1, 5 행 (없는 열은 빈 셀)"""
+    rows = []
+    for file, (_, columns) in STRING_SOURCES.items():
+        table = file.replace(".xlsm", "")
+        for string_id in [1, 5]:
+            values = [
+                f"{table} {field} {string_id}" if col is not None else None
+                for field, col in zip(STRING_FIELDS[1:], columns[1:])
+            ]
+            rows.append([len(rows) + 1, table, string_id, f"{table}/{string_id}"] + values)
+    return rows
+
+
+class TestMergeString:
+    """STRING 병합 테스트"""
+
+    @pytest.mark.parametrize('max_workers', [1, 3])
+    def test_output_rows_in_table_order(self, tmp_path, string_folder, monkeypatch, max_workers):
+        """병렬 읽기 여부와 관계없이 고정된 테이블 순서로 병합 (OnOFF/EN 필터 적용)"""
+        output, _ = run_merge(
+            lambda folder, q: merge_string(folder, q, max_workers=max_workers),
+            string_folder, tmp_path, monkeypatch,
+        )
+
+        rows = read_output(output)
+        assert rows[0] == ['#', 'Table Name', 'String ID', 'Table/ID'] + STRING_FIELDS[1:]
+        assert rows[1:] == expected_string_rows()
+
+    def test_output_read_only(self, tmp_path, string_folder, monkeypatch):
+        """서식이 지정된 결과 파일 1개를 읽기 전용으로 저장"""
+        output, _ = run_merge(merge_string, string_folder, tmp_path, monkeypatch)
+
+        assert stat.S_IMODE(output.stat().st_mode) == stat.S_IREAD
+        ws = load_workbook(output).active
+        assert ws.freeze_panes == 'A2'
+        assert ws['A1'].font.b and ws['O17'].border.bottom.style == 'thin'
+
+    def test_progress_messages_in_file_order(self, tmp_path, string_folder, monkeypatch):
+        """파일/처리된 파일 메시지는 파일 순서대로 전송"""
+        _, messages = run_merge(merge_string, string_folder, tmp_path, monkeypatch)
+
+        text = [msg for msg in messages if isinstance(msg, str)]
+        files = [msg for msg in text if msg.startswith("파일:") and msg.endswith(".xlsm")]
+        assert files == [f"파일:{file}" for file in STRING_SOURCES]
+        assert [msg for msg in text if msg.startswith("처리된 파일:")] == [
+            f"처리된 파일:{idx}" for idx in range(1, 9)
+        ]
+        assert text.index("단계:1/2") < text.index(files[0])
+        assert text.index("처리된 파일:8") < text.index("단계:2/2")
+        assert messages[-2] == 100
+
+    def test_missing_file(self, tmp_path, string_folder, monkeypatch):
+        """파일이 없으면 읽기 전에 오류 메시지"""
+        (string_folder / "STRING_MAIL.xlsm").unlink()
+        monkeypatch.chdir(tmp_path)
+        progress_queue = queue.Queue()
+
+        merge_string(str(string_folder), progress_queue)
+
+        messages = list(progress_queue.queue)
+        assert messages[-1][0] == "error"
+        assert "STRING_MAIL.xlsm" in messages[-1][1]
+        assert not [msg for msg in messages if isinstance(msg, str) and msg.startswith("처리된 파일:")]
+        assert not list(tmp_path.glob("*.xlsx"))
+
+
+class TestBuildStringTable:
+    """결과 테이블 일괄 생성 테스트"""
+
+    def test_numbering_and_table_id(self):
+        """결합 후 EN 필터, #/Table/ID를 한 번에 생성 (없는 열은 빈 문자열)"""
+        tables = [
+            ('STRING_MAIL', pd.DataFrame({'String ID': [3.0, 4.0], 'EN': ['en 3', '미사용']})),
+            ('STRING_EMPTY', pd.DataFrame({'String ID': [], 'EN': []})),
+            ('STRING_NPC', pd.DataFrame({'String ID': [7, None], 'EN': ['en 7', 'en ?'], 'NOTE': ['n 7', None]})),
+        ]
+
+        result_df = build_string_table(tables)
+
+        assert list(result_df.columns) == STRING_HEADERS
+        assert result_df['#'].tolist() == [1, 2, 3]
+        assert result_df['Table Name'].tolist() == ['STRING_MAIL', 'STRING_NPC', 'STRING_NPC']
+        assert result_df['String ID'].tolist() == [3, 7, 0]
+        assert result_df['Table/ID'].tolist() == ['STRING_MAIL/3', 'STRING_NPC/7', 'STRING_NPC/0']
+        assert result_df['NOTE'].tolist()[:2] == ['', 'n 7']
+        assert result_df['KO'].tolist() == ['', '', '']
@@ -0,0 +1,54 @@
+"""M4/GL 결과 파일 저장 테스트"""
+
+import datetime
+
+import pandas as pd
+from openpyxl import load_workbook
+from sebastian.core.m4gl.writer import write_master_file
+
+
+class TestWriteMasterFile:
+    """서식 포함 1회 저장 테스트"""
+
+    def test_values(self, tmp_path):
+        """숫자/문자열/날짜 값 유지, 빈 값은 빈 셀, 문자열은 수식으로 바꾸지 않음"""
+        result_df = pd.DataFrame({
+            '#': [1, 2],
+            'String ID': [100, 200],
+            'NOTE': ['', None],
+            'EN': ['=SUM(A1)', 'https://example.com'],
+            'Date': [pd.Timestamp('2025-01-02 03:04:05'), float('nan')],
+        })
+        output = tmp_path / "0101_MIR4_MASTER_STRING.xlsx"
+
+        write_master_file(str(output), result_df)
+
+        ws = load_workbook(output).active
+        assert ws.title == 'Sheet1'
+        assert [list(row) for row in ws.iter_rows(values_only=True)] == [
+            ['#', 'String ID', 'NOTE', 'EN', 'Date'],
+            [1, 100, None, '=SUM(A1)', datetime.datetime(2025, 1, 2, 3, 4, 5)],
+            [2, 200, None, 'https://example.com', None],
+        ]
+        assert ws['D2'].data_type == 's'
+        assert ws['D3'].hyperlink is None
+        assert ws['E2'].number_format == 'YYYY-MM-DD HH:MM:SS'
+
+    def test_format(self, tmp_path):
+        """헤더/데이터 서식, 빈 셀 테두리, A2 틀 고정"""
+        result_df = pd.DataFrame({'#': [1], 'NOTE': [None]})
+        output = tmp_path / "0101_MIR4_MASTER_DIALOGUE.xlsx"
+
+        write_master_file(str(output), result_df)
+
+        ws = load_workbook(output).active
+        header = ws['A1']
+        assert (header.font.name, header.font.sz, header.font.b) == ('맑은 고딕', 12, True)
+        assert header.font.color.rgb.endswith('9C5700')
+        assert header.fill.fill_type == 'solid'
+        assert header.fill.fgColor.rgb.endswith('FFEB9C')
+        for cell in [ws['A2'], ws['B2']]:
+            assert (cell.font.name, cell.font.sz, cell.font.b) == ('맑은 고딕', 10, False)
+            assert [cell.border.left.style, cell.border.right.style,
+                    cell.border.top.style, cell.border.bottom.style] == ['thin'] * 4
+        assert ws.freeze_panes == 'A2'
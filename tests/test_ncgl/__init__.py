@@ -0,0 +1 @@
+"""NC/GL 기능 테스트 패키지"""
@@ -0,0 +1,42 @@
+"""NC/GL StringALL 저장 테스트"""
+
+import pandas as pd
+from openpyxl import load_workbook
+from sebastian.core.ncgl.merger import write_string_all
+
+
+class TestWriteStringAll:
+    """StringALL 스트리밍 저장 테스트"""
+
+    def test_values_written_as_text_in_row_order(self, tmp_path):
+        """모든 셀이 행 순서대로 텍스트로 저장됨"""
+        result_df = pd.DataFrame({
+            'Key': ['K1', 'K2', 'K3'],
+            'Source': ['원문1', 'None', '=SUM(A1)'],
+            'Target_EN': [1.5, 'Text', ''],
+        })
+        output_path = tmp_path / "StringALL.xlsx"
+
+        write_string_all(str(output_path), result_df)
+
+        ws = load_workbook(output_path).active
+        rows = [list(row) for row in ws.iter_rows(values_only=True)]
+        assert rows[0] == ['Key', 'Source', 'Target_EN']
+        assert rows[1] == ['K1', '원문1', '1.5']
+        assert rows[2] == ['K2', 'None', 'Text']
+        # 수식처럼 보이는 값도 문자열로 유지
+        assert rows[3][:2] == ['K3', '=SUM(A1)']
+
+    def test_header_and_cell_format(self, tmp_path):
+        """헤더/데이터 서식 유지"""
+        result_df = pd.DataFrame({'Key': ['K1'], 'Source': ['S1']})
+        output_path = tmp_path / "StringALL.xlsx"
+
+        write_string_all(str(output_path), result_df)
+
+        ws = load_workbook(output_path).active
+        assert ws['A1'].font.b
+        assert ws['A1'].alignment.horizontal == 'center'
+        assert ws['A2'].number_format == '@'
+        assert ws['A2'].font.name == '맑은 고딕'
+        assert ws.column_dimensions['A'].width > 23